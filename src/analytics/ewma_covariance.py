@@ -0,0 +1,197 @@
+"""
+Streaming EWMA Covariance
+
+Exponentially weighted (RiskMetrics-style, zero-mean) covariance and
+correlation state for a ticker universe, persisted between runs:
+1. The first run folds in the full history once (O(T * N^2))
+2. Later runs fold in only the days dated after the last processed day, each
+   costing O(N^2), so dashboard refreshes never recompute a year of history
+3. The state is shared through the local state store, so every worker process
+   (and every analysis: correlation, Monte Carlo, stress test) reads the same
+   snapshot
+
+Missing observations are handled with a pairwise weight matrix: the raw
+cross-product sum S and the weight sum W decay together, and the estimate is
+S / W. This also removes the start-up bias of a short history.
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils import state_store
+
+logger = logging.getLogger(__name__)
+
+# RiskMetrics daily decay
+DEFAULT_DECAY = 0.94
+
+
+class EwmaCovariance:
+    """
+    Persisted EWMA covariance / correlation for a fixed ticker universe.
+
+    Attributes:
+        tickers (list): Universe in the order used for snapshots
+        decay (float): EWMA decay factor lambda
+        last_date (str | None): Last folded-in trading day
+        updated_on (str | None): Calendar day of the last update (YYYY-MM-DD)
+        n_observations (int): Days folded in since the state was created
+        rows_added (int): Days folded in by the most recent ``update``
+    """
+
+    STATE_NAMESPACE = "ewma_cov"
+
+    def __init__(self, tickers: List[str], decay: float = DEFAULT_DECAY, persist: bool = True):
+        if not 0 < decay < 1:
+            raise ValueError(f"EWMA decay must be in (0, 1), got {decay}")
+        self.tickers = list(tickers)
+        self.decay = float(decay)
+        self.persist = persist
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        # Keyed by the sorted universe so ticker order does not split the state
+        universe = "|".join(sorted(self.tickers))
+        digest = hashlib.sha1(f"{universe}|{self.decay}".encode("utf-8")).hexdigest()[:16]
+        self.state_key = f"universe_{digest}"
+        self._order = np.argsort(self.tickers, kind="stable")
+
+        self._sum: Optional[np.ndarray] = None
+        self._weight: Optional[np.ndarray] = None
+        self.last_date: Optional[str] = None
+        self.updated_on: Optional[str] = None
+        self.n_observations = 0
+        self.rows_added = 0
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def load(self) -> bool:
+        """
+        Restore the persisted state for this universe.
+
+        Returns:
+            bool: True if a usable state was found
+        """
+        if self._sum is not None:
+            return True
+        if not self.persist:
+            return False
+        state = state_store.load_arrays(self.STATE_NAMESPACE, self.state_key)
+        if state is None or list(state["tickers"]) != sorted(self.tickers):
+            return False
+
+        # Stored in sorted order; map back to the caller's ticker order
+        inverse = np.argsort(self._order)
+        self._sum = state["sum"][np.ix_(inverse, inverse)]
+        self._weight = state["weight"][np.ix_(inverse, inverse)]
+        self.last_date = str(state["last_date"])
+        self.updated_on = str(state["updated_on"])
+        self.n_observations = int(state["n_observations"])
+        return True
+
+    def is_current(self) -> bool:
+        """True if the state was already updated today (no new daily close to fold in)."""
+        return self.load() and self.updated_on == datetime.now().strftime("%Y-%m-%d")
+
+    def update(self, returns: pd.DataFrame) -> "EwmaCovariance":
+        """
+        Fold in the days of ``returns`` dated after the last processed day.
+
+        If the state is missing, or ``returns`` starts after the last processed
+        day (a gap that cannot be bridged), the state is rebuilt from
+        ``returns``.
+
+        Args:
+            returns (pd.DataFrame): Date-indexed daily returns containing ``tickers``
+
+        Returns:
+            EwmaCovariance: self, for chaining
+        """
+        returns = returns.reindex(columns=self.tickers)
+        dates = returns.index.astype(str)
+
+        if not self.load() or (len(dates) and dates[0] > self.last_date):
+            self._sum = np.zeros((len(self.tickers), len(self.tickers)))
+            self._weight = np.zeros_like(self._sum)
+            self.n_observations = 0
+            new_rows = returns
+        else:
+            new_rows = returns[dates > self.last_date]
+
+        self.rows_added = len(new_rows)
+        if self.rows_added:
+            self._fold(new_rows.values.astype(float))
+            self.last_date = dates[-1]
+            self.n_observations += self.rows_added
+        today = datetime.now().strftime("%Y-%m-%d")
+        if self.rows_added or self.updated_on != today:
+            self.updated_on = today
+            self._save()
+        return self
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def covariance(self) -> pd.DataFrame:
+        """Current EWMA covariance matrix (daily units)."""
+        if not self.load():
+            raise ValueError("EWMA covariance state is empty; call update() first")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = np.where(self._weight > 0, self._sum / self._weight, np.nan)
+        return pd.DataFrame(cov, index=self.tickers, columns=self.tickers)
+
+    def volatility(self) -> pd.Series:
+        """Current EWMA daily volatility per ticker."""
+        cov = self.covariance()
+        return pd.Series(np.sqrt(np.clip(np.diag(cov.values), 0.0, None)), index=self.tickers)
+
+    def correlation(self) -> pd.DataFrame:
+        """Current EWMA correlation matrix."""
+        cov = self.covariance().values
+        vol = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.clip(cov / np.outer(vol, vol), -1.0, 1.0)
+        np.fill_diagonal(corr, 1.0)
+        return pd.DataFrame(corr, index=self.tickers, columns=self.tickers)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _fold(self, values: np.ndarray) -> None:
+        """Decay the state by lambda^k and add k days as one weighted product."""
+        k = len(values)
+        mask = ~np.isnan(values)
+        filled = np.where(mask, values, 0.0)
+        # Day t (0-based, oldest first) carries (1 - lambda) * lambda^(k - 1 - t)
+        w = (1.0 - self.decay) * self.decay ** np.arange(k - 1, -1, -1)
+        decay_k = self.decay**k
+
+        self._sum *= decay_k
+        self._sum += (filled * w[:, None]).T @ filled
+        m = mask.astype(float)
+        self._weight *= decay_k
+        self._weight += (m * w[:, None]).T @ m
+
+    def _save(self) -> None:
+        """Persist the state in sorted-ticker order (no-op when persistence is disabled)."""
+        if not self.persist:
+            return
+        order = self._order
+        state_store.save_arrays(
+            self.STATE_NAMESPACE,
+            self.state_key,
+            tickers=np.array(sorted(self.tickers)),
+            sum=self._sum[np.ix_(order, order)],
+            weight=self._weight[np.ix_(order, order)],
+            last_date=np.array(self.last_date or ""),
+            updated_on=np.array(self.updated_on),
+            n_observations=np.array(self.n_observations),
+        )
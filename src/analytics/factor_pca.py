@@ -0,0 +1,190 @@
+"""
+Large-Universe PCA
+
+Principal component estimators that scale to index-sized ticker universes:
+1. Randomized SVD (Halko et al.) for the top-k components only, instead of a
+   full decomposition of the (n_days, n_tickers) matrix
+2. IncrementalPCA whose state is persisted, so components are updated with the
+   days that arrived since the last run instead of being refit from scratch
+
+Both return fitted sklearn estimators exposing ``components_``,
+``explained_variance_`` and ``explained_variance_ratio_``, so callers use them
+exactly like ``sklearn.decomposition.PCA``.
+"""
+
+import hashlib
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.preprocessing import StandardScaler
+
+from src.utils import state_store
+
+logger = logging.getLogger(__name__)
+
+# Above this many tickers, 'auto' switches from a full to a randomized decomposition
+LARGE_UNIVERSE_THRESHOLD = 50
+# Default number of components kept in large-universe mode
+DEFAULT_LARGE_UNIVERSE_COMPONENTS = 10
+
+_IPCA_ARRAYS = (
+    "components_",
+    "explained_variance_",
+    "explained_variance_ratio_",
+    "singular_values_",
+    "mean_",
+    "var_",
+)
+
+
+def resolve_pca_method(method: str, n_features: int) -> str:
+    """Map 'auto' to 'full' or 'randomized' by universe size and validate the name."""
+    method = (method or "auto").lower()
+    if method == "auto":
+        return "randomized" if n_features > LARGE_UNIVERSE_THRESHOLD else "full"
+    if method not in ("full", "randomized", "incremental"):
+        raise ValueError(
+            f"Unknown PCA method '{method}'. "
+            f"Supported values: ['auto', 'full', 'incremental', 'randomized']"
+        )
+    return method
+
+
+def fit_pca(X: np.ndarray, n_components: int, method: str = "full") -> PCA:
+    """
+    Fit PCA with a full or randomized solver.
+
+    Args:
+        X (np.ndarray): (n_samples, n_features) data (standardized by the caller)
+        n_components (int): Number of components to compute
+        method (str): 'full' (exact, all requested components) or 'randomized'
+            (top-k only, O(n_samples * n_features * k))
+
+    Returns:
+        PCA: Fitted estimator
+    """
+    if method == "randomized":
+        # Randomized SVD needs k strictly below min(n_samples, n_features)
+        n_components = max(1, min(n_components, min(X.shape) - 1))
+        pca = PCA(n_components=n_components, svd_solver="randomized", random_state=0)
+    else:
+        pca = PCA(n_components=n_components)
+    return pca.fit(X)
+
+
+class IncrementalFactorModel:
+    """
+    Persisted IncrementalPCA over a fixed ticker universe.
+
+    The first ``update`` standardizes the returns matrix and fits an
+    IncrementalPCA in memory-bounded batches. Later calls only ``partial_fit``
+    the rows dated after the last processed day, using the scaling frozen at
+    the initial fit, so daily runs cost O(new_days * n_tickers * k). A change
+    in the universe or in ``n_components`` triggers a fresh fit.
+    """
+
+    STATE_NAMESPACE = "pca"
+
+    def __init__(self, tickers: List[str], n_components: int, persist: bool = True):
+        self.tickers = list(tickers)
+        self.n_components = int(n_components)
+        self.persist = persist
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        digest = hashlib.sha1("|".join(self.tickers).encode("utf-8")).hexdigest()[:16]
+        self.state_key = f"universe_{digest}"
+
+        self.pca: Optional[IncrementalPCA] = None
+        self.scaler: Optional[StandardScaler] = None
+        self.last_date: Optional[str] = None
+        self.rows_added = 0
+
+    def update(self, returns: pd.DataFrame) -> Tuple[IncrementalPCA, StandardScaler]:
+        """
+        Bring the components up to date with ``returns``.
+
+        Args:
+            returns (pd.DataFrame): Date-indexed returns with exactly ``tickers`` as columns
+
+        Returns:
+            tuple: (fitted IncrementalPCA, StandardScaler used for the inputs)
+        """
+        returns = returns[self.tickers].dropna()
+        if not self._load():
+            return self._initial_fit(returns)
+
+        new_rows = returns[returns.index.astype(str) > self.last_date]
+        self.rows_added = len(new_rows)
+        if self.rows_added:
+            self.pca.partial_fit(self.scaler.transform(new_rows.values))
+            self.last_date = str(new_rows.index[-1])
+            self._save()
+        return self.pca, self.scaler
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _initial_fit(self, returns: pd.DataFrame) -> Tuple[IncrementalPCA, StandardScaler]:
+        """Fit the scaler and the IncrementalPCA on the full matrix."""
+        self.scaler = StandardScaler().fit(returns.values)
+        X = self.scaler.transform(returns.values)
+        n_components = min(self.n_components, *X.shape)
+        self.pca = IncrementalPCA(n_components=n_components, batch_size=max(5 * X.shape[1], n_components))
+        self.pca.fit(X)
+        self.last_date = str(returns.index[-1])
+        self.rows_added = len(returns)
+        self._save()
+        return self.pca, self.scaler
+
+    def _load(self) -> bool:
+        """Restore persisted state for this universe; False if there is none usable."""
+        if not self.persist:
+            return self.pca is not None
+        state = state_store.load_arrays(self.STATE_NAMESPACE, self.state_key)
+        if state is None:
+            return False
+        if list(state["tickers"]) != self.tickers or int(state["n_components"]) != min(
+            self.n_components, state["components_"].shape[1]
+        ):
+            return False
+
+        pca = IncrementalPCA(n_components=int(state["n_components"]))
+        for name in _IPCA_ARRAYS:
+            setattr(pca, name, state[name])
+        pca.n_components_ = int(state["n_components"])
+        pca.n_samples_seen_ = int(state["n_samples_seen"])
+        pca.noise_variance_ = float(state["noise_variance"])
+        pca.n_features_in_ = len(self.tickers)
+        pca.batch_size_ = int(state["batch_size"])
+
+        scaler = StandardScaler()
+        scaler.mean_, scaler.scale_ = state["scaler_mean"], state["scaler_scale"]
+        scaler.var_ = scaler.scale_**2
+        scaler.n_features_in_ = len(self.tickers)
+        scaler.n_samples_seen_ = int(state["n_samples_seen"])
+
+        self.pca, self.scaler = pca, scaler
+        self.last_date = str(state["last_date"])
+        return True
+
+    def _save(self) -> None:
+        """Persist the estimator state (no-op when persistence is disabled)."""
+        if not self.persist:
+            return
+        state_store.save_arrays(
+            self.STATE_NAMESPACE,
+            self.state_key,
+            tickers=np.array(self.tickers),
+            n_components=np.array(self.pca.n_components_),
+            n_samples_seen=np.array(self.pca.n_samples_seen_),
+            noise_variance=np.array(self.pca.noise_variance_),
+            batch_size=np.array(self.pca.batch_size_),
+            scaler_mean=self.scaler.mean_,
+            scaler_scale=self.scaler.scale_,
+            last_date=np.array(self.last_date),
+            **{name: getattr(self.pca, name) for name in _IPCA_ARRAYS},
+        )
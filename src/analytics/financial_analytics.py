@@ -11,13 +11,47 @@ Provides advanced analytics capabilities including:
 import numpy as np
 import pandas as pd
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional  # noqa: F401
+from cachetools import TTLCache
+from scipy.signal import lfilter
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from sklearn.linear_model import LinearRegression
 import yfinance as yf
 
+from .factor_pca import (
+    DEFAULT_LARGE_UNIVERSE_COMPONENTS,
+    IncrementalFactorModel,
+    fit_pca,
+    resolve_pca_method,
+)
+from ..utils.exchange_utils import get_exchange_info
+from ..utils.metric_index import MetricIndex, parse_numeric
+from .ewma_covariance import DEFAULT_DECAY, EwmaCovariance
+from .garch_volatility import GarchForecaster
+from .risk_statistics import tail_statistics
+from .rolling_statistics import (
+    rolling_beta_correlation,
+    rolling_historical_var,
+    rolling_mean_std,
+    rolling_sharpe_sortino,
+)
+from .scenario_engine import ScenarioEngine
+from .stage_graph import STAGE_BUDGETS, StageGraph
+
+# ---------------------------------------------------------------------------
+# Returns cache — correlation, regression, MC, stress test and PCA in one
+# scrape request all ask for the same matrix; 15-minute TTL, per process
+# ---------------------------------------------------------------------------
+_RETURNS_CACHE_LOCK = threading.Lock()
+_returns_cache: TTLCache = TTLCache(maxsize=64, ttl=900)
+
+
+def clear_returns_cache() -> None:
+    """Clear the historical returns cache. Intended for testing."""
+    with _RETURNS_CACHE_LOCK:
+        _returns_cache.clear()
+
 
 class FinancialAnalytics:
     """
@@ -115,6 +149,17 @@ class FinancialAnalytics:
         Returns:
             pd.DataFrame: DataFrame with returns for each ticker
         """
+        cache_key = (
+            tuple(tickers),
+            int(days),
+            return_type,
+            datetime.now().strftime("%Y-%m-%d"),
+        )
+        with _RETURNS_CACHE_LOCK:
+            if cache_key in _returns_cache:
+                self.logger.debug(f"Returns cache hit for {len(tickers)} tickers")
+                return _returns_cache[cache_key].copy()
+
         try:
             end_date = datetime.now()
             start_date = end_date - timedelta(
@@ -197,12 +242,22 @@ class FinancialAnalytics:
             self.logger.info(
                 f"Successfully fetched {len(returns)} days of returns for {len(returns.columns)} tickers"
             )
-            return returns
+            with _RETURNS_CACHE_LOCK:
+                _returns_cache[cache_key] = returns
+            return returns.copy()
 
         except Exception as e:
             self.logger.error(f"Error fetching historical returns: {str(e)}")
             return pd.DataFrame()
 
+    def _select_returns(
+        self, tickers: List[str], days: int, returns: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """Returns for ``tickers``: columns of a pre-fetched matrix, else fetched (cached)."""
+        if returns is None:
+            return self.get_historical_returns(tickers, days=days)
+        return returns[[t for t in tickers if t in returns.columns]]
+
     def linear_regression_analysis(
         self, tickers: List[str], benchmark: str = "^GSPC", days: int = 252
     ) -> Dict:
@@ -236,77 +291,54 @@ class FinancialAnalytics:
             if benchmark not in returns.columns:
                 return {"error": f"Benchmark {benchmark} not found in returns"}
 
-            results = {}
-            benchmark_returns = returns[benchmark].values.reshape(-1, 1)
-
+            found = [t for t in tickers if t in returns.columns]
             for ticker in tickers:
-                if ticker not in returns.columns:
+                if ticker not in found:
                     self.logger.warning(f"Ticker {ticker} not found in returns")
-                    continue
 
-                try:
-                    # Prepare data
-                    ticker_returns = returns[ticker].values.reshape(-1, 1)
-
-                    # Fit linear regression: Y = alpha + beta * X
-                    # Where Y = stock returns, X = benchmark returns
-                    model = LinearRegression()
-                    model.fit(benchmark_returns, ticker_returns)
-
-                    # Get predictions
-                    predictions = model.predict(benchmark_returns)
-
-                    # Calculate statistics
-                    beta = float(model.coef_[0][0])
-                    alpha = float(model.intercept_[0])
-
-                    # R-squared
-                    ss_res = np.sum((ticker_returns - predictions) ** 2)
-                    ss_tot = np.sum((ticker_returns - np.mean(ticker_returns)) ** 2)
-                    r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-
-                    # Calculate residuals statistics
-                    residuals = ticker_returns - predictions
-                    residual_std = float(np.std(residuals))
-
-                    # Calculate correlation
-                    correlation = float(
-                        np.corrcoef(
-                            benchmark_returns.flatten(), ticker_returns.flatten()
-                        )[0, 1]
-                    )
+            # One closed-form OLS pass for every ticker: Y = alpha + beta * X
+            # Where Y = stock returns, X = benchmark returns
+            stats = self._regression_statistics(
+                returns[benchmark].values, returns[found].values
+            )
 
-                    # Annualize alpha (daily to annual)
-                    annualized_alpha = alpha * 252
-
-                    # Information ratio (excess return over benchmark relative to tracking error)
-                    excess_returns = ticker_returns.flatten() - predictions.flatten()
-                    tracking_error = np.std(excess_returns) * np.sqrt(252)
-                    mean_excess_return = np.mean(excess_returns) * 252
-                    information_ratio = (
-                        mean_excess_return / tracking_error
-                        if tracking_error != 0
-                        else 0
-                    )
+            results = {}
+            for j, ticker in enumerate(found):
+                beta = float(stats["beta"][j])
+                alpha = float(stats["alpha"][j])
+                r_squared = float(stats["r_squared"][j])
+                if not np.isfinite(beta):
+                    results[ticker] = {"error": "Insufficient data for regression"}
+                    continue
 
-                    results[ticker] = {
-                        "Beta": round(beta, 4),
-                        "Alpha (Daily)": round(alpha, 6),
-                        "Alpha (Annualized)": round(annualized_alpha, 4),
-                        "R-Squared": round(r_squared, 4),
-                        "Correlation": round(correlation, 4),
-                        "Residual Std Dev": round(residual_std, 6),
-                        "Tracking Error (Ann.)": round(tracking_error, 4),
-                        "Information Ratio": round(information_ratio, 4),
-                        "Interpretation": self._interpret_regression(
-                            beta, alpha, r_squared
-                        ),
-                        "Data Points": len(ticker_returns),
-                    }
+                # Annualize alpha (daily to annual)
+                annualized_alpha = alpha * 252
+
+                # Information ratio (excess return over benchmark relative to tracking error)
+                tracking_error = float(stats["residual_std"][j]) * np.sqrt(252)
+                mean_excess_return = float(stats["residual_mean"][j]) * 252
+                information_ratio = (
+                    mean_excess_return / tracking_error if tracking_error != 0 else 0
+                )
 
-                except Exception as e:
-                    self.logger.error(f"Error in regression for {ticker}: {str(e)}")
-                    results[ticker] = {"error": str(e)}
+                results[ticker] = {
+                    "Beta": round(beta, 4),
+                    "Alpha (Daily)": round(alpha, 6),
+                    "Alpha (Annualized)": round(annualized_alpha, 4),
+                    "R-Squared": round(r_squared, 4),
+                    "Correlation": round(float(stats["correlation"][j]), 4),
+                    "Residual Std Dev": round(float(stats["residual_std"][j]), 6),
+                    "Tracking Error (Ann.)": round(tracking_error, 4),
+                    "Information Ratio": round(information_ratio, 4),
+                    "Beta Std Error": round(float(stats["beta_se"][j]), 4),
+                    "Alpha Std Error": round(float(stats["alpha_se"][j]), 6),
+                    "Beta t-Stat": round(float(stats["beta_t"][j]), 2),
+                    "Alpha t-Stat": round(float(stats["alpha_t"][j]), 2),
+                    "Interpretation": self._interpret_regression(
+                        beta, alpha, r_squared
+                    ),
+                    "Data Points": int(stats["n"][j]),
+                }
 
             # Add benchmark info
             results["Benchmark"] = benchmark
@@ -318,6 +350,214 @@ class FinancialAnalytics:
             self.logger.error(f"Error in linear regression analysis: {str(e)}")
             return {"error": str(e)}
 
+    def linear_regression_batch(
+        self,
+        tickers: List[str],
+        days: int = 252,
+        benchmarks: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Regression vs each ticker's home-exchange benchmark for a whole watchlist
+
+        Tickers are grouped by benchmark (from ``get_exchange_info`` unless
+        overridden), so each benchmark is downloaded once per group rather than
+        once per ticker, and each group is solved in one vectorized pass.
+
+        Args:
+            tickers (list): List of stock ticker symbols
+            days (int): Number of trading days
+            benchmarks (dict, optional): {ticker: benchmark} overrides
+
+        Returns:
+            dict: {ticker: result} where each result has the same structure as
+                ``linear_regression_analysis([ticker], benchmark)``, or
+                {ticker: {'error': ...}}
+        """
+        results: Dict[str, Dict] = {}
+        for benchmark, group in self._group_by_benchmark(tickers, benchmarks).items():
+            analysis = self.linear_regression_analysis(group, benchmark, days)
+            for ticker in group:
+                if "error" in analysis:
+                    results[ticker] = {"error": analysis["error"]}
+                elif ticker not in analysis:
+                    results[ticker] = {"error": f"Ticker {ticker} not found in returns"}
+                else:
+                    results[ticker] = {
+                        ticker: analysis[ticker],
+                        "Benchmark": benchmark,
+                        "Analysis Period": analysis["Analysis Period"],
+                    }
+        return results
+
+    @staticmethod
+    def _group_by_benchmark(
+        tickers: List[str], benchmarks: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[str]]:
+        """Group tickers by benchmark (override, else the home-exchange benchmark)."""
+        groups: Dict[str, List[str]] = {}
+        for ticker in tickers:
+            benchmark = (benchmarks or {}).get(ticker) or get_exchange_info(ticker)["benchmark"]
+            groups.setdefault(benchmark, []).append(ticker)
+        return groups
+
+    @staticmethod
+    def _regression_statistics(x: np.ndarray, Y: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Closed-form simple OLS of every column of Y on x
+
+        Missing values in Y (NaN) are excluded per column, so each column uses
+        the observations where both series are available.
+
+        Args:
+            x (np.ndarray): (T,) benchmark returns
+            Y (np.ndarray): (T, N) asset returns
+
+        Returns:
+            dict: (N,) arrays alpha, beta, r_squared, correlation, residual_std,
+                residual_mean, alpha_se, beta_se, alpha_t, beta_t and n
+        """
+        x = np.asarray(x, dtype=float)
+        Y = np.asarray(Y, dtype=float).reshape(len(x), -1)
+        mask = ~np.isnan(Y) & ~np.isnan(x)[:, None]
+        n = mask.sum(axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            X = np.where(mask, x[:, None], 0.0)
+            Y0 = np.where(mask, Y, 0.0)
+            x_mean = X.sum(axis=0) / n
+            y_mean = Y0.sum(axis=0) / n
+            xc = np.where(mask, X - x_mean, 0.0)
+            yc = np.where(mask, Y0 - y_mean, 0.0)
+
+            sxx = (xc * xc).sum(axis=0)
+            syy = (yc * yc).sum(axis=0)
+            sxy = (xc * yc).sum(axis=0)
+
+            beta = sxy / sxx
+            alpha = y_mean - beta * x_mean
+            residuals = np.where(mask, yc - beta * xc, 0.0)
+            ss_res = (residuals * residuals).sum(axis=0)
+            r_squared = np.where(syy != 0, 1 - ss_res / syy, 0.0)
+            correlation = sxy / np.sqrt(sxx * syy)
+
+            # Classical OLS standard errors with n - 2 degrees of freedom
+            sigma2 = ss_res / (n - 2)
+            beta_se = np.sqrt(sigma2 / sxx)
+            alpha_se = np.sqrt(sigma2 * (1.0 / n + x_mean**2 / sxx))
+
+            return {
+                "alpha": alpha,
+                "beta": beta,
+                "r_squared": r_squared,
+                "correlation": correlation,
+                "residual_std": np.sqrt(ss_res / n),
+                "residual_mean": residuals.sum(axis=0) / n,
+                "alpha_se": alpha_se,
+                "beta_se": beta_se,
+                "alpha_t": alpha / alpha_se,
+                "beta_t": beta / beta_se,
+                "n": n,
+            }
+
+    def rolling_analysis(
+        self,
+        tickers: List[str],
+        window: int = 63,
+        days: int = 2520,
+        confidence_level: float = 0.95,
+        risk_free_rate: float = 0.0,
+        benchmarks: Optional[Dict[str, str]] = None,
+    ) -> Dict:
+        """
+        Rolling beta, correlation, volatility, Sharpe, Sortino and historical VaR
+
+        All statistics are computed for every ticker at once with O(n)
+        cumulative-sum updates (O(n log w) for VaR), so ten years of daily data
+        for 50 names is a handful of array passes. Tickers are grouped by
+        benchmark as in ``linear_regression_batch`` (one download per group).
+
+        Args:
+            tickers (list): List of stock ticker symbols
+            window (int): Rolling window in trading days (63 = one quarter)
+            days (int): Number of trading days of history
+            confidence_level (float): Confidence level for the historical VaR
+            risk_free_rate (float): Annual risk-free rate for Sharpe/Sortino
+            benchmarks (dict, optional): {ticker: benchmark} overrides
+
+        Returns:
+            dict: Per-ticker series ready for Plotly traces:
+                {'Series': {ticker: {'Dates': [...], 'Beta': [...], 'Correlation': [...],
+                 'Volatility (Ann.)': [...], 'Sharpe': [...], 'Sortino': [...],
+                 'Historical VaR': [...]}}, 'Latest': {...}, 'Window': ..., ...}
+                or {'error': ...}
+        """
+        try:
+            self.logger.info(
+                f"Computing {window}-day rolling analytics for {len(tickers)} tickers"
+            )
+            risk_free_daily = risk_free_rate / 252
+            series: Dict[str, Dict] = {}
+            latest: Dict[str, Dict] = {}
+            used_benchmarks: Dict[str, str] = {}
+
+            for benchmark, group in self._group_by_benchmark(tickers, benchmarks).items():
+                returns = self.get_historical_returns(group + [benchmark], days=days)
+                if returns.empty or benchmark not in returns.columns:
+                    self.logger.warning(f"No returns for benchmark group {benchmark}")
+                    continue
+                found = [t for t in group if t in returns.columns]
+                if not found or len(returns) < window:
+                    continue
+
+                values = returns[found].values
+                beta, corr = rolling_beta_correlation(
+                    returns[benchmark].values, values, window
+                )
+                _, vol = rolling_mean_std(values, window)
+                sharpe, sortino = rolling_sharpe_sortino(values, window, risk_free_daily)
+                var = rolling_historical_var(values, window, confidence_level)
+
+                # Drop the warm-up rows before the first full window
+                dates = pd.to_datetime(returns.index[window - 1:]).strftime("%Y-%m-%d").tolist()
+                metrics = {
+                    "Beta": (beta, 4),
+                    "Correlation": (corr, 4),
+                    "Volatility (Ann.)": (vol * np.sqrt(252), 4),
+                    "Sharpe": (sharpe, 4),
+                    "Sortino": (sortino, 4),
+                    "Historical VaR": (var, 5),
+                }
+                for j, ticker in enumerate(found):
+                    series[ticker] = {"Dates": dates}
+                    for name, (matrix, digits) in metrics.items():
+                        column = np.round(matrix[window - 1:, j], digits)
+                        series[ticker][name] = [
+                            None if np.isnan(v) else float(v) for v in column
+                        ]
+                    latest[ticker] = {
+                        name: column[-1]
+                        for name, column in series[ticker].items()
+                        if name != "Dates"
+                    }
+                    used_benchmarks[ticker] = benchmark
+
+            if not series:
+                return {"error": "Insufficient data for rolling analytics"}
+
+            return {
+                "Series": series,
+                "Latest": latest,
+                "Benchmarks": used_benchmarks,
+                "Window": window,
+                "Confidence Level": confidence_level,
+                "Risk-Free Rate": risk_free_rate,
+                "Analysis Period": f"{days} trading days",
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error in rolling analysis: {str(e)}")
+            return {"error": str(e)}
+
     def _interpret_regression(self, beta: float, alpha: float, r_squared: float) -> str:
         """
         Interpret regression results
@@ -368,7 +608,12 @@ class FinancialAnalytics:
         return f"{beta_desc}; {alpha_desc}; {fit_desc}"
 
     def pca_analysis(
-        self, tickers: List[str], days: int = 252, n_components: Optional[int] = None
+        self,
+        tickers: List[str],
+        days: int = 252,
+        n_components: Optional[int] = None,
+        method: str = "auto",
+        returns: Optional[pd.DataFrame] = None,
     ) -> Dict:
         """
         Perform Principal Component Analysis on asset returns with standardization
@@ -376,7 +621,12 @@ class FinancialAnalytics:
         Args:
             tickers (list): List of stock ticker symbols
             days (int): Number of trading days
-            n_components (int, optional): Number of components to keep
+            n_components (int, optional): Number of components to keep (all for
+                small universes, the top 10 in large-universe mode)
+            method (str): 'full', 'randomized' (top-k randomized SVD), 'incremental'
+                (persisted IncrementalPCA updated with new days) or 'auto'
+                (randomized above 50 tickers, full otherwise)
+            returns (pd.DataFrame, optional): Pre-fetched returns matrix (skips the download)
 
         Returns:
             dict: PCA results with interpretation
@@ -385,7 +635,7 @@ class FinancialAnalytics:
             self.logger.info(f"Performing PCA analysis for {len(tickers)} tickers")
 
             # Get returns data
-            returns = self.get_historical_returns(tickers, days=days)
+            returns = self._select_returns(tickers, days, returns)
 
             if returns.empty or len(returns.columns) < 2:
                 return {"error": "Insufficient data for PCA analysis"}
@@ -396,17 +646,24 @@ class FinancialAnalytics:
             if len(returns.columns) < 2:
                 return {"error": "Need at least 2 assets for PCA"}
 
-            # Standardize the data (zero mean, unit variance)
-            scaler = StandardScaler()
-            returns_standardized = scaler.fit_transform(returns)
+            method = resolve_pca_method(method, len(returns.columns))
 
             # Determine number of components
             if n_components is None:
                 n_components = min(len(returns.columns), len(returns))
-
-            # Perform PCA
-            pca = PCA(n_components=n_components)
-            principal_components = pca.fit_transform(returns_standardized)  # noqa: F841
+                if method != "full":
+                    n_components = min(n_components, DEFAULT_LARGE_UNIVERSE_COMPONENTS)
+
+            if method == "incremental":
+                # Standardization is frozen at the first fit; later calls only
+                # fold in the days that arrived since
+                model = IncrementalFactorModel(list(returns.columns), n_components)
+                pca, scaler = model.update(returns)
+            else:
+                # Standardize the data (zero mean, unit variance)
+                scaler = StandardScaler()
+                returns_standardized = scaler.fit_transform(returns)
+                pca = fit_pca(returns_standardized, n_components, method)
 
             # Create results dictionary
             results = {
@@ -453,6 +710,7 @@ class FinancialAnalytics:
             # Add summary statistics
             results["Summary"] = {
                 "Total Components": len(pca.explained_variance_ratio_),
+                "Method": method,
                 "Tickers Analyzed": list(returns.columns),
                 "Data Points": len(returns),
                 "Total Variance Explained": round(
@@ -525,10 +783,13 @@ class FinancialAnalytics:
             threshold (float): Variance threshold (e.g., 0.90 for 90%)
 
         Returns:
-            int: Number of components needed
+            int: Number of components needed (None if the computed components
+                do not reach the threshold, e.g. top-k PCA)
         """
         cumsum = np.cumsum(explained_variance_ratio)
-        return int(np.argmax(cumsum >= threshold) + 1)
+        if len(cumsum) == 0 or cumsum[-1] < threshold - 1e-9:
+            return None
+        return int(np.argmax(cumsum >= threshold - 1e-9) + 1)
 
     def monte_carlo_var_es(
         self,
@@ -541,6 +802,10 @@ class FinancialAnalytics:
         initial_investment: float = 100000,
         model: str = "gbm",
         jump_params: Optional[Dict] = None,
+        fhs_params: Optional[Dict] = None,
+        volatility_model: str = "historical",
+        covariance_model: str = "sample",
+        returns: Optional[pd.DataFrame] = None,
     ) -> Dict:
         """
         Monte Carlo simulation for Value at Risk (VaR) and Expected Shortfall (ES)
@@ -553,12 +818,23 @@ class FinancialAnalytics:
             forecast_days (int): Days to forecast
             confidence_level (float): Confidence level (e.g., 0.95 for 95%)
             initial_investment (float): Initial portfolio value
-            model (str): 'gbm' for standard GBM (default) or 'merton' for jump-diffusion
+            model (str): 'gbm' for standard GBM (default), 'merton' for jump-diffusion
+                or 'fhs' for filtered historical simulation
             jump_params (dict): Jump parameters for Merton model:
                 {'lambda': 2.0, 'mu_j': -0.05, 'delta_j': 0.10}
                 lambda  = jumps per year (Poisson intensity)
                 mu_j    = mean log-jump size (negative for downward jumps)
                 delta_j = std dev of log-jump size
+            fhs_params (dict): Filtered historical simulation parameters:
+                {'lambda': 0.94, 'block_size': 5, 'filter': 'ewma'}
+                lambda     = EWMA decay used to standardize historical returns
+                block_size = length of the resampled residual blocks (days)
+                filter     = 'ewma' or 'garch' (GARCH(1,1) conditional volatility)
+            volatility_model (str): 'historical' (sample volatility, default) or
+                'garch' to use GARCH(1,1) volatility forecasts over the horizon
+            covariance_model (str): 'sample' (default) or 'ewma' to use the persisted
+                exponentially weighted covariance (see ewma_covariance)
+            returns (pd.DataFrame, optional): Pre-fetched returns matrix (skips the download)
 
         Returns:
             dict: VaR and ES estimates with simulation details
@@ -569,7 +845,7 @@ class FinancialAnalytics:
             )
 
             # Get historical returns
-            returns = self.get_historical_returns(tickers, days=days)
+            returns = self._select_returns(tickers, days, returns)
 
             if returns.empty:
                 return {"error": "Could not fetch returns data"}
@@ -601,155 +877,52 @@ class FinancialAnalytics:
             # Calculate portfolio statistics
             mean_returns = returns.mean()
             cov_matrix = returns.cov()
+            if covariance_model == "ewma":
+                cov_matrix = self._ewma_covariance_matrix(returns).fillna(cov_matrix)
+            if volatility_model == "garch":
+                cov_matrix = self._rescale_covariance(
+                    cov_matrix, self._garch_volatility(returns, forecast_days)
+                )
 
             # Portfolio mean and std
             portfolio_mean = np.dot(weights, mean_returns)
             portfolio_std = np.sqrt(np.dot(weights, np.dot(cov_matrix, weights)))
 
-            # ----------------------------------------------------------------
-            # Simulate returns based on model choice
-            # ----------------------------------------------------------------
-            _supported_models = {"merton", "gbm", "black-scholes"}
-            if model.lower() not in _supported_models:
-                raise ValueError(
-                    f"Unknown simulation model '{model}'. "
-                    f"Supported values: {sorted(_supported_models)}"
+            if model.lower() == "fhs":
+                growth, model_label = self._simulate_fhs_growth(
+                    returns.values @ weights, simulations, forecast_days, fhs_params
                 )
-
-            if model.lower() == "merton":
-                # Merton jump-diffusion: dS/S = (μ − λ μ̄_j)dt + σ dZ + J dN
-                jp = jump_params or {}
-                lam = float(jp.get("lambda", 2.0))  # jumps/year
-                mu_j = float(jp.get("mu_j", -0.05))  # mean log-jump
-                delta_j = float(jp.get("delta_j", 0.10))  # std log-jump
-                mu_bar = np.exp(mu_j + 0.5 * delta_j**2) - 1  # compensator
-
-                dt = 1.0 / 252  # one trading day
-
-                # Drift adjusted for jump risk: μ − λ μ̄_j
-                drift = portfolio_mean - lam * mu_bar * dt
-
-                # GBM component (daily)
-                gbm_daily = np.random.normal(
-                    drift, portfolio_std, (simulations, forecast_days)
-                )
-
-                # Poisson jump counts per day: N_t ~ Poisson(λ dt)
-                n_jumps = np.random.poisson(lam * dt, (simulations, forecast_days))
-
-                # For each jump: aggregate log-jump = sum of N log-normal jumps
-                # Efficient: since N is small, use Poisson-weighted approach
-                log_jump = n_jumps * mu_j + np.sqrt(
-                    n_jumps * delta_j**2
-                ) * np.random.standard_normal((simulations, forecast_days))
-                # Guard divide-by-zero: set to 0 where n_jumps==0
-                log_jump = np.where(n_jumps == 0, 0.0, log_jump)
-                jump_return = np.expm1(log_jump)  # e^(log_jump) - 1
-
-                simulated_returns = gbm_daily + jump_return
-                model_label = "Merton Jump-Diffusion"
-            else:  # 'gbm' or 'black-scholes'
-                # Standard GBM (original behaviour)
-                simulated_returns = np.random.normal(
-                    portfolio_mean, portfolio_std, (simulations, forecast_days)
+            else:
+                growth, model_label = self._simulate_growth(
+                    np.array([portfolio_mean]),
+                    np.array([portfolio_std]),
+                    simulations,
+                    forecast_days,
+                    model,
+                    jump_params,
                 )
-                model_label = "GBM (Black-Scholes)"
-
-            # Calculate cumulative returns for each simulation
-            cumulative_returns = np.cumprod(1 + simulated_returns, axis=1)
+                if covariance_model == "ewma":
+                    model_label += " with EWMA covariance"
+                if volatility_model == "garch":
+                    model_label += " with GARCH(1,1) volatility"
 
             # Final portfolio values
-            final_values = initial_investment * cumulative_returns[:, -1]
-
-            # Calculate returns (profit/loss)
-            portfolio_returns = final_values - initial_investment
-            portfolio_returns_pct = (final_values / initial_investment - 1) * 100
-
-            # Sort returns for VaR and ES calculation
-            sorted_returns = np.sort(portfolio_returns)
-            sorted_returns_pct = np.sort(portfolio_returns_pct)
-
-            # Calculate VaR (Value at Risk)
-            var_index = int((1 - confidence_level) * simulations)
-            var_value = -sorted_returns[var_index]  # Negative because it's a loss
-            var_pct = -sorted_returns_pct[var_index]
-
-            # Calculate ES (Expected Shortfall / Conditional VaR)
-            # Average of all losses beyond VaR
-            es_value = -np.mean(sorted_returns[:var_index])
-            es_pct = -np.mean(sorted_returns_pct[:var_index])
-
-            # Calculate percentiles
-            percentiles = [1, 5, 10, 25, 50, 75, 90, 95, 99]
-            percentile_values = {
-                f"{p}th Percentile": {
-                    "Value": round(float(np.percentile(final_values, p)), 2),
-                    "Return": round(float(np.percentile(portfolio_returns_pct, p)), 2),
-                }
-                for p in percentiles
-            }
-
-            # Probability of loss
-            prob_loss = np.sum(portfolio_returns < 0) / simulations * 100
+            final_values = initial_investment * growth[0]
 
-            # Best and worst case scenarios (using 75th and 10th percentiles for more realistic bounds)
-            top_25_percentile = float(
-                np.percentile(final_values, 75)
-            )  # 75th percentile (better than 75% of outcomes)
-            bottom_10_percentile = float(
-                np.percentile(final_values, 10)
-            )  # 10th percentile (worse than 90% of outcomes)
-
-            results = {
-                "VaR": {
-                    f"VaR at {confidence_level*100}% confidence": {
-                        "Value": round(var_value, 2),
-                        "Percentage": round(var_pct, 2),
-                        "Interpretation": (
-                            f"With {confidence_level*100}% confidence, the portfolio will not lose "
-                            f"more than ${var_value:,.2f} ({var_pct:.2f}%) over {forecast_days} days"
-                        ),
-                    }
-                },
-                "Expected Shortfall": {
-                    f"ES at {confidence_level*100}% confidence": {
-                        "Value": round(es_value, 2),
-                        "Percentage": round(es_pct, 2),
-                        "Interpretation": (
-                            f"If losses exceed VaR threshold, expected loss is "
-                            f"${es_value:,.2f} ({es_pct:.2f}%)"
-                        ),
-                    }
-                },
-                "Simulation Parameters": {
-                    "Simulations": simulations,
-                    "Forecast Days": forecast_days,
-                    "Initial Investment": initial_investment,
-                    "Confidence Level": confidence_level,
-                    "Historical Days": days,
-                    "Model": model_label,
-                },
-                "Portfolio Statistics": {
-                    "Daily Mean Return": round(float(portfolio_mean), 6),
-                    "Daily Std Dev": round(float(portfolio_std), 6),
-                    "Annualized Return": round(float(portfolio_mean * 252 * 100), 2),
-                    "Annualized Volatility": round(
-                        float(portfolio_std * np.sqrt(252) * 100), 2
-                    ),
-                },
-                "Scenario Analysis": {
-                    "Expected Value": round(float(np.mean(final_values)), 2),
-                    "Median Value": round(float(np.median(final_values)), 2),
-                    "Best Case (75th percentile)": round(top_25_percentile, 2),
-                    "Worst Case (10th percentile)": round(bottom_10_percentile, 2),
-                    "Probability of Loss": round(prob_loss, 2),
-                },
-                "Distribution Percentiles": percentile_values,
-                "Portfolio Composition": {
+            results = self._summarize_simulation(
+                final_values,
+                initial_investment=initial_investment,
+                confidence_level=confidence_level,
+                forecast_days=forecast_days,
+                days=days,
+                model_label=model_label,
+                daily_mean=portfolio_mean,
+                daily_std=portfolio_std,
+                composition={
                     ticker: round(weight * 100, 2)
                     for ticker, weight in zip(tickers, weights)
                 },
-            }
+            )
 
             # Add stress test results if we have multiple assets
             if len(tickers) >= 2:
@@ -765,6 +938,9 @@ class FinancialAnalytics:
                         forecast_days=1,  # Stress tests typically use 1-day horizon
                         confidence_level=confidence_level,
                         initial_investment=initial_investment,
+                        returns=returns,
+                        volatility_model=volatility_model,
+                        covariance_model=covariance_model,
                     )
 
                     if stress_results and "error" not in stress_results:
@@ -791,6 +967,409 @@ class FinancialAnalytics:
             self.logger.error(f"Error in Monte Carlo simulation: {str(e)}")
             return {"error": str(e)}
 
+    def monte_carlo_var_es_batch(
+        self,
+        tickers: List[str],
+        days: int = 252,
+        simulations: int = 10000,
+        forecast_days: int = 252,
+        confidence_level: float = 0.95,
+        initial_investment: float = 100000,
+        model: str = "gbm",
+        jump_params: Optional[Dict] = None,
+        fhs_params: Optional[Dict] = None,
+        volatility_model: str = "historical",
+        covariance_model: str = "sample",
+        max_block_elements: int = 4_000_000,
+        returns: Optional[pd.DataFrame] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Single-name Monte Carlo VaR/ES for a whole watchlist in one pass
+
+        Equivalent to calling ``monte_carlo_var_es([ticker])`` for each ticker,
+        but returns are fetched once for all tickers and every ticker is
+        simulated from the same standard-normal block as one
+        (tickers, simulations) array operation.
+
+        Args:
+            tickers (list): List of stock ticker symbols
+            days (int): Historical days for parameter estimation
+            simulations (int): Number of Monte Carlo simulations
+            forecast_days (int): Days to forecast
+            confidence_level (float): Confidence level (e.g., 0.95 for 95%)
+            initial_investment (float): Initial value invested in each ticker
+            model (str): 'gbm' (default), 'merton' for jump-diffusion or 'fhs'
+                for filtered historical simulation
+            jump_params (dict): Jump parameters for the Merton model (see monte_carlo_var_es)
+            fhs_params (dict): Filtered historical simulation parameters (see monte_carlo_var_es)
+            volatility_model (str): 'historical' (default) or 'garch' (see monte_carlo_var_es)
+            covariance_model (str): 'sample' (default) or 'ewma' (see monte_carlo_var_es)
+            max_block_elements (int): Upper bound on tickers x simulations x days
+                evaluated at once (bounds peak memory)
+            returns (pd.DataFrame, optional): Pre-fetched returns matrix (skips the download)
+
+        Returns:
+            dict: {ticker: result} with the same per-ticker structure as
+                monte_carlo_var_es, or {ticker: {'error': ...}} for tickers without data
+        """
+        try:
+            self.logger.info(
+                f"Running batched Monte Carlo ({model.upper()}) for {len(tickers)} tickers: "
+                f"{simulations} scenarios each"
+            )
+
+            returns = self._select_returns(tickers, days, returns)
+            if returns.empty:
+                return {ticker: {"error": "Could not fetch returns data"} for ticker in tickers}
+
+            returns = returns.dropna(axis=1)
+            valid = [t for t in tickers if t in returns.columns]
+            results: Dict[str, Dict] = {
+                t: {"error": "No valid data for ticker"} for t in tickers if t not in valid
+            }
+            if not valid:
+                return results
+
+            means = returns[valid].mean().values
+            stds = returns[valid].std()
+            if covariance_model == "ewma":
+                ewma_cov = self._ewma_covariance_matrix(returns[valid])
+                stds = np.sqrt(pd.Series(np.diag(ewma_cov), index=valid)).fillna(stds)
+            if volatility_model == "garch":
+                stds = self._garch_volatility(returns[valid], forecast_days).fillna(stds)
+            stds = stds.values
+
+            if model.lower() == "fhs":
+                growth, model_label = self._simulate_fhs_growth(
+                    returns[valid].values,
+                    simulations,
+                    forecast_days,
+                    fhs_params,
+                    max_block_elements=max_block_elements,
+                )
+            else:
+                growth, model_label = self._simulate_growth(
+                    means,
+                    stds,
+                    simulations,
+                    forecast_days,
+                    model,
+                    jump_params,
+                    max_block_elements=max_block_elements,
+                )
+                if covariance_model == "ewma":
+                    model_label += " with EWMA covariance"
+                if volatility_model == "garch":
+                    model_label += " with GARCH(1,1) volatility"
+            final_values = initial_investment * growth
+
+            for i, ticker in enumerate(valid):
+                results[ticker] = self._summarize_simulation(
+                    final_values[i],
+                    initial_investment=initial_investment,
+                    confidence_level=confidence_level,
+                    forecast_days=forecast_days,
+                    days=days,
+                    model_label=model_label,
+                    daily_mean=means[i],
+                    daily_std=stds[i],
+                    composition={ticker: 100.0},
+                )
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error in batched Monte Carlo simulation: {str(e)}")
+            return {ticker: {"error": str(e)} for ticker in tickers}
+
+    def _simulate_growth(
+        self,
+        means: np.ndarray,
+        stds: np.ndarray,
+        simulations: int,
+        forecast_days: int,
+        model: str = "gbm",
+        jump_params: Optional[Dict] = None,
+        max_block_elements: int = 4_000_000,
+    ) -> tuple:
+        """
+        Simulate compounded growth factors for one or more return series.
+
+        All series share one standard-normal block (and one jump block for
+        Merton), so k series cost a single random draw. Series are evaluated
+        in groups so that at most ``max_block_elements`` values are live.
+
+        Args:
+            means (np.ndarray): Daily mean return per series, shape (k,)
+            stds (np.ndarray): Daily return std dev per series, shape (k,)
+            simulations (int): Number of Monte Carlo simulations
+            forecast_days (int): Days to compound
+            model (str): 'gbm' / 'black-scholes' or 'merton'
+            jump_params (dict): Merton jump parameters
+
+        Returns:
+            tuple: (growth factors (k, simulations), model label)
+        """
+        # ----------------------------------------------------------------
+        # Simulate returns based on model choice
+        # ----------------------------------------------------------------
+        _supported_models = {"merton", "gbm", "black-scholes"}
+        if model.lower() not in _supported_models:
+            raise ValueError(
+                f"Unknown simulation model '{model}'. "
+                f"Supported values: {sorted(_supported_models)}"
+            )
+
+        means = np.asarray(means, dtype=float)
+        stds = np.asarray(stds, dtype=float)
+        shape = (simulations, forecast_days)
+
+        # Shared standard-normal block for every series
+        Z = np.random.standard_normal(shape)
+
+        if model.lower() == "merton":
+            # Merton jump-diffusion: dS/S = (μ − λ μ̄_j)dt + σ dZ + J dN
+            jp = jump_params or {}
+            lam = float(jp.get("lambda", 2.0))  # jumps/year
+            mu_j = float(jp.get("mu_j", -0.05))  # mean log-jump
+            delta_j = float(jp.get("delta_j", 0.10))  # std log-jump
+            mu_bar = np.exp(mu_j + 0.5 * delta_j**2) - 1  # compensator
+
+            dt = 1.0 / 252  # one trading day
+
+            # Drift adjusted for jump risk: μ − λ μ̄_j
+            drift = means - lam * mu_bar * dt
+
+            # Poisson jump counts per day: N_t ~ Poisson(λ dt)
+            n_jumps = np.random.poisson(lam * dt, shape)
+
+            # For each jump: aggregate log-jump = sum of N log-normal jumps
+            # Efficient: since N is small, use Poisson-weighted approach
+            log_jump = n_jumps * mu_j + np.sqrt(
+                n_jumps * delta_j**2
+            ) * np.random.standard_normal(shape)
+            # Guard divide-by-zero: set to 0 where n_jumps==0
+            log_jump = np.where(n_jumps == 0, 0.0, log_jump)
+            jump_return = np.expm1(log_jump)  # e^(log_jump) - 1
+            model_label = "Merton Jump-Diffusion"
+        else:  # 'gbm' or 'black-scholes'
+            drift = means
+            jump_return = 0.0
+            model_label = "GBM (Black-Scholes)"
+
+        k = len(means)
+        growth = np.empty((k, simulations))
+        group = max(1, int(max_block_elements // max(1, simulations * forecast_days)))
+        for lo in range(0, k, group):
+            hi = min(k, lo + group)
+            # (group, simulations, forecast_days) daily returns
+            simulated_returns = (
+                drift[lo:hi, None, None] + stds[lo:hi, None, None] * Z + jump_return
+            )
+            growth[lo:hi] = np.prod(1 + simulated_returns, axis=2)
+
+        return growth, model_label
+
+    def _simulate_fhs_growth(
+        self,
+        history: np.ndarray,
+        simulations: int,
+        forecast_days: int,
+        fhs_params: Optional[Dict] = None,
+        max_block_elements: int = 4_000_000,
+    ) -> tuple:
+        """
+        Filtered historical simulation of compounded growth factors.
+
+        Each historical return series is demeaned and divided by its one-step
+        EWMA volatility forecast, giving approximately i.i.d. residuals that
+        keep the empirical fat tails and skew. Paths are built from blocks of
+        consecutive residuals (preserving short-range dependence) drawn with
+        one vectorized index array shared by every series, then rescaled by
+        the current volatility forecast.
+
+        Args:
+            history (np.ndarray): Historical daily returns, shape (T,) or (T, k)
+            simulations (int): Number of Monte Carlo simulations
+            forecast_days (int): Days to compound
+            fhs_params (dict): {'lambda': EWMA decay, 'block_size': block length in days,
+                'filter': 'ewma' or 'garch'}
+            max_block_elements (int): Upper bound on series x simulations x days
+                evaluated at once
+
+        Returns:
+            tuple: (growth factors (k, simulations), model label)
+        """
+        params = fhs_params or {}
+        lam = float(params.get("lambda", 0.94))
+        block_size = int(params.get("block_size", 5))
+
+        history = np.asarray(history, dtype=float)
+        if history.ndim == 1:
+            history = history[:, None]
+        n_obs, k = history.shape
+        if n_obs < 2:
+            raise ValueError("Filtered historical simulation needs at least 2 observations")
+        block_size = max(1, min(block_size, n_obs))
+
+        means = history.mean(axis=0)
+        if params.get("filter", "ewma") == "garch":
+            forecaster = GarchForecaster(persist=False, min_observations=2)
+            forecaster.fit(pd.DataFrame(history - means))
+            residuals = (history - means) / forecaster.conditional_volatility.values
+            current_vol = np.sqrt(forecaster.next_variance.values)
+            label = "Filtered Historical Simulation (GARCH(1,1))"
+        else:
+            residuals, current_vol = self._ewma_standardize(history - means, lam)
+            label = f"Filtered Historical Simulation (EWMA λ={lam:g})"
+
+        # Block bootstrap indices: (simulations, forecast_days) rows into the residuals
+        n_blocks = -(-forecast_days // block_size)
+        starts = np.random.randint(0, n_obs - block_size + 1, (simulations, n_blocks))
+        idx = (starts[:, :, None] + np.arange(block_size)).reshape(simulations, -1)
+        idx = idx[:, :forecast_days]
+
+        growth = np.empty((k, simulations))
+        group = max(1, int(max_block_elements // max(1, simulations * forecast_days)))
+        for lo in range(0, k, group):
+            hi = min(k, lo + group)
+            # (simulations, forecast_days, group) daily returns
+            simulated_returns = means[lo:hi] + current_vol[lo:hi] * residuals[idx, lo:hi]
+            growth[lo:hi] = np.prod(1 + simulated_returns, axis=1).T
+
+        return growth, label
+
+    def _garch_volatility(self, returns: pd.DataFrame, horizon: int) -> pd.Series:
+        """Horizon-average daily GARCH(1,1) volatility per ticker (persisted fits are reused)."""
+        forecaster = GarchForecaster()
+        forecaster.fit(returns)
+        return forecaster.forecast(horizon).reindex(returns.columns)
+
+    @staticmethod
+    def _rescale_covariance(cov_matrix: pd.DataFrame, volatility: pd.Series) -> pd.DataFrame:
+        """Keep the sample correlations but replace each asset's volatility where a forecast exists."""
+        sample_vol = np.sqrt(np.diag(cov_matrix))
+        vol = volatility.reindex(cov_matrix.columns).fillna(pd.Series(sample_vol, cov_matrix.columns))
+        scale = np.where(sample_vol > 0, vol.values / np.where(sample_vol > 0, sample_vol, 1.0), 1.0)
+        return cov_matrix * np.outer(scale, scale)
+
+    def _ewma_covariance_matrix(self, returns: pd.DataFrame) -> pd.DataFrame:
+        """EWMA covariance for the columns of ``returns``, folding them into the persisted state."""
+        return self.ewma_covariance(list(returns.columns), returns=returns).covariance()
+
+    @staticmethod
+    def _ewma_standardize(demeaned: np.ndarray, lam: float) -> tuple:
+        """EWMA-standardized residuals (T, k) and the next-day volatility forecast (k,)."""
+        squared = demeaned**2
+        seed = squared.mean(axis=0)
+        # sigma²_t = λ sigma²_{t-1} + (1 − λ) r²_t, evaluated as one linear filter
+        variance, _ = lfilter([1 - lam], [1, -lam], squared, axis=0, zi=(lam * seed)[None, :])
+        # The forecast for day t only uses information up to t-1
+        forecast = np.vstack([seed[None, :], variance[:-1]])
+        residuals = demeaned / np.sqrt(np.maximum(forecast, 1e-18))
+        return residuals, np.sqrt(variance[-1])
+
+    def _summarize_simulation(
+        self,
+        final_values: np.ndarray,
+        initial_investment: float,
+        confidence_level: float,
+        forecast_days: int,
+        days: int,
+        model_label: str,
+        daily_mean: float,
+        daily_std: float,
+        composition: Dict[str, float],
+    ) -> Dict:
+        """Build the VaR / ES / scenario result dict from simulated final values."""
+        simulations = len(final_values)
+        percentiles = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+
+        # One selection pass over the final values; dollar P&L and percentage
+        # returns are increasing affine maps of them, so their order
+        # statistics follow directly
+        quantile, tail_mean, levels = tail_statistics(
+            final_values, confidence_level, percentiles
+        )
+
+        def to_pct(value: float) -> float:
+            return (value / initial_investment - 1) * 100
+
+        # Calculate VaR (Value at Risk) — negative because it's a loss
+        var_value = initial_investment - quantile
+        var_pct = -to_pct(quantile)
+
+        # Calculate ES (Expected Shortfall / Conditional VaR)
+        # Average of all losses beyond VaR
+        es_value = initial_investment - tail_mean
+        es_pct = -to_pct(tail_mean)
+
+        # Calculate percentiles
+        percentile_values = {
+            f"{p}th Percentile": {
+                "Value": round(levels[p], 2),
+                "Return": round(to_pct(levels[p]), 2),
+            }
+            for p in percentiles
+        }
+
+        # Probability of loss
+        prob_loss = np.sum(final_values < initial_investment) / simulations * 100
+
+        # Best and worst case scenarios (using 75th and 10th percentiles for more realistic bounds)
+        top_25_percentile = levels[75]  # 75th percentile (better than 75% of outcomes)
+        bottom_10_percentile = levels[10]  # 10th percentile (worse than 90% of outcomes)
+
+        results = {
+            "VaR": {
+                f"VaR at {confidence_level*100}% confidence": {
+                    "Value": round(var_value, 2),
+                    "Percentage": round(var_pct, 2),
+                    "Interpretation": (
+                        f"With {confidence_level*100}% confidence, the portfolio will not lose "
+                        f"more than ${var_value:,.2f} ({var_pct:.2f}%) over {forecast_days} days"
+                    ),
+                }
+            },
+            "Expected Shortfall": {
+                f"ES at {confidence_level*100}% confidence": {
+                    "Value": round(es_value, 2),
+                    "Percentage": round(es_pct, 2),
+                    "Interpretation": (
+                        f"If losses exceed VaR threshold, expected loss is "
+                        f"${es_value:,.2f} ({es_pct:.2f}%)"
+                    ),
+                }
+            },
+            "Simulation Parameters": {
+                "Simulations": simulations,
+                "Forecast Days": forecast_days,
+                "Initial Investment": initial_investment,
+                "Confidence Level": confidence_level,
+                "Historical Days": days,
+                "Model": model_label,
+            },
+            "Portfolio Statistics": {
+                "Daily Mean Return": round(float(daily_mean), 6),
+                "Daily Std Dev": round(float(daily_std), 6),
+                "Annualized Return": round(float(daily_mean * 252 * 100), 2),
+                "Annualized Volatility": round(
+                    float(daily_std * np.sqrt(252) * 100), 2
+                ),
+            },
+            "Scenario Analysis": {
+                "Expected Value": round(float(np.mean(final_values)), 2),
+                "Median Value": round(levels[50], 2),
+                "Best Case (75th percentile)": round(top_25_percentile, 2),
+                "Worst Case (10th percentile)": round(bottom_10_percentile, 2),
+                "Probability of Loss": round(prob_loss, 2),
+            },
+            "Distribution Percentiles": percentile_values,
+            "Portfolio Composition": composition,
+        }
+
+        return results
+
     def stress_test_var(
         self,
         tickers: List[str],
@@ -805,6 +1384,9 @@ class FinancialAnalytics:
         use_fat_tails: bool = True,
         degrees_of_freedom: int = 3,
         liquidity_haircut: float = 0.02,
+        returns: Optional[pd.DataFrame] = None,
+        volatility_model: str = "historical",
+        covariance_model: str = "sample",
     ) -> Dict:
         """
         Perform stress testing comparing normal market conditions to stressed conditions
@@ -831,6 +1413,11 @@ class FinancialAnalytics:
             use_fat_tails (bool): Use Student-t distribution for fat tails (default True)
             degrees_of_freedom (int): DoF for Student-t (lower = fatter tails, default 3), lower df captures more extreme events  # noqa: E501
             liquidity_haircut (float): Liquidity cost in stress (default 2%)
+            returns (pd.DataFrame, optional): Pre-fetched returns matrix (skips the download)
+            volatility_model (str): 'historical' (default) or 'garch' to start the base
+                case from GARCH(1,1) volatility forecasts
+            covariance_model (str): 'sample' (default) or 'ewma' to start the base case
+                from the persisted EWMA covariance
 
         Returns:
             dict: Stress test results with base and stressed VaR comparisons
@@ -841,7 +1428,7 @@ class FinancialAnalytics:
             )
 
             # Get historical returns
-            returns = self.get_historical_returns(tickers, days=days)
+            returns = self._select_returns(tickers, days, returns)
 
             if returns.empty:
                 return {"error": "Could not fetch returns data"}
@@ -860,6 +1447,11 @@ class FinancialAnalytics:
                 )
                 # Still run a simplified stress test
                 vol_base = returns.std().values[0]
+                if covariance_model == "ewma":
+                    ewma_var = self._ewma_covariance_matrix(returns).values[0, 0]
+                    vol_base = float(np.sqrt(ewma_var)) if np.isfinite(ewma_var) else vol_base
+                if volatility_model == "garch":
+                    vol_base = self._garch_volatility(returns, forecast_days).fillna(vol_base).values[0]
                 vol_stress = vol_base * vol_stress_multiplier
                 mean_return = returns.mean().values[0]
 
@@ -867,15 +1459,13 @@ class FinancialAnalytics:
                 base_returns = np.random.normal(mean_return, vol_base, simulations)
                 base_final_values = initial_investment * (1 + base_returns)
                 base_returns_dollars = base_final_values - initial_investment
-                base_var_idx = int((1 - confidence_level) * simulations)
-                base_var = -np.sort(base_returns_dollars)[base_var_idx]
+                base_var = -tail_statistics(base_returns_dollars, confidence_level)[0]
 
                 # Stress case simulations
                 stress_returns = np.random.normal(mean_return, vol_stress, simulations)
                 stress_final_values = initial_investment * (1 + stress_returns)
                 stress_returns_dollars = stress_final_values - initial_investment
-                stress_var_idx = int((1 - confidence_level) * simulations)
-                stress_var = -np.sort(stress_returns_dollars)[stress_var_idx]
+                stress_var = -tail_statistics(stress_returns_dollars, confidence_level)[0]
 
                 return {
                     "Base Case": {
@@ -919,82 +1509,56 @@ class FinancialAnalytics:
 
             weights = np.array([portfolio_weights.get(ticker, 0) for ticker in tickers])
 
-            # Calculate base case parameters
-            mean_returns = returns.mean().values  # noqa: F841
-            vol_base = returns.std().values
-            corr_base = returns.corr().values
-
-            # Calculate average base correlation (excluding diagonal)
-            n = len(tickers)
-            if n > 1:
-                rho_base = (corr_base.sum() - n) / (n * (n - 1))
-            else:
-                rho_base = 0
-
-            # Construct base covariance matrix
-            cov_base = np.zeros((len(tickers), len(tickers)))
-            for i in range(len(tickers)):
-                for j in range(len(tickers)):
-                    if i == j:
-                        cov_base[i, j] = vol_base[i] ** 2
-                    else:
-                        cov_base[i, j] = corr_base[i, j] * vol_base[i] * vol_base[j]
-
-            # Construct stress covariance matrix
+            # Base and stress scenarios share one factorization and one shock
+            # block (stress tests are conventionally zero-drift)
+            volatility = (
+                self._garch_volatility(returns, forecast_days)
+                if volatility_model == "garch"
+                else None
+            )
+            covariance = (
+                self._ewma_covariance_matrix(returns)
+                if covariance_model == "ewma"
+                else None
+            )
+            engine = ScenarioEngine(
+                returns,
+                portfolio_weights,
+                use_drift=False,
+                volatility=volatility,
+                covariance=covariance,
+            )
+            vol_base = engine.vol
+            rho_base = engine._average_correlation()
             vol_stress_vec = vol_base * vol_stress_multiplier
-            cov_stress = np.zeros((len(tickers), len(tickers)))
-            for i in range(len(tickers)):
-                for j in range(len(tickers)):
-                    if i == j:
-                        cov_stress[i, j] = vol_stress_vec[i] ** 2
-                    else:
-                        cov_stress[i, j] = (
-                            rho_stress * vol_stress_vec[i] * vol_stress_vec[j]
-                        )
-
-            # Ensure matrices are positive definite
-            try:
-                L_base = np.linalg.cholesky(cov_base)
-            except np.linalg.LinAlgError:
-                # Add small value to diagonal for numerical stability
-                cov_base += np.eye(len(tickers)) * 1e-6
-                L_base = np.linalg.cholesky(cov_base)
-
-            try:
-                L_stress = np.linalg.cholesky(cov_stress)
-            except np.linalg.LinAlgError:
-                cov_stress += np.eye(len(tickers)) * 1e-6
-                L_stress = np.linalg.cholesky(cov_stress)
-
-            # Generate standard normal random variables
-            Z = np.random.normal(0, 1, size=(len(tickers), simulations))
-
-            # Base case returns (Normal distribution)
-            epsilon_base = L_base @ Z
-            portfolio_returns_base = weights @ epsilon_base
-
-            # Stress case returns with FAT TAILS (Student-t distribution)
-            if use_fat_tails:
-                # Generate Multivariate Student-t for "Black Swan" events
-                # Math: Y = sqrt(df / W) * L * Z, where W ~ Chi-squared(df)
-                W = np.random.chisquare(degrees_of_freedom, size=simulations)
-                # Scale to create fat-tailed distribution
-                fat_tail_scale = np.sqrt(degrees_of_freedom / W)
-                epsilon_stress = L_stress @ Z * fat_tail_scale
-
-                # Add asymmetric downside bias (negative returns are worse)
-                # This captures the "leverage effect" in equity markets
-                downside_mask = epsilon_stress < 0
-                epsilon_stress[downside_mask] *= 1.2  # 20% worse on downside
-            else:
-                # Standard Normal stress (less realistic)
-                epsilon_stress = L_stress @ Z
 
-            portfolio_returns_stress = weights @ epsilon_stress
-
-            # Apply LIQUIDITY HAIRCUT to stress returns
-            # In a crisis, you can't exit at fair value - add transaction costs
-            portfolio_returns_stress = portfolio_returns_stress - liquidity_haircut
+            scenarios = [
+                {"name": "Base Case"},
+                {
+                    "name": "Stress Case",
+                    "vol_multiplier": vol_stress_multiplier,
+                    "correlation": rho_stress,
+                    "fat_tails": use_fat_tails,
+                    # Asymmetric downside bias captures the equity "leverage effect"
+                    "downside_multiplier": 1.2 if use_fat_tails else 1.0,
+                    # In a crisis, you can't exit at fair value - add transaction costs
+                    "haircut": liquidity_haircut,
+                },
+                {"name": "Stressed Volatility", "vol_multiplier": vol_stress_multiplier},
+                {"name": "Stressed Correlation", "correlation": rho_stress},
+                {"name": "Liquidity Haircut", "haircut": liquidity_haircut},
+            ]
+            # Student-t shocks are left unstandardized: the stress case deliberately
+            # carries the extra df/(df-2) variance of a "Black Swan" distribution
+            simulated = engine.simulate(
+                scenarios,
+                simulations=simulations,
+                horizon_days=forecast_days,
+                degrees_of_freedom=degrees_of_freedom,
+                standardize_t=False,
+            )
+            portfolio_returns_base = simulated["Base Case"]["portfolio"]
+            portfolio_returns_stress = simulated["Stress Case"]["portfolio"]
 
             # Calculate final portfolio values
             base_final_values = initial_investment * (1 + portfolio_returns_base)
@@ -1004,28 +1568,23 @@ class FinancialAnalytics:
             base_returns_dollars = base_final_values - initial_investment
             stress_returns_dollars = stress_final_values - initial_investment
 
-            # Sort for VaR calculation
-            sorted_base = np.sort(base_returns_dollars)
-            sorted_stress = np.sort(stress_returns_dollars)
+            # Calculate VaR and Expected Shortfall at confidence level
+            # (losses are reported as positive numbers)
+            base_quantile, base_tail, _ = tail_statistics(base_returns_dollars, confidence_level)
+            stress_quantile, stress_tail, _ = tail_statistics(
+                stress_returns_dollars, confidence_level
+            )
+            var_base, es_base = -base_quantile, -base_tail
+            var_stress, es_stress = -stress_quantile, -stress_tail
 
-            # Calculate VaR at confidence level
             # Calculate 99th percentile VaR for extreme stress scenarios
-            var_99_idx = int(0.01 * simulations)  # 99% confidence
-            var_99_stress = -sorted_stress[var_99_idx]
-            es_99_stress = -np.mean(sorted_stress[:var_99_idx])
-
-            var_idx = int((1 - confidence_level) * simulations)
-            var_base = -sorted_base[var_idx]
-            var_stress = -sorted_stress[var_idx]
+            quantile_99, tail_99, _ = tail_statistics(stress_returns_dollars, 0.99)
+            var_99_stress, es_99_stress = -quantile_99, -tail_99
 
             # Calculate VaR as percentage
             var_base_pct = var_base / initial_investment * 100
             var_stress_pct = var_stress / initial_investment * 100
 
-            # Calculate Expected Shortfall for both scenarios
-            es_base = -np.mean(sorted_base[:var_idx])
-            es_stress = -np.mean(sorted_stress[:var_idx])
-
             es_base_pct = es_base / initial_investment * 100
             es_stress_pct = es_stress / initial_investment * 100
 
@@ -1033,6 +1592,26 @@ class FinancialAnalytics:
             prob_loss_base = np.sum(portfolio_returns_base < 0) / simulations * 100
             prob_loss_stress = np.sum(portfolio_returns_stress < 0) / simulations * 100
 
+            # Isolate each stress driver against the same shocks
+            scenario_breakdown = {}
+            for name in ("Stressed Volatility", "Stressed Correlation", "Liquidity Haircut"):
+                quantile, tail_mean, _ = tail_statistics(
+                    simulated[name]["portfolio"], confidence_level
+                )
+                scenario_var = -quantile * initial_investment
+                scenario_breakdown[name] = {
+                    "VaR": round(float(scenario_var), 2),
+                    "VaR %": round(float(scenario_var / initial_investment * 100), 2),
+                    "Expected Shortfall": round(float(-tail_mean * initial_investment), 2),
+                    "VaR Increase": round(float(scenario_var - var_base), 2),
+                }
+            base_contributions = engine.contribution_var(
+                simulated["Base Case"], confidence_level, initial_investment
+            )
+            stress_contributions = engine.contribution_var(
+                simulated["Stress Case"], confidence_level, initial_investment
+            )
+
             results = {
                 "Base Case": {
                     "VaR": round(float(var_base), 2),
@@ -1046,6 +1625,7 @@ class FinancialAnalytics:
                         f"Under normal conditions, with {confidence_level*100}% confidence, "
                         f"maximum loss is ${var_base:,.2f} ({var_base_pct:.2f}%)"
                     ),
+                    **base_contributions,
                 },
                 "Stress Case": {
                     "VaR": round(float(var_stress), 2),
@@ -1071,7 +1651,9 @@ class FinancialAnalytics:
                         f"Under EXTREME crisis conditions (fat tails + volatility spike + correlation breakdown + liquidity crisis), "  # noqa: E501
                         f"with {confidence_level*100}% confidence, maximum loss is ${var_stress:,.2f} ({var_stress_pct:.2f}%)"  # noqa: E501
                     ),
+                    **stress_contributions,
                 },
+                "Scenario Breakdown": scenario_breakdown,
                 "Stress Impact": {
                     "VaR Increase": round(float(var_stress - var_base), 2),
                     "VaR Increase %": self.compute_pct_increase(
@@ -1100,6 +1682,10 @@ class FinancialAnalytics:
                     "Initial Investment": initial_investment,
                     "Confidence Level": confidence_level,
                     "Volatility Multiplier": vol_stress_multiplier,
+                    "Volatility Model": (
+                        "GARCH(1,1)" if volatility_model == "garch" else "Historical"
+                    ),
+                    "Covariance Model": "EWMA" if covariance_model == "ewma" else "Sample",
                     "Stress Correlation": rho_stress,
                     "Historical Days": days,
                     "Fat Tails (Student-t)": "Yes" if use_fat_tails else "No",
@@ -1110,6 +1696,7 @@ class FinancialAnalytics:
                     "Downside Asymmetry": (
                         "20% amplification" if use_fat_tails else "None"
                     ),
+                    "Factorization": engine.factorization.capitalize(),
                 },
                 "Portfolio Composition": {
                     ticker: round(weight * 100, 2)
@@ -1123,8 +1710,53 @@ class FinancialAnalytics:
             self.logger.error(f"Error in stress test VaR: {str(e)}")
             return {"error": str(e)}
 
+    def ewma_covariance(
+        self,
+        tickers: List[str],
+        days: int = 252,
+        decay: float = DEFAULT_DECAY,
+        returns: Optional[pd.DataFrame] = None,
+    ) -> EwmaCovariance:
+        """
+        Up-to-date persisted EWMA covariance state for a ticker universe
+
+        The first call folds in ``days`` of history. Later calls download only
+        the trading days since the last update and fold them in at O(N^2) per
+        day; calls on a day the state was already updated download nothing.
+
+        Args:
+            tickers (list): List of stock ticker symbols
+            days (int): History used when the state is first built
+            decay (float): EWMA decay factor (RiskMetrics daily: 0.94)
+            returns (pd.DataFrame, optional): Pre-fetched returns to fold in
+                instead of downloading
+
+        Returns:
+            EwmaCovariance: State exposing covariance(), correlation() and volatility()
+        """
+        state = EwmaCovariance(tickers, decay=decay)
+        if returns is not None:
+            return state.update(returns)
+        if state.is_current():
+            return state
+
+        lookback = days
+        if state.load():
+            missed = np.busday_count(state.last_date[:10], datetime.now().strftime("%Y-%m-%d"))
+            lookback = int(min(days, max(missed, 0) + 5))
+        returns = self.get_historical_returns(tickers, days=lookback)
+        if returns.empty:
+            if state.load():
+                return state
+            raise ValueError("Could not fetch returns data")
+        return state.update(returns)
+
     def correlation_analysis(
-        self, tickers: List[str], days: int = 252, method: str = "pearson"
+        self,
+        tickers: List[str],
+        days: int = 252,
+        method: str = "pearson",
+        returns: Optional[pd.DataFrame] = None,
     ) -> Dict:
         """
         Perform correlation analysis on asset returns
@@ -1132,7 +1764,10 @@ class FinancialAnalytics:
         Args:
             tickers (list): List of stock ticker symbols
             days (int): Number of trading days
-            method (str): Correlation method ('pearson', 'spearman', 'kendall')
+            method (str): Correlation method ('pearson', 'spearman', 'kendall') or
+                'ewma' for the persisted exponentially weighted correlation
+                (see ewma_covariance)
+            returns (pd.DataFrame, optional): Pre-fetched returns matrix (skips the download)
 
         Returns:
             dict: Correlation matrix and analysis
@@ -1142,8 +1777,19 @@ class FinancialAnalytics:
                 f"Performing correlation analysis for {len(tickers)} tickers"
             )
 
+            if method.lower() == "ewma":
+                state = self.ewma_covariance(tickers, days=days)
+                corr_matrix = state.correlation()
+                valid = corr_matrix.index[state.volatility().values > 0]
+                if len(valid) < 2:
+                    return {"error": "Need at least 2 assets for correlation analysis"}
+                corr_matrix = corr_matrix.loc[valid, valid]
+                return self._summarize_correlation(
+                    corr_matrix, state.n_observations, "EWMA"
+                )
+
             # Get returns data
-            returns = self.get_historical_returns(tickers, days=days)
+            returns = self._select_returns(tickers, days, returns)
 
             self.logger.info(
                 f"Returns shape after fetch: {returns.shape if not returns.empty else 'EMPTY'}"
@@ -1182,7 +1828,19 @@ class FinancialAnalytics:
 
             # Calculate correlation matrix
             corr_matrix = returns.corr(method=method)
+            return self._summarize_correlation(
+                corr_matrix, len(returns), method.capitalize()
+            )
 
+        except Exception as e:
+            self.logger.error(f"Error in correlation analysis: {str(e)}")
+            return {"error": str(e)}
+
+    def _summarize_correlation(
+        self, corr_matrix: pd.DataFrame, n_observations: int, method_label: str
+    ) -> Dict:
+        """Build the correlation analysis result from a correlation matrix."""
+        try:
             # Convert to dictionary format
             correlation_dict = {}
             for ticker1 in corr_matrix.columns:
@@ -1242,9 +1900,9 @@ class FinancialAnalytics:
                 "Summary Statistics": {
                     "Average Correlation": round(avg_correlation, 4),
                     "Diversification Score": round(diversification_score, 4),
-                    "Number of Assets": len(returns.columns),
-                    "Data Points": len(returns),
-                    "Method": method.capitalize(),
+                    "Number of Assets": len(corr_matrix.columns),
+                    "Data Points": n_observations,
+                    "Method": method_label,
                 },
                 "Highly Correlated Pairs": high_corr_pairs[:10],  # Top 10
                 "Negatively Correlated Pairs": negative_corr_pairs[:10],
@@ -1304,6 +1962,7 @@ class FinancialAnalytics:
         simulations: int = 10000,
         portfolio_weights: Optional[Dict[str, float]] = None,
         initial_investment: float = 100000,
+        max_workers: int = 4,
     ) -> Dict:
         """
         Perform all four analyses in one comprehensive report
@@ -1315,12 +1974,59 @@ class FinancialAnalytics:
             simulations (int): Monte Carlo simulations
             portfolio_weights (dict): Portfolio weights
             initial_investment (float): Initial portfolio value
+            max_workers (int): Analyses run concurrently once returns are loaded
 
         Returns:
-            dict: Comprehensive analysis results
+            dict: Comprehensive analysis results; per-stage status and wall time
+                are under ``["Analysis Metadata"]["Stage Timings"]``
         """
         self.logger.info("Starting comprehensive financial analysis")
 
+        # Load the shared returns matrix once and hand it to the analyses, which
+        # then run concurrently. Regression downloads its own (tickers +
+        # benchmark) matrix; it is ordered after the returns stage because
+        # yf.download keeps per-call results in module globals, so the two
+        # downloads of one run must not overlap
+        graph = StageGraph(max_workers=max_workers)
+        graph.add("returns", lambda: self.get_historical_returns(tickers, days=days))
+        graph.add(
+            "regression",
+            lambda returns: self.linear_regression_analysis(tickers, benchmark, days),
+            depends_on=("returns",),
+            budget=STAGE_BUDGETS["regression"],
+        )
+        graph.add(
+            "correlation",
+            lambda returns: self.correlation_analysis(tickers, days, returns=returns),
+            depends_on=("returns",),
+            budget=STAGE_BUDGETS["correlation"],
+        )
+        graph.add(
+            "pca",
+            lambda returns: self.pca_analysis(tickers, days, returns=returns),
+            depends_on=("returns",),
+            budget=STAGE_BUDGETS["pca"],
+        )
+        graph.add(
+            "monte_carlo",
+            lambda returns: self.monte_carlo_var_es(
+                tickers,
+                portfolio_weights,
+                days,
+                simulations,
+                initial_investment=initial_investment,
+                returns=returns,
+            ),
+            depends_on=("returns",),
+            budget=STAGE_BUDGETS["portfolio_monte_carlo"],
+        )
+        stage_results, timings = graph.run()
+
+        def stage_result(name: str) -> Dict:
+            if name in stage_results:
+                return stage_results[name]
+            return {"error": timings[name].get("error", f"Stage {timings[name]['status']}")}
+
         results = {
             "Analysis Metadata": {
                 "Tickers": tickers,
@@ -1328,19 +2034,12 @@ class FinancialAnalytics:
                 "Analysis Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "Historical Period": f"{days} trading days",
                 "Monte Carlo Simulations": simulations,
+                "Stage Timings": timings,
             },
-            "1. Linear Regression Analysis": self.linear_regression_analysis(
-                tickers, benchmark, days
-            ),
-            "2. Correlation Analysis": self.correlation_analysis(tickers, days),
-            "3. PCA Analysis": self.pca_analysis(tickers, days),
-            "4. Monte Carlo VaR & ES": self.monte_carlo_var_es(
-                tickers,
-                portfolio_weights,
-                days,
-                simulations,
-                initial_investment=initial_investment,
-            ),
+            "1. Linear Regression Analysis": stage_result("regression"),
+            "2. Correlation Analysis": stage_result("correlation"),
+            "3. PCA Analysis": stage_result("pca"),
+            "4. Monte Carlo VaR & ES": stage_result("monte_carlo"),
         }
 
         self.logger.info("Comprehensive analysis completed")
@@ -1352,7 +2051,8 @@ class FinancialAnalytics:
 
         Args:
             stock_data (dict): Stock data containing valuation, profitability, earnings,
-                             financial metrics, and cashflow information
+                             financial metrics, and cashflow information (or a
+                             MetricIndex already built over it)
             ticker (str): Stock ticker symbol
 
         Returns:
@@ -1361,9 +2061,12 @@ class FinancialAnalytics:
         try:
             self.logger.info(f"Performing fundamental analysis for {ticker}")
 
+            # Index the payload once; every metric lookup below reuses it
+            stock_data = MetricIndex.of(stock_data)
+
             # Debug: Log available keys
             self.logger.info(
-                f"Available data keys for {ticker}: {list(stock_data.keys())[:20]}"
+                f"Available data keys for {ticker}: {stock_data.keys[:20]}"
             )
 
             analysis = {
@@ -1783,71 +2486,15 @@ class FinancialAnalytics:
             return None
 
     def _extract_metric(self, data: Dict, possible_keys: List[str]) -> Optional[float]:
-        """Extract a metric from data dict with multiple possible key names"""
-        for key in possible_keys:
-            # Check in main data (exact match)
-            if key in data:
-                value = data[key]
-                if value is not None and value != "N/A" and value != "N/A%":
-                    try:
-                        return self._parse_numeric_value(value)
-                    except (ValueError, TypeError):
-                        continue
-
-            # Check for partial match in main data
-            for data_key in data.keys():
-                if isinstance(data_key, str) and key.lower() in data_key.lower():
-                    value = data[data_key]
-                    if value is not None and value != "N/A" and value != "N/A%":
-                        try:
-                            return self._parse_numeric_value(value)
-                        except (ValueError, TypeError):
-                            continue
-
-            # Check in nested dicts
-            for section in [
-                "valuation",
-                "profitability",
-                "financial_metrics",
-                "earnings",
-                "cashflow",
-                "statistics",
-                "financials",
-            ]:
-                if section in data and isinstance(data[section], dict):
-                    if key in data[section]:
-                        value = data[section][key]
-                        if value is not None and value != "N/A" and value != "N/A%":
-                            try:
-                                return self._parse_numeric_value(value)
-                            except (ValueError, TypeError):
-                                continue
-        return None
+        """Extract a metric from data dict (or a prebuilt MetricIndex) with multiple possible key names"""
+        return MetricIndex.of(data).lookup(possible_keys)
 
     def _parse_numeric_value(self, value) -> float:
-        """Parse numeric value handling suffixes like B, M, K properly"""
-        if isinstance(value, (int, float)):
-            return float(value)
-
-        if isinstance(value, str):
-            # Clean the string
-            value = value.replace("%", "").replace(",", "").replace("$", "").strip()
-
-            # Handle suffixes with proper multiplication
-            multiplier = 1
-            if value.endswith("B"):
-                multiplier = 1_000_000_000
-                value = value[:-1].strip()
-            elif value.endswith("M"):
-                multiplier = 1_000_000
-                value = value[:-1].strip()
-            elif value.endswith("K"):
-                multiplier = 1_000
-                value = value[:-1].strip()
-
-            return float(value) * multiplier
-
-        raise ValueError(f"Cannot parse value: {value}")
+        """Parse numeric value handling suffixes like T, B, M, K properly"""
+        parsed = parse_numeric(value)
+        if parsed is None:
+            raise ValueError(f"Not a numeric value: {value!r}")
+        return parsed
 
     def _generate_investment_summary(
         self,
@@ -0,0 +1,372 @@
+"""
+GARCH(1,1) Volatility Forecasting
+
+Fits Gaussian GARCH(1,1) models to a whole universe of return series at once:
+1. The variance recursion runs over time on (N,) vectors, so one pass over a
+   (T, N) returns matrix evaluates every asset's likelihood and analytic gradient
+2. Each asset takes its own BHHH (outer-product-of-scores) Newton step, but all
+   assets in a chunk share every likelihood pass; chunks run in parallel threads
+3. Each fit warm-starts from the last persisted parameters for that ticker, and a
+   fit on the same data as the stored one is reused outright
+4. Forecasts (next-day and horizon-average volatility, conditional volatility
+   history) feed the Monte Carlo, stress-test and regime-detection modules
+
+Model:
+    h_t = ω + α ε²_{t-1} + β h_{t-1}
+Parameterized with variance targeting, ω = σ̄² (1 − α − β), and
+(persistence p = α + β, ARCH share s = α / p), both box-bounded in (0, 1),
+which keeps every fit covariance-stationary.
+"""
+
+import concurrent.futures
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils import state_store
+
+_LOG_2PI = np.log(2 * np.pi)
+_BOUNDS = (1e-4, 0.9999)
+_DEFAULT_START = (0.97, 0.10)  # persistence, ARCH share (α ≈ 0.10, β ≈ 0.87)
+
+
+def _unpack(x: np.ndarray, target_var: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(persistence, share) rows -> (omega, alpha, beta) vectors."""
+    persistence, share = x[:, 0], x[:, 1]
+    return target_var * (1 - persistence), persistence * share, persistence * (1 - share)
+
+
+def garch_neg_log_likelihood(
+    x: np.ndarray,
+    eps: np.ndarray,
+    mask: np.ndarray,
+    target_var: np.ndarray,
+    with_grad: bool = True,
+) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray], np.ndarray, np.ndarray]:
+    """
+    Per-asset Gaussian GARCH(1,1) negative log-likelihood for N series at once.
+
+    Missing observations (``mask`` False) do not contribute to the likelihood;
+    their squared shock is replaced by its conditional expectation h_t.
+
+    Args:
+        x (np.ndarray): (N, 2) array of (persistence, ARCH share)
+        eps (np.ndarray): (T, N) demeaned returns (any value where masked out)
+        mask (np.ndarray): (T, N) boolean, True where the return is observed
+        target_var (np.ndarray): (N,) unconditional variance used for targeting
+        with_grad (bool): Also return the gradient and the outer product of
+            per-observation scores (BHHH information matrix) w.r.t. ``x``
+
+    Returns:
+        tuple: (nll (N,), grad (N, 2) or None, opg (N, 2, 2) or None,
+            conditional variance (T, N), next-day variance forecast (N,))
+    """
+    omega, alpha, beta = _unpack(x, target_var)
+    persistence, share = x[:, 0], x[:, 1]
+    n_obs, n_assets = eps.shape
+    observed = mask.astype(float)
+    sq = np.where(mask, eps**2, 0.0)
+
+    h = target_var.copy()
+    # d h_t / d(persistence), d h_t / d(share)
+    dh_p = np.zeros(n_assets)
+    dh_s = np.zeros(n_assets)
+    log_h_sum = np.zeros(n_assets)
+    ratio_sum = np.zeros(n_assets)
+    g_p, g_s = np.zeros(n_assets), np.zeros(n_assets)
+    o_pp, o_ps, o_ss = np.zeros(n_assets), np.zeros(n_assets), np.zeros(n_assets)
+    variance = np.empty((n_obs, n_assets))
+
+    for t in range(n_obs):
+        variance[t] = h
+        w = observed[t]
+        ratio = sq[t] / h
+        log_h_sum += w * np.log(h)
+        ratio_sum += ratio  # sq is already 0 where unobserved
+        # Missing shocks are replaced by their expectation, so e²_t = h_t there
+        e2 = sq[t] + (1.0 - w) * h
+        if with_grad:
+            u = w * 0.5 * (1.0 - ratio) / h
+            s_p, s_s = u * dh_p, u * dh_s
+            g_p += s_p
+            g_s += s_s
+            o_pp += s_p * s_p
+            o_ps += s_p * s_s
+            o_ss += s_s * s_s
+            # h_{t+1} = σ̄²(1 − p) + p s e²_t + p (1 − s) h_t, differentiated in (p, s);
+            # e²_t depends on the parameters only where the shock is missing
+            carry = alpha * (1.0 - w) + beta
+            dh_p = -target_var + share * e2 + (1 - share) * h + carry * dh_p
+            dh_s = persistence * (e2 - h) + carry * dh_s
+        h = np.maximum(omega + alpha * e2 + beta * h, 1e-18)
+
+    nll = 0.5 * (observed.sum(axis=0) * _LOG_2PI + log_h_sum + ratio_sum)
+    if not with_grad:
+        return nll, None, None, variance, h
+    grad = np.column_stack([g_p, g_s])
+    opg = np.stack([np.column_stack([o_pp, o_ps]), np.column_stack([o_ps, o_ss])], axis=1)
+    return nll, grad, opg, variance, h
+
+
+def _fit_chunk(
+    eps: np.ndarray,
+    mask: np.ndarray,
+    target_var: np.ndarray,
+    x0: np.ndarray,
+    maxiter: int,
+    tol: float = 1e-8,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized BHHH (scoring) iterations for a chunk of assets.
+
+    The likelihood is separable across assets, so every asset takes its own
+    2x2 Newton-type step with its own backtracking line search, while each
+    likelihood evaluation is a single pass over the whole chunk. The number
+    of passes therefore depends on the iteration count, not on N.
+
+    Returns:
+        tuple: (parameters (N, 2), converged flags (N,))
+    """
+    lo, hi = _BOUNDS
+    x = np.clip(x0, lo, hi)
+    n_assets = x.shape[0]
+    converged = np.zeros(n_assets, dtype=bool)
+    ridge = 1e-8 * np.eye(2)
+
+    for _ in range(maxiter):
+        nll, grad, opg, _, _ = garch_neg_log_likelihood(x, eps, mask, target_var)
+        direction = -np.linalg.solve(opg + ridge, grad[:, :, None])[:, :, 0]
+        direction[converged] = 0.0
+
+        step = np.ones(n_assets)
+        accepted = converged.copy()
+        x_new = x.copy()
+        nll_new = nll.copy()
+        for _ in range(20):
+            trial = np.clip(x + step[:, None] * direction, lo, hi)
+            trial_nll = garch_neg_log_likelihood(trial, eps, mask, target_var, with_grad=False)[0]
+            ok = ~accepted & (trial_nll <= nll + 1e-4 * np.sum(grad * (trial - x), axis=1))
+            x_new[ok], nll_new[ok] = trial[ok], trial_nll[ok]
+            accepted |= ok
+            if accepted.all():
+                break
+            step[~accepted] *= 0.5
+
+        # Assets that cannot improve (line search exhausted) or barely move are done
+        improvement = nll - nll_new
+        converged |= ~accepted | (improvement <= tol * (1.0 + np.abs(nll)))
+        x = x_new
+        if converged.all():
+            break
+
+    return x, converged
+
+
+class GarchForecaster:
+    """
+    Batched GARCH(1,1) volatility forecaster for a universe of tickers.
+
+    After ``fit``:
+        params                  dict {ticker: fitted parameters and diagnostics}
+        conditional_volatility  pd.DataFrame (T, N) of in-sample σ_t
+        next_variance           pd.Series of one-day-ahead variance forecasts
+    """
+
+    # One state file per ticker, so workers fitting different tickers never
+    # overwrite each other's fits
+    STATE_NAMESPACE = "garch"
+
+    def __init__(
+        self,
+        persist: bool = True,
+        chunk_size: int = 250,
+        max_workers: int = 2,
+        maxiter: int = 100,
+        min_observations: int = 30,
+    ):
+        self.persist = persist
+        self.chunk_size = max(1, int(chunk_size))
+        self.max_workers = max(1, int(max_workers))
+        self.maxiter = maxiter
+        self.min_observations = min_observations
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.params: Dict[str, Dict] = {}
+        self.conditional_volatility: Optional[pd.DataFrame] = None
+        self.next_variance: Optional[pd.Series] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def fit(self, returns: pd.DataFrame, refit: bool = False) -> Dict[str, Dict]:
+        """
+        Fit GARCH(1,1) to every column of a returns matrix.
+
+        Args:
+            returns (pd.DataFrame): Daily returns, one column per ticker (NaN allowed)
+            refit (bool): Re-optimize even when a stored fit matches this data
+
+        Returns:
+            dict: {ticker: {'omega', 'alpha', 'beta', 'persistence', 'long_run_vol',
+                'next_day_vol', 'log_likelihood', 'warm_start', 'reused'}} or
+                {ticker: {'error': ...}} for series that are too short
+        """
+        returns = returns.astype(float)
+        counts = returns.notna().sum()
+        usable = [t for t in returns.columns if counts[t] >= self.min_observations]
+        results: Dict[str, Dict] = {
+            t: {"error": f"Need at least {self.min_observations} observations"}
+            for t in returns.columns if t not in usable
+        }
+        if not usable:
+            return results
+
+        data = returns[usable]
+        mask = data.notna().values
+        demeaned = (data - data.mean()).values
+        eps = np.where(mask, demeaned, 0.0)
+        target_var = np.where(mask, eps**2, 0.0).sum(axis=0) / mask.sum(axis=0)
+        fingerprint = self._fingerprint(data)
+
+        stored = self._load_state(usable) if self.persist else {}
+        x = np.tile(np.array(_DEFAULT_START), (len(usable), 1))
+        warm = np.zeros(len(usable), dtype=bool)
+        reused = np.zeros(len(usable), dtype=bool)
+        for i, ticker in enumerate(usable):
+            entry = stored.get(ticker)
+            if not entry:
+                continue
+            x[i] = (entry["persistence"], entry["alpha"] / entry["persistence"])
+            warm[i] = True
+            reused[i] = not refit and entry.get("fingerprint") == fingerprint[ticker]
+
+        to_fit = np.flatnonzero(~reused)
+        if len(to_fit):
+            self.logger.info(
+                f"Fitting GARCH(1,1) for {len(to_fit)} series "
+                f"({int(warm[to_fit].sum())} warm starts, {int(reused.sum())} reused)"
+            )
+            x[to_fit] = self._fit_parallel(eps[:, to_fit], mask[:, to_fit], target_var[to_fit], x[to_fit])
+
+        # One recursion over the whole universe for diagnostics and forecasts
+        nll, _, _, variance, next_var = garch_neg_log_likelihood(
+            x, eps, mask, target_var, with_grad=False
+        )
+        omega, alpha, beta = _unpack(x, target_var)
+
+        self.conditional_volatility = pd.DataFrame(
+            np.sqrt(variance), index=data.index, columns=usable
+        )
+        self.next_variance = pd.Series(next_var, index=usable)
+
+        for i, ticker in enumerate(usable):
+            self.params[ticker] = {
+                "omega": float(omega[i]),
+                "alpha": float(alpha[i]),
+                "beta": float(beta[i]),
+                "persistence": float(alpha[i] + beta[i]),
+                "long_run_vol": float(np.sqrt(target_var[i])),
+                "next_day_vol": float(np.sqrt(next_var[i])),
+                "log_likelihood": float(-nll[i]),
+                "fingerprint": fingerprint[ticker],
+            }
+            results[ticker] = {
+                k: v for k, v in self.params[ticker].items() if k != "fingerprint"
+            }
+            results[ticker].update(warm_start=bool(warm[i]), reused=bool(reused[i]))
+
+        if self.persist and len(to_fit):
+            self._save_state({usable[i]: self.params[usable[i]] for i in to_fit})
+
+        return results
+
+    def forecast(self, horizon: int = 1, tickers: Optional[List[str]] = None) -> pd.Series:
+        """
+        Average daily volatility expected over the next ``horizon`` days.
+
+        Uses the closed-form term structure
+        h_{T+k} = σ̄² + p^{k-1} (h_{T+1} − σ̄²).
+
+        Args:
+            horizon (int): Forecast horizon in trading days
+            tickers (list, optional): Subset of fitted tickers (default: all)
+
+        Returns:
+            pd.Series: Daily volatility per ticker (multiply by sqrt(horizon)
+                for the horizon volatility)
+        """
+        if self.next_variance is None:
+            raise RuntimeError("GarchForecaster.fit() must be called before forecast()")
+        tickers = list(tickers) if tickers is not None else list(self.next_variance.index)
+        horizon = max(1, int(horizon))
+
+        next_var = self.next_variance[tickers].values
+        long_run = np.array([self.params[t]["long_run_vol"] ** 2 for t in tickers])
+        persistence = np.array([self.params[t]["persistence"] for t in tickers])
+
+        k = np.arange(horizon)
+        decay = persistence[:, None] ** k[None, :]
+        mean_var = long_run + (next_var - long_run) * decay.mean(axis=1)
+        return pd.Series(np.sqrt(mean_var), index=tickers)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _fit_parallel(
+        self, eps: np.ndarray, mask: np.ndarray, target_var: np.ndarray, x0: np.ndarray
+    ) -> np.ndarray:
+        """Optimize chunks of assets concurrently and reassemble the parameters."""
+        n_assets = eps.shape[1]
+        chunks = [
+            slice(lo, min(n_assets, lo + self.chunk_size))
+            for lo in range(0, n_assets, self.chunk_size)
+        ]
+        x = x0.copy()
+
+        def run(chunk):
+            return chunk, _fit_chunk(
+                eps[:, chunk], mask[:, chunk], target_var[chunk], x0[chunk], self.maxiter
+            )
+
+        workers = min(self.max_workers, len(chunks))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            for chunk, (x_chunk, converged) in executor.map(run, chunks):
+                x[chunk] = x_chunk
+                if not converged.all():
+                    self.logger.debug(
+                        f"GARCH: {int((~converged).sum())} series in chunk {chunk} "
+                        f"hit the iteration cap"
+                    )
+        return x
+
+    @staticmethod
+    def _fingerprint(data: pd.DataFrame) -> Dict[str, str]:
+        """Identify the data a fit was made on: last observation date, count and value."""
+        values = data.values
+        mask = ~np.isnan(values)
+        last = len(data) - 1 - np.argmax(mask[::-1], axis=0)
+        counts = mask.sum(axis=0)
+        last_values = values[last, np.arange(values.shape[1])]
+        return {
+            ticker: f"{data.index[last[i]]}|{counts[i]}|{last_values[i]:.10g}"
+            for i, ticker in enumerate(data.columns)
+        }
+
+    def _load_state(self, tickers: List[str]) -> Dict[str, Dict]:
+        """Stored fits for ``tickers`` (tickers without a persisted fit are omitted)."""
+        stored = {}
+        for ticker in tickers:
+            entry = state_store.load_json(self.STATE_NAMESPACE, ticker)
+            # The ticker is stored too: keys are sanitized, so '^X' and '_X' share a file
+            if entry and entry.get("ticker") == ticker:
+                stored[ticker] = entry
+        return stored
+
+    def _save_state(self, updates: Dict[str, Dict]) -> None:
+        """Persist new fits, one state file per ticker."""
+        for ticker, entry in updates.items():
+            state_store.save_json(self.STATE_NAMESPACE, ticker, {**entry, "ticker": ticker})
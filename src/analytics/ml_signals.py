@@ -8,22 +8,44 @@ Five ML analytics functions for the ML Signals tab:
   4. compute_credit_risk_score     — Ensemble RF credit distress scorer (M3)
   5. compute_lstm_direction_signal — LSTM direction signal, env-gated (M6)
 
+iter_ml_signals_batch / compute_ml_signals_batch run the per-ticker signals for
+a whole watchlist on a process pool, yielding each ticker as it finishes.
+
 All functions return plain-Python dicts (numpy types converted to builtins).
 Chronological split (shuffle=False) enforced in all supervised training paths.
+
+Price history and the shared feature columns come from a per-ticker feature
+store (get_feature_frame): OHLCV is downloaded once per ticker, the momentum /
+technical / return columns are built once, and on later trading days only the
+new rows are fetched and featurized.
+
+Trained RF and LSTM direction models are kept in the on-disk model registry
+(src/analytics/model_registry.py), shared by all worker processes: requests
+between scheduled retrains (MODEL_RETRAIN_DAYS) only run inference, and RF
+retrains reuse the last searched hyperparameters until the next full search
+(MODEL_SEARCH_DAYS).
 """
 
 import logging
+import multiprocessing
+import os
 import threading
-from datetime import date
-from typing import Dict, List
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
-from cachetools import TTLCache
-from sklearn.cluster import KMeans
-from sklearn.decomposition import PCA
+import yfinance as yf
+from cachetools import LRUCache, TTLCache
+from joblib import Parallel, delayed
+from scipy.special import ndtr
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import RandomizedSearchCV
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import ParameterSampler, TimeSeriesSplit
 from sklearn.preprocessing import StandardScaler
 
 try:
@@ -34,7 +56,9 @@ except ImportError:
     keras = None
     KERAS_AVAILABLE = False
 
-from src.analytics.trading_indicators import fetch_ohlcv
+from src.analytics import model_registry
+from src.analytics.factor_pca import fit_pca, resolve_pca_method
+from src.analytics.trading_indicators import _key_lock, fetch_ohlcv
 
 logger = logging.getLogger(__name__)
 
@@ -54,13 +78,16 @@ def _today() -> str:
 
 
 def clear_ml_caches() -> None:
-    """Clear all ML signal caches. Intended for testing."""
+    """Clear all ML signal caches (including the feature store and loaded credit scorer). Intended for testing."""
     with _CACHE_LOCK:
         _rf_cache.clear()
         _pca_cache.clear()
         _regime_cache.clear()
         _credit_cache.clear()
         _lstm_cache.clear()
+        _feature_store.clear()
+    with _credit_model_lock:
+        _credit_model.clear()
 
 
 DARK_LAYOUT: dict = {
@@ -79,11 +106,31 @@ _RATIO_KEYS = [
 ]
 
 _RF_PARAM_DIST: dict = {
-    "n_estimators": [25, 50, 75, 100],
     "max_depth": [3, 4, 5, 6, 7],
     "min_samples_leaf": [1, 2, 5],
 }
 
+# Successive-halving search: every candidate starts with RF_SEARCH_MIN_TREES
+# trees; after each round the best 1/RF_SEARCH_FACTOR survive and their forests
+# grow by RF_SEARCH_FACTOR, up to RF_SEARCH_MAX_TREES. Scored by ROC AUC over a
+# time-series split; rounds stop early once RF_SEARCH_TIME_BUDGET (seconds) is spent,
+# but the winner is always trained with RF_SEARCH_MAX_TREES.
+RF_SEARCH_CANDIDATES = 12
+RF_SEARCH_MIN_TREES = 10
+RF_SEARCH_MAX_TREES = 100
+RF_SEARCH_FACTOR = 3
+RF_SEARCH_SPLITS = 3
+RF_SEARCH_TIME_BUDGET = 20.0
+
+# Calendar days a stored direction model serves inference before it is retrained
+MODEL_RETRAIN_DAYS = 7
+# Calendar days between full RF hyperparameter searches; retrains in between
+# refit with the last best parameters
+MODEL_SEARCH_DAYS = 28
+
+# Per-model train/load locks live only while some thread holds them
+_model_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
 _INSUF_DIRECTION: dict = {
     "insufficient_data": True,
     "signal": None,
@@ -132,6 +179,124 @@ def _compute_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
     )
 
 
+# ---------------------------------------------------------------------------
+# Feature store — one OHLCV download and feature build per ticker, extended daily
+# ---------------------------------------------------------------------------
+
+# Longest history any model uses (calendar-day convention of fetch_ohlcv)
+FEATURE_HISTORY_DAYS = 500
+# Short window fetched to extend a stored frame on a later trading day
+FEATURE_REFRESH_DAYS = 30
+
+_MOMENTUM_WINDOWS = [10, 25, 60, 120, 240]
+_DIRECTION_FEATURES = [f"Ret{w}" for w in _MOMENTUM_WINDOWS] + ["SMA_ratio", "RSI_ratio", "RC"]
+# Leading rows of a fresh history for which each feature column is undefined
+_FEATURE_LOOKBACK = {
+    **{f"Ret{w}": w for w in _MOMENTUM_WINDOWS},
+    "SMA_ratio": 14,
+    "RSI_ratio": 15,
+    "RC": 15,
+    "Return": 1,
+}
+_FEATURE_WARMUP_ROWS = max(_FEATURE_LOOKBACK.values()) + 1
+# Tickers whose feature frames are kept in memory (least recently used evicted);
+# a frame is ~500 rows of 14 columns, so a screened watchlist fits comfortably
+FEATURE_STORE_TICKERS = 256
+
+_feature_store: LRUCache = LRUCache(maxsize=FEATURE_STORE_TICKERS)
+# Per-ticker build locks live only while some thread holds them
+_feature_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+def _build_features(ohlcv: pd.DataFrame) -> pd.DataFrame:
+    """OHLCV plus every shared feature column (momentum, technical, daily return)."""
+    return pd.concat(
+        [
+            ohlcv,
+            _compute_momentum_features(ohlcv),
+            _compute_technical_indicators(ohlcv),
+            ohlcv["Close"].pct_change().rename("Return"),
+        ],
+        axis=1,
+    )
+
+
+def _history_start(last: pd.Timestamp, days: int) -> pd.Timestamp:
+    """First calendar day of a ``days`` window ending at ``last`` (fetch_ohlcv's 40% buffer)."""
+    return last - timedelta(days=int(days * 1.4))
+
+
+def _extend_features(entry: dict, ticker: str) -> dict:
+    """Append the trading days after the stored frame; rebuild if they cannot be stitched on."""
+    frame = entry["frame"]
+    recent = fetch_ohlcv(ticker, days=FEATURE_REFRESH_DAYS)
+    last = frame.index[-1]
+    overlap = recent.index[recent.index <= last]
+    # A gap, or restated (re-adjusted) closes on the overlapping days, forces a full rebuild
+    if len(overlap) == 0 or not np.allclose(
+        recent.loc[overlap, "Close"].values, frame.loc[overlap, "Close"].values, rtol=1e-6
+    ):
+        return _load_features(ticker)
+
+    new = recent[recent.index > last]
+    if not new.empty:
+        ohlcv = pd.concat([frame[list(new.columns)], new])
+        ohlcv = ohlcv[ohlcv.index >= _history_start(ohlcv.index[-1], FEATURE_HISTORY_DAYS)]
+        tail = _build_features(ohlcv.iloc[-(len(new) + _FEATURE_WARMUP_ROWS):]).iloc[-len(new):]
+        frame = pd.concat([frame.loc[ohlcv.index[0]:], tail])
+        logger.debug("Feature store: appended %d rows for %s", len(new), ticker)
+    return {"frame": frame, "as_of": _today()}
+
+
+def _load_features(ticker: str) -> dict:
+    """Download the full history for ``ticker`` and featurize it."""
+    ohlcv = fetch_ohlcv(ticker, days=FEATURE_HISTORY_DAYS)
+    return {"frame": _build_features(ohlcv), "as_of": _today()}
+
+
+def _feature_entry(ticker: str) -> dict:
+    """The stored feature-store entry for ``ticker``, built or extended to today first."""
+    key = ticker.upper()
+    # Per-ticker lock: concurrent model requests for one ticker share one download
+    with _key_lock(_feature_locks, key):
+        with _CACHE_LOCK:
+            entry = _feature_store.get(key)
+        if entry is None:
+            entry = _load_features(ticker)
+        elif entry["as_of"] != _today():
+            entry = _extend_features(entry, ticker)
+        with _CACHE_LOCK:
+            _feature_store[key] = entry
+    return entry
+
+
+def get_feature_frame(ticker: str, days: int = FEATURE_HISTORY_DAYS) -> pd.DataFrame:
+    """
+    OHLCV and shared feature columns for the last ``days`` of ``ticker``.
+
+    The frame is built once per ticker and extended on later trading days with
+    only the new rows. Feature values that depend on history before the
+    requested window are blanked, so the result matches a fresh download of
+    that window.
+
+    Args:
+        ticker: Stock ticker symbol
+        days:   Window in fetch_ohlcv's convention (at most FEATURE_HISTORY_DAYS)
+
+    Returns:
+        DataFrame with Open/High/Low/Close/Volume, Ret10..Ret240, SMA_ratio,
+        RSI_ratio, RC and Return columns
+
+    Raises:
+        ValueError: if no price data is available (as fetch_ohlcv)
+    """
+    frame = _feature_entry(ticker)["frame"]
+    window = frame[frame.index >= _history_start(frame.index[-1], min(days, FEATURE_HISTORY_DAYS))].copy()
+    for column, lookback in _FEATURE_LOOKBACK.items():
+        window.iloc[:lookback, window.columns.get_loc(column)] = np.nan
+    return window
+
+
 def _label_clusters(kmeans: KMeans) -> Dict[int, str]:
     """Assign Bull/Bear/Volatile/Ranging to cluster indices by centroid characteristics."""
     centroids = kmeans.cluster_centers_  # shape (4, 2): [mean_return, ann_vol]
@@ -168,6 +333,130 @@ def _make_sequences(arr: np.ndarray, seq_len: int = 20):
 # ---------------------------------------------------------------------------
 
 
+def _fit_direction_model(X_train: pd.DataFrame, y_train: pd.Series, params: Optional[dict]):
+    """Fit scaler + RF; search hyperparameters when ``params`` is None."""
+    scaler = StandardScaler()
+    X_train_sc = scaler.fit_transform(X_train)
+
+    if params is None:
+        params = _halving_search(X_train_sc, y_train.values)
+    rf = RandomForestClassifier(random_state=42, n_jobs=-1, **params)
+    rf.fit(X_train_sc, y_train.values)
+    return {"scaler": scaler, "model": rf}, params
+
+
+def _fold_auc(model: RandomForestClassifier, X: np.ndarray, y: np.ndarray) -> float:
+    """Validation ROC AUC, NaN when the fold holds a single class."""
+    if len(np.unique(y)) < 2 or len(model.classes_) < 2:
+        return float("nan")
+    return float(roc_auc_score(y, model.predict_proba(X)[:, 1]))
+
+
+def _grow_and_score(
+    rf: RandomForestClassifier, n_trees: int, X: np.ndarray, y: np.ndarray, train_idx, val_idx
+) -> float:
+    """Grow a warm-started fold forest to ``n_trees`` and score it on the validation fold."""
+    rf.set_params(n_estimators=n_trees)
+    rf.fit(X[train_idx], y[train_idx])
+    return _fold_auc(rf, X[val_idx], y[val_idx])
+
+
+def _halving_search(X: np.ndarray, y: np.ndarray, time_budget: Optional[float] = None) -> dict:
+    """
+    Successive-halving RF hyperparameter search with trees as the resource.
+
+    Candidates from _RF_PARAM_DIST are scored by mean ROC AUC over a
+    TimeSeriesSplit. Each round fits all surviving (candidate, fold) forests in
+    parallel; survivors keep their warm-started forests and only fit the added
+    trees in the next round. No new round starts once ``time_budget`` seconds
+    have elapsed: the best candidate of the last completed round wins. The
+    budget only caps the search; the returned parameters always ask for
+    RF_SEARCH_MAX_TREES trees, since they are stored and reused by retrains.
+
+    Args:
+        X (np.ndarray): Scaled training features (chronological)
+        y (np.ndarray): Binary targets
+        time_budget (float): Seconds; defaults to RF_SEARCH_TIME_BUDGET
+
+    Returns:
+        dict: Best parameters including 'n_estimators'
+    """
+    budget = RF_SEARCH_TIME_BUDGET if time_budget is None else time_budget
+    deadline = time.monotonic() + budget
+    folds = list(TimeSeriesSplit(n_splits=RF_SEARCH_SPLITS).split(X))
+    candidates = [
+        {k: int(v) if isinstance(v, np.integer) else v for k, v in params.items()}
+        for params in ParameterSampler(_RF_PARAM_DIST, RF_SEARCH_CANDIDATES, random_state=42)
+    ]
+    forests = {
+        c: [RandomForestClassifier(random_state=42, n_jobs=1, warm_start=True, **params) for _ in folds]
+        for c, params in enumerate(candidates)
+    }
+    alive = list(forests)
+    n_trees = RF_SEARCH_MIN_TREES
+
+    with Parallel(n_jobs=-1, prefer="threads") as parallel:
+        while True:
+            fold_scores = parallel(
+                delayed(_grow_and_score)(forests[c][f], n_trees, X, y, train_idx, val_idx)
+                for c in alive
+                for f, (train_idx, val_idx) in enumerate(folds)
+            )
+            fold_scores = np.asarray(fold_scores, dtype=float).reshape(len(alive), len(folds))
+            valid = ~np.isnan(fold_scores).all(axis=1)
+            scores = np.full(len(alive), -np.inf)
+            scores[valid] = np.nanmean(fold_scores[valid], axis=1)
+            ranked = [alive[i] for i in np.argsort(-scores, kind="stable")]
+
+            # Single survivor: nothing left to compare
+            if n_trees >= RF_SEARCH_MAX_TREES or len(ranked) < 2 or time.monotonic() >= deadline:
+                break
+            alive = ranked[: max(1, len(ranked) // RF_SEARCH_FACTOR)]
+            n_trees = min(n_trees * RF_SEARCH_FACTOR, RF_SEARCH_MAX_TREES)
+
+    logger.debug("RF halving search: best AUC %.3f at %d trees", float(scores.max()), n_trees)
+    return {**candidates[ranked[0]], "n_estimators": RF_SEARCH_MAX_TREES}
+
+
+def _direction_model(ticker: str, X: pd.DataFrame, y: pd.Series):
+    """
+    Registry-backed RF direction model for ``ticker``.
+
+    Returns the stored model while it is younger than MODEL_RETRAIN_DAYS and
+    was trained on the same feature columns; otherwise retrains on the first
+    80% of ``X`` (with the stored hyperparameters unless a search is due) and
+    publishes the result.
+
+    Returns:
+        tuple: ({'scaler', 'model'}, manifest, action) with action one of
+        'loaded', 'retrained' or 'searched'
+    """
+    today = _today()
+    feat_cols = list(X.columns)
+    with _key_lock(_model_locks, f"rf_direction_{ticker.upper()}"):
+        stored = model_registry.load_model("rf_direction", ticker)
+        manifest = stored[1] if stored is not None else {}
+        same_features = manifest.get("features") == feat_cols
+        if same_features and not model_registry.is_due(manifest.get("trained_on"), MODEL_RETRAIN_DAYS, today):
+            return stored[0], manifest, "loaded"
+
+        params, searched_on = None, today
+        if same_features and not model_registry.is_due(manifest.get("searched_on"), MODEL_SEARCH_DAYS, today):
+            params, searched_on = manifest.get("best_params"), manifest["searched_on"]
+
+        split_idx = int(len(X) * 0.8)
+        bundle, best_params = _fit_direction_model(X.iloc[:split_idx], y.iloc[:split_idx], params)
+        manifest = {
+            "trained_on": today,
+            "searched_on": searched_on,
+            "best_params": best_params,
+            "features": feat_cols,
+            "n_train": split_idx,
+        }
+        model_registry.save_model("rf_direction", ticker, bundle, manifest)
+        return bundle, manifest, "retrained" if params is not None else "searched"
+
+
 def compute_ml_direction_signal(ticker: str) -> dict:
     cache_key = (ticker.upper(), _today())
     with _CACHE_LOCK:
@@ -176,7 +465,7 @@ def compute_ml_direction_signal(ticker: str) -> dict:
             return _rf_cache[cache_key]
 
     try:
-        df = fetch_ohlcv(ticker, days=500)
+        df = get_feature_frame(ticker, days=500)
     except Exception as exc:
         logger.warning("fetch_ohlcv failed for %s: %s", ticker, exc)
         return _INSUF_DIRECTION
@@ -184,12 +473,10 @@ def compute_ml_direction_signal(ticker: str) -> dict:
     if len(df) < 265:
         return _INSUF_DIRECTION
 
-    mom = _compute_momentum_features(df)
-    tech = _compute_technical_indicators(df)
     forward_ret = df["Close"].pct_change(25).shift(-25)
     target = (forward_ret > 0).astype(int)
 
-    feature_df = pd.concat([mom, tech], axis=1)
+    feature_df = df[_DIRECTION_FEATURES].copy()
     feature_df["target"] = target
     feature_df = feature_df.dropna()
 
@@ -200,25 +487,9 @@ def compute_ml_direction_signal(ticker: str) -> dict:
     X = feature_df[feat_cols]
     y = feature_df["target"]
 
-    split_idx = int(len(X) * 0.8)
-    X_train = X.iloc[:split_idx]
-    y_train = y.iloc[:split_idx]
-
-    scaler = StandardScaler()
-    X_train_sc = scaler.fit_transform(X_train)
-    X_latest_sc = scaler.transform(X.iloc[[-1]])
-
-    search = RandomizedSearchCV(
-        RandomForestClassifier(random_state=42, n_jobs=-1),
-        _RF_PARAM_DIST,
-        n_iter=10,
-        cv=3,
-        scoring="roc_auc",
-        random_state=42,
-        n_jobs=-1,
-    )
-    search.fit(X_train_sc, y_train.values)
-    rf = search.best_estimator_
+    bundle, manifest, action = _direction_model(ticker, X, y)
+    rf = bundle["model"]
+    X_latest_sc = bundle["scaler"].transform(X.iloc[[-1]])
 
     proba = rf.predict_proba(X_latest_sc)[0]
     classes = list(rf.classes_)
@@ -248,16 +519,17 @@ def compute_ml_direction_signal(ticker: str) -> dict:
         },
         "xaxis": {"title": "Importance"},
     }
-    best_params = {
-        k: int(v) if isinstance(v, (np.integer,)) else v
-        for k, v in search.best_params_.items()
-    }
     result = {
         "signal": signal,
         "confidence": confidence,
-        "best_params": best_params,
+        "best_params": manifest["best_params"],
         "traces": traces,
         "layout": layout,
+        "model_update": {
+            "action": action,
+            "trained_on": manifest["trained_on"],
+            "searched_on": manifest["searched_on"],
+        },
     }
     with _CACHE_LOCK:
         _rf_cache[cache_key] = result
@@ -282,8 +554,7 @@ def compute_pca_decomposition(tickers: List[str]) -> dict:
     returns_map: Dict[str, pd.Series] = {}
     for t in tickers:
         try:
-            df = fetch_ohlcv(t, days=365)
-            returns_map[t] = df["Close"].pct_change().dropna()
+            returns_map[t] = get_feature_frame(t, days=365)["Return"].dropna()
         except Exception as exc:
             logger.warning("PCA: could not fetch %s: %s", t, exc)
 
@@ -295,11 +566,12 @@ def compute_pca_decomposition(tickers: List[str]) -> dict:
         return {"pca_available": False, "reason": "insufficient_data"}
 
     n_components = min(3, len(tickers), ret_df.shape[1])
+    # Top-3 components only: randomized SVD once the universe is index-sized
+    method = resolve_pca_method("auto", ret_df.shape[1])
     scaler = StandardScaler()
     X_sc = scaler.fit_transform(ret_df)
 
-    pca = PCA(n_components=n_components)
-    pca.fit(X_sc)
+    pca = fit_pca(X_sc, n_components, method)
 
     evr = [float(v) for v in pca.explained_variance_ratio_]
     while len(evr) < 3:
@@ -343,8 +615,7 @@ def compute_pca_decomposition(tickers: List[str]) -> dict:
 
     # PC variance attribution on raw (non-standardized) returns — shows how much of
     # actual portfolio variance each factor drives; orthogonal PCs → additive decomposition
-    pca_raw = PCA(n_components=n_components)
-    pca_raw.fit(ret_df.values)
+    pca_raw = fit_pca(ret_df.values, n_components, method)
     pc_var_shares = [float(v) for v in pca_raw.explained_variance_ratio_]
     pc_label_names_full = ["Market Factor", "Sector Tilt", "Curvature"]
     pc_contributions = [
@@ -392,8 +663,65 @@ _REGIME_COLOURS = {
 }
 _KM_TO_BINARY = {"Bull": "Bull", "Bear": "Bear", "Volatile": "Bear", "Ranging": None}
 
-
-def compute_kmeans_regime(ticker: str) -> dict:
+# Calendar days an incrementally updated K-Means model runs before a full refit
+REGIME_REFIT_DAYS = 90
+
+
+def _regime_clusters(ticker: str, regime_df: pd.DataFrame):
+    """
+    Registry-backed MiniBatchKMeans regime model for ``ticker``.
+
+    A full fit on ``regime_df`` names the clusters with _label_clusters. Later
+    calls ``partial_fit`` only the rows dated after the last update and keep
+    the stored cluster names, so a day's new data cannot swap regime labels.
+    Refits happen every REGIME_REFIT_DAYS.
+
+    Returns:
+        tuple: (model, {cluster index: regime name}, model_update dict)
+    """
+    today = _today()
+    with _key_lock(_model_locks, f"kmeans_regime_{ticker.upper()}"):
+        stored = model_registry.load_model("kmeans_regime", ticker)
+        if stored is not None and not model_registry.is_due(stored[1].get("fitted_on"), REGIME_REFIT_DAYS, today):
+            kmeans, manifest = stored
+            new_rows = regime_df[regime_df.index > pd.Timestamp(manifest["last_date"])]
+            action = "cached"
+            if len(new_rows):
+                kmeans.partial_fit(new_rows.values)
+                manifest = {**manifest, "trained_on": today, "last_date": str(new_rows.index[-1].date())}
+                model_registry.save_model("kmeans_regime", ticker, kmeans, manifest)
+                action = "incremental"
+        else:
+            kmeans = MiniBatchKMeans(n_clusters=4, n_init=10, batch_size=1024, random_state=42)
+            kmeans.fit(regime_df.values)
+            manifest = {
+                "trained_on": today,
+                "fitted_on": today,
+                "last_date": str(regime_df.index[-1].date()),
+                "labels": {str(k): v for k, v in _label_clusters(kmeans).items()},
+            }
+            model_registry.save_model("kmeans_regime", ticker, kmeans, manifest)
+            action = "refit"
+
+    label_map = {int(k): v for k, v in manifest["labels"].items()}
+    model_update = {"action": action, "fitted_on": manifest["fitted_on"], "updated_through": manifest["last_date"]}
+    return kmeans, label_map, model_update
+
+
+def compute_kmeans_regime(ticker: str, incremental: bool = True) -> dict:
+    """
+    K-Means market regime (Bull / Bear / Volatile / Ranging) over the last year.
+
+    Args:
+        ticker (str): Ticker symbol
+        incremental (bool): Use the persisted MiniBatchKMeans model, updated
+            with new days only (see _regime_clusters); False refits a full
+            KMeans on the window
+
+    Returns:
+        dict: current_regime, hmm_regime, models_agree, timeline traces, layout
+        (plus 'model_update' in incremental mode)
+    """
     _empty = {
         "current_regime": None,
         "hmm_regime": None,
@@ -401,19 +729,19 @@ def compute_kmeans_regime(ticker: str) -> dict:
         "regime_timeline_traces": [],
         "layout": DARK_LAYOUT,
     }
-    cache_key = (ticker.upper(), _today())
+    cache_key = (ticker.upper(), _today(), incremental)
     with _CACHE_LOCK:
         if cache_key in _regime_cache:
             logger.debug("Regime cache hit: %s", ticker)
             return _regime_cache[cache_key]
 
     try:
-        df = fetch_ohlcv(ticker, days=365)
+        df = get_feature_frame(ticker, days=365)
     except Exception as exc:
         logger.warning("K-Means: fetch failed for %s: %s", ticker, exc)
         return _empty
 
-    returns = df["Close"].pct_change().dropna()
+    returns = df["Return"].dropna()
     rolling_mean = returns.rolling(20).mean()
     rolling_vol = returns.rolling(20).std() * np.sqrt(252)
 
@@ -425,10 +753,15 @@ def compute_kmeans_regime(ticker: str) -> dict:
         return {**_empty, "current_regime": "Ranging"}
 
     X_regime = regime_df.values
-    kmeans = KMeans(n_clusters=4, n_init=10, random_state=42)
-    labels = kmeans.fit_predict(X_regime)
+    model_update = None
+    if incremental:
+        kmeans, label_map, model_update = _regime_clusters(ticker, regime_df)
+        labels = kmeans.predict(X_regime)
+    else:
+        kmeans = KMeans(n_clusters=4, n_init=10, random_state=42)
+        labels = kmeans.fit_predict(X_regime)
+        label_map = _label_clusters(kmeans)
 
-    label_map = _label_clusters(kmeans)
     named_labels = [label_map[int(lb)] for lb in labels]
     current_regime = named_labels[-1]
 
@@ -471,6 +804,8 @@ def compute_kmeans_regime(ticker: str) -> dict:
         "regime_timeline_traces": regime_timeline_traces,
         "layout": DARK_LAYOUT,
     }
+    if model_update is not None:
+        result["model_update"] = model_update
     with _CACHE_LOCK:
         _regime_cache[cache_key] = result
     return result
@@ -481,74 +816,165 @@ def compute_kmeans_regime(ticker: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def compute_credit_risk_score(ticker: str, ratios: dict) -> dict:
-    _CAVEAT = (
-        "Model trained on ratio thresholds — indicative only. Not a credit rating."
-    )
+_CREDIT_CAVEAT = "Model trained on ratio thresholds — indicative only. Not a credit rating."
+
+# Ratio defaults for missing inputs, in _RATIO_KEYS order
+_RATIO_DEFAULTS = np.array([1.5, 1.0, 0.10, 0.10, 0.05, 0.05])
+# Synthetic universe the shared scorer is trained on: (mean, std) per ratio, in
+# _RATIO_KEYS order; current ratio and leverage are floored at zero
+_CREDIT_UNIVERSE = np.array(
+    [[1.5, 1.0], [1.2, 1.5], [0.10, 0.20], [0.10, 0.20], [0.05, 0.15], [0.05, 0.25]]
+)
+CREDIT_UNIVERSE_SIZE = 5000
+# Bump to retrain the persisted scorer after changing the universe or the labels
+CREDIT_MODEL_VERSION = 1
+# Peer sample size of the per-ticker neighbourhood used for the degenerate-label check
+_CREDIT_PEERS = 200
+
+# yfinance fundamentals field and scale behind each ratio (debtToEquity is in percent)
+_RATIO_INFO_FIELDS = {
+    "current_ratio": ("currentRatio", 1.0),
+    "debt_to_equity": ("debtToEquity", 0.01),
+    "return_on_equity": ("returnOnEquity", 1.0),
+    "operating_margin": ("operatingMargins", 1.0),
+    "revenue_growth": ("revenueGrowth", 1.0),
+    "earnings_growth": ("earningsGrowth", 1.0),
+}
 
-    cache_key = (ticker.upper(), tuple(sorted(ratios.items())), _today())
-    with _CACHE_LOCK:
-        if cache_key in _credit_cache:
-            logger.debug("Credit cache hit: %s", ticker)
-            return _credit_cache[cache_key]
+_credit_model_lock = threading.Lock()
+_credit_model: Dict[str, object] = {}
 
-    np.random.seed(42)
-    n_synth = 200
-
-    de = float(ratios.get("debt_to_equity", 1.0))
-    eg = float(ratios.get("earnings_growth", 0.05))
-    cr = float(ratios.get("current_ratio", 1.5))
-    roe = float(ratios.get("return_on_equity", 0.10))
-    om = float(ratios.get("operating_margin", 0.10))
-    rg = float(ratios.get("revenue_growth", 0.05))
-
-    # Synthetic peers centred on input ratios; std_de proportional to de so that
-    # exceptionally low-leverage companies (de≈0) almost never cross the distress
-    # threshold (de>1.5), producing degenerate all-zero labels — by design.
-    std_de = max(2.0 * de, 0.2)
-    synth_de = np.clip(np.random.normal(de, std_de, n_synth), 0, None)
-    synth_eg = np.random.normal(eg, 0.20, n_synth)
-    synth_cr = np.clip(np.random.normal(cr, 0.8, n_synth), 0, None)
-    synth_roe = np.random.normal(roe, 0.15, n_synth)
-    synth_om = np.random.normal(om, 0.15, n_synth)
-    synth_rg = np.random.normal(rg, 0.10, n_synth)
-
-    X_synth = np.column_stack(
-        [synth_cr, synth_de, synth_roe, synth_om, synth_rg, synth_eg]
-    )
-    y_synth = ((synth_eg < -0.05) & (synth_de > 1.5)).astype(int)
-
-    if y_synth.sum() == 0 or (len(y_synth) - y_synth.sum()) == 0:
-        return {
-            "p_distress": None,
-            "degenerate_labels": True,
-            "insufficient_data": True,
-            "top_factors": [],
-            "caveat": _CAVEAT,
-        }
 
-    rf = RandomForestClassifier(n_estimators=50, max_depth=4, random_state=42)
-    rf.fit(X_synth, y_synth)
+def _distress_labels(X: np.ndarray) -> np.ndarray:
+    """Distress rule: earnings shrinking more than 5% on debt/equity above 1.5."""
+    return ((X[:, 5] < -0.05) & (X[:, 1] > 1.5)).astype(int)
 
-    ticker_vec = np.array([[cr, de, roe, om, rg, eg]], dtype=float)
+
+def _train_credit_model() -> dict:
+    """Fit the shared distress scorer on a broad synthetic ratio universe."""
+    rng = np.random.default_rng(42)
+    X = rng.normal(_CREDIT_UNIVERSE[:, 0], _CREDIT_UNIVERSE[:, 1], size=(CREDIT_UNIVERSE_SIZE, len(_RATIO_KEYS)))
+    X[:, :2] = np.clip(X[:, :2], 0, None)
+    rf = RandomForestClassifier(n_estimators=50, max_depth=4, random_state=42)
+    rf.fit(X, _distress_labels(X))
+    return {"model": rf, "train_mean": X.mean(axis=0)}
+
+
+def _get_credit_model() -> dict:
+    """Shared scorer: in-process copy, else the model registry, else trained once and stored."""
+    with _credit_model_lock:
+        if not _credit_model:
+            stored = model_registry.load_model("credit_risk", "synthetic")
+            if stored is not None and stored[1].get("version") == CREDIT_MODEL_VERSION:
+                bundle = stored[0]
+            else:
+                bundle = _train_credit_model()
+                manifest = {"trained_on": _today(), "version": CREDIT_MODEL_VERSION, "n_samples": CREDIT_UNIVERSE_SIZE}
+                model_registry.save_model("credit_risk", "synthetic", bundle, manifest)
+            _credit_model.update(bundle)
+        return dict(_credit_model)
+
+
+def _degenerate_neighbourhood(X: np.ndarray) -> np.ndarray:
+    """
+    Rows whose synthetic peer neighbourhood would hold (in expectation) fewer
+    than one distressed or one healthy company, i.e. too far from the distress
+    boundary for the score to mean anything.
+
+    Peers are N(de, max(2·de, 0.2)) for leverage and N(eg, 0.20) for earnings
+    growth, so the distressed share is a product of two normal tails.
+    """
+    de, eg = X[:, 1], X[:, 5]
+    p_de = ndtr((de - 1.5) / np.maximum(2.0 * de, 0.2))
+    p_eg = ndtr((-0.05 - eg) / 0.20)
+    expected = _CREDIT_PEERS * p_de * p_eg
+    return (expected < 1.0) | (expected > _CREDIT_PEERS - 1.0)
+
+
+def score_credit_risk_batch(ratios_by_ticker: Dict[str, dict]) -> Dict[str, dict]:
+    """
+    Credit distress scores for many tickers with one model call.
+
+    Args:
+        ratios_by_ticker (dict): {ticker: {ratio name: value}}; missing ratios
+            take the _RATIO_DEFAULTS values
+
+    Returns:
+        dict: {ticker: compute_credit_risk_score-style result}
+    """
+    tickers = list(ratios_by_ticker)
+    if not tickers:
+        return {}
+    X = np.tile(_RATIO_DEFAULTS, (len(tickers), 1))
+    for row, ticker in enumerate(tickers):
+        ratios = ratios_by_ticker[ticker] or {}
+        for col, key in enumerate(_RATIO_KEYS):
+            if key in ratios:
+                X[row, col] = float(ratios[key])
+
+    scorer = _get_credit_model()
+    rf = scorer["model"]
     classes = list(rf.classes_)
     pos_idx = classes.index(1) if 1 in classes else 0
-    p_distress = float(rf.predict_proba(ticker_vec)[0][pos_idx])
+    p_distress = rf.predict_proba(X)[:, pos_idx]
+    contributions = rf.feature_importances_ * np.abs(X - scorer["train_mean"])
+    top_idx = np.argsort(contributions, axis=1)[:, ::-1][:, :3]
+    degenerate = _degenerate_neighbourhood(X)
+
+    results = {}
+    for row, ticker in enumerate(tickers):
+        if degenerate[row]:
+            results[ticker] = {
+                "p_distress": None,
+                "degenerate_labels": True,
+                "insufficient_data": True,
+                "top_factors": [],
+                "caveat": _CREDIT_CAVEAT,
+            }
+            continue
+        results[ticker] = {
+            "p_distress": float(p_distress[row]),
+            "top_factors": [
+                {
+                    "name": _RATIO_KEYS[i],
+                    "value": float(X[row, i]),
+                    "contribution": float(contributions[row, i]),
+                }
+                for i in top_idx[row]
+            ],
+            "caveat": _CREDIT_CAVEAT,
+        }
+    return results
 
-    train_mean = X_synth.mean(axis=0)
-    contributions = rf.feature_importances_ * np.abs(ticker_vec[0] - train_mean)
-    top_idx = np.argsort(contributions)[::-1][:3]
 
-    top_factors = [
-        {
-            "name": _RATIO_KEYS[i],
-            "value": float(ticker_vec[0][i]),
-            "contribution": float(contributions[i]),
-        }
-        for i in top_idx
-    ]
+def fetch_credit_ratios(ticker: str) -> dict:
+    """
+    The scorer's ratios for ``ticker`` from yfinance fundamentals.
+
+    Ratios yfinance does not report are left out (the scorer uses its defaults).
+
+    Raises:
+        ValueError: if none of the ratios is reported
+    """
+    info = yf.Ticker(ticker).info or {}
+    ratios = {}
+    for key, (field, scale) in _RATIO_INFO_FIELDS.items():
+        value = info.get(field)
+        if isinstance(value, (int, float)) and np.isfinite(value):
+            ratios[key] = float(value) * scale
+    if not ratios:
+        raise ValueError(f"No credit ratios reported for {ticker}")
+    return ratios
 
-    result = {"p_distress": p_distress, "top_factors": top_factors, "caveat": _CAVEAT}
+
+def compute_credit_risk_score(ticker: str, ratios: dict) -> dict:
+    cache_key = (ticker.upper(), tuple(sorted(ratios.items())), _today())
+    with _CACHE_LOCK:
+        if cache_key in _credit_cache:
+            logger.debug("Credit cache hit: %s", ticker)
+            return _credit_cache[cache_key]
+
+    result = score_credit_risk_batch({ticker: ratios})[ticker]
     with _CACHE_LOCK:
         _credit_cache[cache_key] = result
     return result
@@ -559,6 +985,58 @@ def compute_credit_risk_score(ticker: str, ratios: dict) -> dict:
 # ---------------------------------------------------------------------------
 
 
+def _lstm_model(ticker: str, X: np.ndarray, y: np.ndarray):
+    """
+    Registry-backed LSTM direction model for ``ticker``.
+
+    Returns the stored model while it is younger than MODEL_RETRAIN_DAYS;
+    otherwise trains a new one on the first 80% of the sequences and publishes
+    it. The manifest carries the return scaler and the training loss curve.
+
+    Returns:
+        tuple: (keras model, manifest, action) with action 'loaded' or 'retrained'
+    """
+    today = _today()
+    with _key_lock(_model_locks, f"lstm_direction_{ticker.upper()}"):
+        stored = model_registry.load_model("lstm_direction", ticker)
+        if stored is not None and not model_registry.is_due(stored[1].get("trained_on"), MODEL_RETRAIN_DAYS, today):
+            return stored[0], stored[1], "loaded"
+
+        split_idx = int(len(X) * 0.8)
+        X_train = X[:split_idx]
+        y_train = y[:split_idx]
+
+        scaler = StandardScaler()
+        X_train_sc = scaler.fit_transform(X_train.reshape(-1, 1)).reshape(X_train.shape)
+
+        model = keras.Sequential(
+            [
+                keras.layers.Input(shape=(20, 1)),
+                keras.layers.LSTM(64),
+                keras.layers.Dense(32, activation="relu"),
+                keras.layers.Dense(1, activation="sigmoid"),
+            ]
+        )
+        model.compile(optimizer="adam", loss="binary_crossentropy")
+        history = model.fit(
+            X_train_sc,
+            y_train,
+            epochs=20,
+            batch_size=32,
+            validation_split=0.1,
+            verbose=0,
+        )
+        manifest = {
+            "trained_on": today,
+            "scaler_mean": float(scaler.mean_[0]),
+            "scaler_scale": float(scaler.scale_[0]),
+            "loss": [float(v) for v in history.history["loss"]],
+            "n_train": split_idx,
+        }
+        model_registry.save_model("lstm_direction", ticker, model, manifest, fmt="keras")
+        return model, manifest, "retrained"
+
+
 def compute_lstm_direction_signal(ticker: str) -> dict:
     if not KERAS_AVAILABLE:
         return {"lstm_available": False}
@@ -570,12 +1048,12 @@ def compute_lstm_direction_signal(ticker: str) -> dict:
             return _lstm_cache[cache_key]
 
     try:
-        df = fetch_ohlcv(ticker, days=500)
+        df = get_feature_frame(ticker, days=500)
     except Exception as exc:
         logger.warning("LSTM: fetch failed for %s: %s", ticker, exc)
         return {"lstm_available": False, "insufficient_data": True}
 
-    returns = df["Close"].pct_change().dropna().values.astype(np.float32)
+    returns = df["Return"].dropna().values.astype(np.float32)
 
     if len(returns) < 100:
         return {"lstm_available": False, "insufficient_data": True}
@@ -584,31 +1062,8 @@ def compute_lstm_direction_signal(ticker: str) -> dict:
     if len(X) < 50:
         return {"lstm_available": False, "insufficient_data": True}
 
-    split_idx = int(len(X) * 0.8)
-    X_train = X[:split_idx]
-    y_train = y[:split_idx]
-
-    scaler = StandardScaler()
-    X_train_sc = scaler.fit_transform(X_train.reshape(-1, 1)).reshape(X_train.shape)
-    X_latest_sc = scaler.transform(X[-1].reshape(-1, 1)).reshape(1, 20, 1)
-
-    model = keras.Sequential(
-        [
-            keras.layers.Input(shape=(20, 1)),
-            keras.layers.LSTM(64),
-            keras.layers.Dense(32, activation="relu"),
-            keras.layers.Dense(1, activation="sigmoid"),
-        ]
-    )
-    model.compile(optimizer="adam", loss="binary_crossentropy")
-    history = model.fit(
-        X_train_sc,
-        y_train,
-        epochs=20,
-        batch_size=32,
-        validation_split=0.1,
-        verbose=0,
-    )
+    model, manifest, action = _lstm_model(ticker, X, y)
+    X_latest_sc = ((X[-1] - manifest["scaler_mean"]) / manifest["scaler_scale"]).reshape(1, 20, 1)
 
     confidence = float(model.predict(X_latest_sc, verbose=0)[0][0])
     signal = "Bullish" if confidence >= 0.5 else "Bearish"
@@ -616,8 +1071,8 @@ def compute_lstm_direction_signal(ticker: str) -> dict:
     loss_curve_traces = [
         {
             "type": "scatter",
-            "x": list(range(len(history.history["loss"]))),
-            "y": [float(v) for v in history.history["loss"]],
+            "x": list(range(len(manifest["loss"]))),
+            "y": manifest["loss"],
             "name": "Train Loss",
             "marker": {"color": "#cba6f7"},
         }
@@ -629,7 +1084,257 @@ def compute_lstm_direction_signal(ticker: str) -> dict:
         "confidence": confidence,
         "loss_curve_traces": loss_curve_traces,
         "layout": DARK_LAYOUT,
+        "model_update": {"action": action, "trained_on": manifest["trained_on"]},
     }
     with _CACHE_LOCK:
         _lstm_cache[cache_key] = result
     return result
+
+
+# ---------------------------------------------------------------------------
+# 6. Batch signals (watchlist screening)
+# ---------------------------------------------------------------------------
+
+BATCH_FEATURES = ("direction", "regime", "credit", "lstm")
+# Worker processes for a batch (capped by the CPU count)
+BATCH_MAX_WORKERS = 4
+# Threads fetching per-ticker fundamentals and price history for a batch in the calling process
+BATCH_FETCH_THREADS = 8
+# Seconds one ticker (all requested features) may run before it is reported as timed out
+BATCH_TASK_TIMEOUT = 180.0
+
+# Result cache and key of each pooled feature's single-ticker function (keys as built
+# there), so a batch reuses signals this process computed today and keeps the new ones
+_BATCH_SIGNAL_CACHES = {
+    "direction": (_rf_cache, lambda ticker: (ticker, _today())),
+    "regime": (_regime_cache, lambda ticker: (ticker, _today(), True)),
+    "lstm": (_lstm_cache, lambda ticker: (ticker, _today())),
+}
+
+
+def _batch_task(ticker: str, features: Sequence[str], feature_entry: Optional[dict] = None) -> dict:
+    """
+    All requested signals for one ticker (runs in a worker process).
+
+    The features share the ticker's feature frame, so price history is
+    downloaded at most once per ticker; ``feature_entry`` is the entry the
+    calling process already built, so the worker starts from it instead of
+    downloading again. A failing feature does not fail the others.
+    """
+    started = time.monotonic()
+    if feature_entry is not None:
+        with _CACHE_LOCK:
+            _feature_store[ticker.upper()] = feature_entry
+    signals = {}
+    for feature in features:
+        try:
+            if feature == "direction":
+                signals[feature] = compute_ml_direction_signal(ticker)
+            elif feature == "regime":
+                signals[feature] = compute_kmeans_regime(ticker)
+            elif feature == "lstm":
+                signals[feature] = compute_lstm_direction_signal(ticker)
+        except Exception as exc:
+            logger.warning("Batch %s failed for %s: %s", feature, ticker, exc)
+            signals[feature] = {"error": str(exc)}
+    return {"ticker": ticker, "signals": signals, "elapsed": round(time.monotonic() - started, 3)}
+
+
+def _cached_signals(ticker: str, features: Sequence[str]) -> Dict[str, dict]:
+    """Signals for ``ticker`` already in this process's result caches for today."""
+    cached = {}
+    with _CACHE_LOCK:
+        for feature in features:
+            cache, key = _BATCH_SIGNAL_CACHES[feature]
+            result = cache.get(key(ticker))
+            if result is not None:
+                cached[feature] = result
+    return cached
+
+
+def _store_signals(ticker: str, signals: Dict[str, dict]) -> None:
+    """Keep signals computed by a worker in this process's result caches."""
+    with _CACHE_LOCK:
+        for feature, result in signals.items():
+            if feature in _BATCH_SIGNAL_CACHES and "error" not in result:
+                cache, key = _BATCH_SIGNAL_CACHES[feature]
+                cache[key(ticker)] = result
+
+
+def _prefetch_features(tickers: Sequence[str]) -> Dict[str, Optional[dict]]:
+    """
+    Feature-store entries for ``tickers``, built concurrently in this process.
+
+    A ticker whose download fails maps to None; its worker retries and reports
+    the failure per feature.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(BATCH_FETCH_THREADS, len(tickers)))) as pool:
+        futures = {ticker: pool.submit(_feature_entry, ticker) for ticker in tickers}
+    entries = {}
+    for ticker, future in futures.items():
+        try:
+            entries[ticker] = future.result()
+        except Exception as exc:
+            logger.warning("Batch feature prefetch failed for %s: %s", ticker, exc)
+            entries[ticker] = None
+    return entries
+
+
+def _batch_credit_scores(tickers: Sequence[str]) -> Dict[str, dict]:
+    """
+    Credit scores for a batch: each ticker's ratios are fetched concurrently
+    and all of them are scored with one model call.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(BATCH_FETCH_THREADS, len(tickers)))) as pool:
+        futures = {ticker: pool.submit(fetch_credit_ratios, ticker) for ticker in tickers}
+    ratios, failed = {}, {}
+    for ticker, future in futures.items():
+        try:
+            ratios[ticker] = future.result()
+        except Exception as exc:
+            logger.warning("Batch credit failed for %s: %s", ticker, exc)
+            failed[ticker] = {"error": str(exc)}
+    return {**score_credit_risk_batch(ratios), **failed}
+
+
+def _iter_pool(fn: Callable, tasks: List[tuple], max_workers: int, timeout: float) -> Iterator[tuple]:
+    """
+    Run ``fn(*task)`` for every task on a process pool, yielding in completion order.
+
+    Workers are started before any task, and at most ``max_workers`` tasks are
+    submitted at a time, so a task's timeout starts when a worker is free to
+    run it. A task still running after
+    ``timeout`` seconds is reported as TimeoutError and abandoned; its worker
+    is not counted as free until the task actually ends.
+
+    Yields:
+        tuple: (task, result or exception)
+    """
+    pending = list(reversed(tasks))
+    running: Dict[Future, tuple] = {}
+    abandoned = set()
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        # Start the workers first so process start-up is not charged to the first tasks
+        wait([executor.submit(int) for _ in range(max_workers)])
+        while pending or running:
+            abandoned = {f for f in abandoned if not f.done()}
+            while pending and len(running) + len(abandoned) < max_workers:
+                task = pending.pop()
+                running[executor.submit(fn, *task)] = (task, time.monotonic() + timeout)
+
+            if running:
+                wait_for = max(0.0, min(deadline for _, deadline in running.values()) - time.monotonic())
+                done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+            else:
+                # Every worker is still busy with an abandoned task
+                done, _ = wait(abandoned, return_when=FIRST_COMPLETED)
+                continue
+
+            now = time.monotonic()
+            for future in list(running):
+                task, deadline = running[future]
+                if future in done:
+                    del running[future]
+                    exc = future.exception()
+                    yield task, exc if exc is not None else future.result()
+                elif now >= deadline:
+                    del running[future]
+                    if not future.cancel():
+                        abandoned.add(future)
+                    yield task, TimeoutError(f"timed out after {timeout:.0f}s")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_ml_signals_batch(
+    tickers: Sequence[str],
+    features: Sequence[str] = ("direction", "regime"),
+    max_workers: Optional[int] = None,
+    timeout: float = BATCH_TASK_TIMEOUT,
+) -> Iterator[dict]:
+    """
+    ML signals for a watchlist, yielded per ticker as each one finishes.
+
+    Each ticker is one task computing all ``features`` in a worker process
+    (spawned, so no lock or TensorFlow state is inherited from the web
+    process). Signals this process already computed today are reused, price
+    history is downloaded and featurized here once per ticker and handed to
+    the workers, and signals the workers compute are kept in this process's
+    caches. Trained direction models come from the shared model registry,
+    so only stale or missing models are retrained. Credit scores are computed
+    here instead: every ticker's ratios are fetched (fetch_credit_ratios) and
+    scored together with score_credit_risk_batch.
+
+    Args:
+        tickers (list): Ticker symbols (duplicates are dropped)
+        features (list): Any of BATCH_FEATURES
+        max_workers (int): Worker processes; defaults to
+            min(BATCH_MAX_WORKERS, CPU count). 1 or less runs the tickers
+            sequentially in this process, without timeouts
+        timeout (float): Seconds per ticker before it is reported as timed out
+
+    Yields:
+        dict: {'ticker', 'signals': {feature: result}, 'elapsed'} or
+        {'ticker', 'error'} for a ticker that failed or timed out
+    """
+    unknown = [f for f in features if f not in BATCH_FEATURES]
+    if unknown:
+        raise ValueError(f"Unsupported features: {unknown}. Supported values: {list(BATCH_FEATURES)}")
+    features = list(dict.fromkeys(features))
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    if max_workers is None:
+        max_workers = min(BATCH_MAX_WORKERS, os.cpu_count() or 1)
+
+    credit = _batch_credit_scores(tickers) if "credit" in features and tickers else None
+    features = [f for f in features if f != "credit"]
+    cached = {ticker: _cached_signals(ticker, features) for ticker in tickers}
+    tasks = [(t, [f for f in features if f not in cached[t]]) for t in tickers]
+    tasks = [(t, missing) for t, missing in tasks if missing]
+
+    def finish(item: dict) -> dict:
+        if "signals" in item:
+            _store_signals(item["ticker"], item["signals"])
+            item["signals"] = {**cached[item["ticker"]], **item["signals"]}
+            if credit is not None:
+                item["signals"]["credit"] = credit[item["ticker"]]
+        return item
+
+    pending = {t for t, _ in tasks}
+    for ticker in tickers:
+        if ticker not in pending:
+            yield finish({"ticker": ticker, "signals": {}, "elapsed": 0.0})
+    for item in _iter_batch_tasks(tasks, min(max_workers, len(tasks)), timeout):
+        yield finish(item)
+
+
+def _iter_batch_tasks(tasks: List[tuple], max_workers: int, timeout: float) -> Iterator[dict]:
+    """_batch_task results per (ticker, features) task: in this process, or on a pool when max_workers > 1."""
+    if not tasks:
+        return
+    entries = _prefetch_features([ticker for ticker, _ in tasks])
+    tasks = [(ticker, features, entries[ticker]) for ticker, features in tasks]
+    if max_workers <= 1:
+        for task in tasks:
+            yield _batch_task(*task)
+        return
+
+    for (ticker, _, _), outcome in _iter_pool(_batch_task, tasks, max_workers, timeout):
+        if isinstance(outcome, BaseException):
+            logger.warning("Batch ML signals failed for %s: %s", ticker, outcome)
+            yield {"ticker": ticker, "error": str(outcome)}
+        else:
+            yield outcome
+
+
+def compute_ml_signals_batch(
+    tickers: Sequence[str],
+    features: Sequence[str] = ("direction", "regime"),
+    max_workers: Optional[int] = None,
+    timeout: float = BATCH_TASK_TIMEOUT,
+) -> Dict[str, dict]:
+    """Collected iter_ml_signals_batch results keyed by ticker."""
+    return {
+        item["ticker"]: item
+        for item in iter_ml_signals_batch(tickers, features, max_workers=max_workers, timeout=timeout)
+    }
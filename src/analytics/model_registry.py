@@ -0,0 +1,169 @@
+"""
+Model Registry
+
+On-disk store for trained ML signal models so that repeated requests are
+inference-only:
+1. Each model is saved under the local state store, keyed by model kind,
+   ticker and training date ("rf_direction_AAPL_2024-05-17.joblib"), together
+   with a small JSON manifest ("rf_direction_AAPL.json") that points at the
+   current version and carries its metadata (training date, hyperparameters,
+   feature columns, ...)
+2. scikit-learn estimators are stored with joblib, Keras models in the native
+   ``.keras`` format
+3. Callers decide when a stored model is stale with ``is_due`` (retrain
+   schedule) and may carry hyperparameters from the manifest into the retrain
+
+The manifest is written after the model file, so a reader always finds a
+complete model for the version it names. Every gunicorn worker on the host
+reads the same files; the previous version is kept so a worker holding the old
+manifest can still load it while another worker publishes a retrain.
+
+Model files are unpickled on load: the state directory must only be writable by
+the application.
+"""
+
+import glob
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import joblib
+
+from src.utils import state_store
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_NAMESPACE = "models"
+MODEL_FORMATS = ("joblib", "keras")
+# Model versions kept per kind and ticker (current + previous)
+KEEP_VERSIONS = 2
+
+_DATE_GLOB = "[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]"
+
+
+def _manifest_key(kind: str, ticker: str) -> str:
+    return f"{kind}_{ticker.upper()}"
+
+
+def _model_path(kind: str, ticker: str, trained_on: str, fmt: str) -> str:
+    key = f"{_manifest_key(kind, ticker)}_{trained_on}"
+    return state_store.state_path(REGISTRY_NAMESPACE, key, f".{fmt}")
+
+
+def _write_file(path: str, save_fn: Callable[[str], Any]) -> None:
+    """Write via ``save_fn(tmp_path)`` next to ``path`` and move it into place."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    suffix = os.path.splitext(path)[1]
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=f".tmp{suffix}")
+    os.close(fd)
+    try:
+        save_fn(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _prune(kind: str, ticker: str, fmt: str) -> None:
+    """Remove all but the newest KEEP_VERSIONS model files for ``kind`` and ``ticker``."""
+    placeholder = "0000-00-00"
+    pattern = _model_path(kind, ticker, placeholder, fmt).replace(placeholder, _DATE_GLOB)
+    for path in sorted(glob.glob(pattern))[:-KEEP_VERSIONS]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def is_due(stamp: Optional[str], days: int, today: Optional[str] = None) -> bool:
+    """
+    Whether ``days`` calendar days have passed since the ISO date ``stamp``.
+
+    A missing or unparseable stamp is always due.
+    """
+    if not stamp:
+        return True
+    try:
+        since = datetime.strptime(stamp, "%Y-%m-%d")
+    except ValueError:
+        return True
+    now = datetime.strptime(today, "%Y-%m-%d") if today else datetime.now()
+    return now >= since + timedelta(days=days)
+
+
+def load_manifest(kind: str, ticker: str) -> Optional[Dict[str, Any]]:
+    """Metadata of the current model version, or None if nothing is stored."""
+    return state_store.load_json(REGISTRY_NAMESPACE, _manifest_key(kind, ticker))
+
+
+def load_model(kind: str, ticker: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+    """
+    Load the current model for ``kind`` and ``ticker``.
+
+    Args:
+        kind (str): Model kind, e.g. 'rf_direction'
+        ticker (str): Ticker symbol
+
+    Returns:
+        tuple or None: (model, manifest), or None when nothing usable is stored
+    """
+    manifest = load_manifest(kind, ticker)
+    if manifest is None:
+        return None
+    fmt = manifest.get("format")
+    if fmt not in MODEL_FORMATS:
+        return None
+    path = _model_path(kind, ticker, manifest.get("trained_on", ""), fmt)
+    if not os.path.exists(path):
+        return None
+    try:
+        if fmt == "keras":
+            from tensorflow import keras
+
+            model = keras.models.load_model(path)
+        else:
+            model = joblib.load(path)
+    except Exception as e:
+        logger.warning(f"Could not load model {path}: {e}")
+        return None
+    return model, manifest
+
+
+def save_model(kind: str, ticker: str, model: Any, manifest: Dict[str, Any], fmt: str = "joblib") -> bool:
+    """
+    Store a trained model as the current version for ``kind`` and ``ticker``.
+
+    Args:
+        kind (str): Model kind, e.g. 'rf_direction'
+        ticker (str): Ticker symbol
+        model: Object to persist (anything joblib can pickle, or a Keras model)
+        manifest (dict): JSON-serializable metadata; must contain 'trained_on'
+            (ISO date), which becomes part of the model file name
+        fmt (str): 'joblib' or 'keras'
+
+    Returns:
+        bool: True if the model and its manifest were written
+    """
+    if fmt not in MODEL_FORMATS:
+        raise ValueError(f"Unsupported model format: {fmt}. Supported values: {list(MODEL_FORMATS)}")
+    if not manifest.get("trained_on"):
+        raise ValueError("manifest must contain 'trained_on'")
+
+    path = _model_path(kind, ticker, manifest["trained_on"], fmt)
+    try:
+        if fmt == "keras":
+            _write_file(path, model.save)
+        else:
+            _write_file(path, lambda tmp: joblib.dump(model, tmp))
+    except Exception as e:
+        logger.warning(f"Could not persist model to {path}: {e}")
+        return False
+
+    saved = state_store.save_json(REGISTRY_NAMESPACE, _manifest_key(kind, ticker), {**manifest, "format": fmt})
+    if saved:
+        _prune(kind, ticker, fmt)
+    return saved
@@ -4,20 +4,59 @@ Market Regime Detection Module
 Implements Hidden Markov Model (HMM) with Hamilton filter for detecting
 market regimes (calm vs. stressed) from historical returns.
 
-Based on Module 5: HMM, Hamilton filter, and MLE via L-BFGS-B.
+Based on Module 5: HMM, Hamilton filter, and MLE via L-BFGS-B. An EM
+(Baum-Welch) fitter with closed-form M-steps is available as an alternative;
+its random restarts can run in parallel worker processes and restarts that can
+no longer catch up with the leader are dropped early. Multi-ticker analysis
+downloads in threads and fits the tickers in the same worker processes.
 """
 
+import concurrent.futures
+import math
+import multiprocessing
+import os
+import threading
 import numpy as np
 import pandas as pd
 import logging
 from typing import Dict, List, Optional, Tuple
 from scipy.optimize import minimize
-from scipy.stats import norm
 import yfinance as yf
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+_HALF_LOG_2PI = 0.5 * np.log(2.0 * np.pi)
+
+FIT_METHODS = ("mle", "em")
+
+# EM restarts advance in rounds of this many iterations; after each round a
+# restart is dropped if, even improving at its last-round rate for every
+# remaining round, it would still finish more than EM_DOMINANCE_MARGIN
+# log-likelihood units behind the current leader.
+EM_ROUND_ITERATIONS = 10
+EM_DOMINANCE_MARGIN = 1.0
+
+# Worker processes shared by EM restarts and per-ticker fits. The pool is
+# started on first use and kept for the life of the process, so a request does
+# not pay the spawn and import start-up of fresh interpreters.
+REGIME_POOL_WORKERS = max(1, min(4, os.cpu_count() or 1))
+_process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _regime_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Return the shared worker pool, starting it on first use."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Spawned, not forked: the web app calls this from a multi-threaded process,
+            # and a forked child could inherit locks held by other threads
+            _process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=REGIME_POOL_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
 
 def _assign_labels(mu: np.ndarray, sigma: np.ndarray) -> tuple:
     """
@@ -53,6 +92,54 @@ def _assign_labels(mu: np.ndarray, sigma: np.ndarray) -> tuple:
     return calm_idx, stressed_idx, confidence
 
 
+def _em_round(
+    returns: np.ndarray,
+    mu: np.ndarray,
+    sigma: np.ndarray,
+    P: np.ndarray,
+    n_iter: int,
+    tol: float,
+) -> Dict:
+    """
+    Run up to ``n_iter`` Baum-Welch iterations from the given parameters.
+
+    Module-level so restarts can be dispatched to worker processes.
+
+    Returns:
+        dict with mu, sigma, P, log_likelihood (of the returned parameters),
+        iterations run and a converged flag
+    """
+    detector = RegimeDetector()
+    detector._set_params(mu, sigma, P)
+    filtered, log_lik = detector._hamilton_filter(returns)
+    converged = False
+    iterations = 0
+
+    for _ in range(n_iter):
+        detector._em_step(returns, filtered)
+        filtered, new_log_lik = detector._hamilton_filter(returns)
+        iterations += 1
+        improvement = new_log_lik - log_lik
+        log_lik = new_log_lik
+        if abs(improvement) < tol:
+            converged = True
+            break
+
+    return {
+        "mu": detector.mu,
+        "sigma": detector.sigma,
+        "P": detector.P,
+        "log_likelihood": log_lik,
+        "iterations": iterations,
+        "converged": converged,
+    }
+
+
+def _fit_ticker_task(ticker: str, returns: np.ndarray, volatility_model: str, method: str) -> Dict:
+    """Fit a fresh detector to one ticker's returns; module-level so it can run in a worker."""
+    return RegimeDetector()._fit_ticker(ticker, returns, volatility_model, method)
+
+
 class RegimeDetector:
     """
     Detects market regimes using a 2-state Hidden Markov Model.
@@ -84,6 +171,9 @@ class RegimeDetector:
         self.filtered_probs: Optional[np.ndarray] = None   # (T, n_states)
         self.smoothed_probs: Optional[np.ndarray] = None   # (T, n_states)
         self.log_likelihood: float = -np.inf
+        self.volatility_forecast: Optional[float] = None   # external next-day σ (e.g. GARCH)
+        self.fit_method: str = "mle"
+        self.em_iterations: Optional[int] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -119,20 +209,34 @@ class RegimeDetector:
         self.logger.info(f"Got {len(log_ret)} log-returns for {ticker}")
         return log_ret
 
-    def fit(self, returns: np.ndarray, n_restarts: int = 5) -> Dict:
+    def fit(
+        self,
+        returns: np.ndarray,
+        n_restarts: int = 5,
+        volatility_forecast: Optional[float] = None,
+        method: str = "mle",
+        n_jobs: int = 1,
+    ) -> Dict:
         """
-        Fit the 2-state HMM by maximum likelihood using L-BFGS-B.
+        Fit the 2-state HMM by maximum likelihood.
 
         Args:
             returns:    1-D array of observed returns
             n_restarts: number of random restarts to avoid local optima
+            volatility_forecast: optional next-day volatility forecast (e.g. from
+                GarchForecaster) reported against the fitted regime sigmas
+            method:     'mle' (L-BFGS-B on the Hamilton filter likelihood) or
+                'em' (Baum-Welch with closed-form M-steps)
+            n_jobs:     run the EM restarts on the shared worker pool when > 1
+                (1 = in-process, usually faster for a single short series)
 
         Returns:
             dict with fitted parameters and diagnostics
         """
-        best_ll = -np.inf
-        best_params = None
-
+        if method not in FIT_METHODS:
+            raise ValueError(
+                f"Unknown fit method '{method}'. Supported values: {list(FIT_METHODS)}"
+            )
         if returns is None:
             raise ValueError("returns must not be None")
         if not hasattr(returns, 'size') or returns.size == 0:
@@ -140,6 +244,27 @@ class RegimeDetector:
         if not np.all(np.isfinite(returns)):
             raise ValueError("returns contains non-finite values (NaN or Inf)")
 
+        self.fit_method = method
+        self.em_iterations = None
+        if method == "em":
+            self._fit_em(returns, n_restarts, n_jobs)
+        else:
+            self._fit_mle(returns, n_restarts)
+        self.volatility_forecast = volatility_forecast
+
+        # Run Hamilton filter to get filtered probabilities
+        self.filtered_probs, _ = self._hamilton_filter(returns)
+
+        # Run backward pass for smoothed probabilities
+        self.smoothed_probs = self._backward_smooth(returns, self.filtered_probs)
+
+        return self.build_result()
+
+    def _fit_mle(self, returns: np.ndarray, n_restarts: int) -> None:
+        """Sequential L-BFGS-B restarts on the negative log-likelihood."""
+        best_ll = -np.inf
+        best_params = None
+
         for trial in range(n_restarts):
             x0 = self._random_init(returns, trial)
             try:
@@ -164,22 +289,99 @@ class RegimeDetector:
         self._unpack_params(best_params)
         self.log_likelihood = best_ll
 
-        # Run Hamilton filter to get filtered probabilities
-        self.filtered_probs, _ = self._hamilton_filter(returns)
+    def _fit_em(
+        self,
+        returns: np.ndarray,
+        n_restarts: int,
+        n_jobs: int = 1,
+        max_iter: int = 500,
+        tol: float = 1e-6,
+    ) -> None:
+        """
+        Baum-Welch restarts advanced in rounds, on the shared worker pool when n_jobs > 1.
 
-        # Run backward pass for smoothed probabilities
-        self.smoothed_probs = self._backward_smooth(returns, self.filtered_probs)
+        After each round of EM_ROUND_ITERATIONS iterations, restarts that are
+        dominated by the leader (see EM_DOMINANCE_MARGIN) are dropped.
+        """
+        returns = np.asarray(returns, dtype=float)
+        restarts = {}
+        for trial in range(n_restarts):
+            self._unpack_params(self._random_init(returns, trial))
+            restarts[trial] = {
+                "mu": self.mu.copy(), "sigma": self.sigma.copy(), "P": self.P.copy(),
+                "log_likelihood": -np.inf, "iterations": 0, "converged": False,
+            }
 
-        return self._build_result(returns)
+        executor = _regime_pool() if int(n_jobs) > 1 and n_restarts > 1 else None
+        active = set(restarts)
+        while active:
+            submitted = {
+                trial: (restarts[trial], self._submit_em_round(executor, returns, restarts[trial], tol))
+                for trial in active
+            }
+            for trial, (previous, pending) in submitted.items():
+                try:
+                    state = pending.result() if executor else pending()
+                except Exception as e:
+                    self.logger.debug(f"EM restart {trial} failed: {e}")
+                    active.discard(trial)
+                    restarts[trial]["log_likelihood"] = -np.inf
+                    continue
+                state["iterations"] += previous["iterations"]
+                state["gain"] = state["log_likelihood"] - previous["log_likelihood"]
+                restarts[trial] = state
+                if state["converged"] or state["iterations"] >= max_iter:
+                    active.discard(trial)
+
+            best_ll = max(r["log_likelihood"] for r in restarts.values())
+            for trial in list(active):
+                state = restarts[trial]
+                remaining_rounds = math.ceil((max_iter - state["iterations"]) / EM_ROUND_ITERATIONS)
+                ceiling = state["log_likelihood"] + max(state["gain"], 0.0) * remaining_rounds
+                if ceiling < best_ll - EM_DOMINANCE_MARGIN:
+                    self.logger.debug(
+                        f"EM restart {trial} dropped after {state['iterations']} iterations "
+                        f"(LL {state['log_likelihood']:.2f} vs best {best_ll:.2f})"
+                    )
+                    active.discard(trial)
+
+        best = max(restarts.values(), key=lambda r: r["log_likelihood"])
+        if not np.isfinite(best["log_likelihood"]):
+            raise RuntimeError("HMM fitting failed on all restarts")
 
-    def analyze(self, tickers: List[str], days: int = 1260) -> Dict:
+        self._set_params(best["mu"], best["sigma"], best["P"])
+        self.log_likelihood = float(best["log_likelihood"])
+        self.em_iterations = int(best["iterations"])
+
+    @staticmethod
+    def _submit_em_round(executor, returns: np.ndarray, state: Dict, tol: float):
+        """Dispatch one EM round to the pool, or return a deferred in-process call."""
+        args = (returns, state["mu"], state["sigma"], state["P"], EM_ROUND_ITERATIONS, tol)
+        if executor is None:
+            return lambda: _em_round(*args)
+        return executor.submit(_em_round, *args)
+
+    def analyze(
+        self,
+        tickers: List[str],
+        days: int = 1260,
+        volatility_model: str = "historical",
+        method: str = "mle",
+        max_workers: int = 4,
+    ) -> Dict:
         """
         High-level wrapper: fetch returns for tickers, fit HMM, return results.
-        Uses the first ticker in the list (or '^VIX' if available).
+        The top-level result is for the first ticker ('SPY' if none given);
+        with several tickers they are downloaded in threads, fitted in the
+        shared worker processes, and every one is reported under 'tickers'.
 
         Args:
             tickers: list of stock ticker symbols
             days:    history length in calendar days
+            volatility_model: 'garch' adds a GARCH(1,1) next-day volatility
+                forecast to the result ('historical' = none, default)
+            method:  'mle' or 'em' (see fit)
+            max_workers: tickers downloaded concurrently (fits use the shared pool)
 
         Returns:
             dict with regime analysis results
@@ -187,61 +389,134 @@ class RegimeDetector:
         try:
             # Use first ticker if available, otherwise fall back to SPY
             primary = tickers[0] if len(tickers) > 0 else 'SPY'
-
-            returns = self.fetch_returns(primary, days=days)
-            result = self.fit(returns, n_restarts=3)
+            others = [t for t in dict.fromkeys(tickers[1:]) if t != primary]
+
+            if not others:
+                result = self._analyze_one(primary, days, volatility_model, method)
+                result['ticker_used'] = primary
+                return result
+
+            # Downloads are I/O and overlap in threads; the GIL-bound fits go to worker processes
+            workers = max(1, min(int(max_workers), len(others) + 1))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as downloads:
+                fetched = {
+                    ticker: downloads.submit(self.fetch_returns, ticker, days=days)
+                    for ticker in [primary] + others
+                }
+
+            per_ticker = {}
+            pool = _regime_pool()
+            futures = {}
+            for ticker in others:
+                try:
+                    futures[ticker] = pool.submit(
+                        _fit_ticker_task, ticker, fetched[ticker].result(), volatility_model, method
+                    )
+                except Exception as e:
+                    per_ticker[ticker] = self._ticker_error(ticker, e)
+
+            # The primary ticker is fitted on this instance, while the workers fit the
+            # others, so its parameters remain inspectable
+            try:
+                per_ticker[primary] = self._fit_ticker(
+                    primary, fetched[primary].result(), volatility_model, method
+                )
+            except Exception as e:
+                per_ticker[primary] = self._ticker_error(primary, e)
+            for ticker, future in futures.items():
+                try:
+                    per_ticker[ticker] = future.result()
+                except Exception as e:
+                    per_ticker[ticker] = self._ticker_error(ticker, e)
+            per_ticker = {ticker: per_ticker[ticker] for ticker in [primary] + others}
+
+            if 'error' in per_ticker[primary]:
+                raise RuntimeError(per_ticker[primary]['error'])
+            result = dict(per_ticker[primary])
             result['ticker_used'] = primary
+            result['tickers'] = per_ticker
             return result
 
         except Exception as e:
             self.logger.error(f"Regime detection failed: {e}")
             return {'error': str(e)}
 
+    def _ticker_error(self, ticker: str, error: Exception) -> Dict:
+        """Log a per-ticker failure and return its entry for the 'tickers' map."""
+        self.logger.warning(f"Regime detection failed for {ticker}: {error}")
+        return {'error': str(error)}
+
+    def _analyze_one(self, ticker: str, days: int, volatility_model: str, method: str) -> Dict:
+        """Fetch returns for one ticker and fit this detector to them."""
+        return self._fit_ticker(ticker, self.fetch_returns(ticker, days=days), volatility_model, method)
+
+    def _fit_ticker(self, ticker: str, returns: np.ndarray, volatility_model: str, method: str) -> Dict:
+        """Fit this detector to one ticker's returns, with the optional GARCH forecast."""
+        volatility_forecast = None
+        if volatility_model == "garch":
+            from src.analytics.garch_volatility import GarchForecaster
+
+            forecaster = GarchForecaster(persist=False)
+            forecaster.fit(pd.DataFrame({ticker: returns}))
+            volatility_forecast = float(forecaster.forecast(1)[ticker])
+        return self.fit(returns, n_restarts=3, volatility_forecast=volatility_forecast, method=method)
+
     # ------------------------------------------------------------------
     # Hamilton Filter
     # ------------------------------------------------------------------
 
+    def _log_emissions(self, returns: np.ndarray) -> np.ndarray:
+        """
+        Log emission densities log f(y_t | S_t = k) for every (t, k) in one
+        vectorized call.
+
+        Returns:
+            (T, n_states) array
+        """
+        z = (returns[:, None] - self.mu[None, :]) / self.sigma[None, :]
+        return -0.5 * z * z - np.log(self.sigma)[None, :] - _HALF_LOG_2PI
+
     def _hamilton_filter(
-        self, returns: np.ndarray
+        self, returns: np.ndarray, prob: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, float]:
         """
         Forward pass: compute filtered regime probabilities P(S_t | y_1..t).
 
+        ``prob`` is the predicted state distribution for the first return
+        (default: the initial distribution pi); passing the one-step prediction
+        from a previous run continues that filter over new observations.
+
+        Emissions are evaluated in log space and rescaled by their per-row
+        maximum before exponentiation, so extreme returns cannot underflow;
+        the recursion itself is the scaled forward loop, and the row offsets
+        are added back to the log-likelihood at the end.
+
         Returns:
             filtered (T, n_states), log-likelihood scalar
         """
-        T = len(returns)
-        K = self.n_states
-        filtered = np.zeros((T, K))
-        log_lik = 0.0
+        log_em = self._log_emissions(np.asarray(returns, dtype=float))
+        offsets = log_em.max(axis=1)
+        emission = np.exp(log_em - offsets[:, None])
 
-        # Initial distribution
-        prob = self.pi.copy()
+        T = len(emission)
+        filtered = np.empty_like(emission)
+        scale = np.empty(T)
+        P = self.P
+        prob = self.pi.copy() if prob is None else np.asarray(prob, dtype=float)
 
         for t in range(T):
-            # Emission probabilities
-            # f(y_t | S_t = k)
-            emission = np.array([
-                norm.pdf(returns[t], loc=self.mu[k], scale=self.sigma[k])
-                for k in range(K)
-            ])
-            emission = np.clip(emission, 1e-300, None)
-
-            # Joint: P(S_t=k, y_1..t) = P(S_t=k | y_1..t-1) * f(y_t | S_t=k)
-            joint = prob * emission
+            # Joint: P(S_t=k, y_t | y_1..t-1), up to the row offset
+            joint = prob * emission[t]
             lik_t = joint.sum()
             if lik_t < 1e-300:
                 lik_t = 1e-300
-            log_lik += np.log(lik_t)
-
+            scale[t] = lik_t
             # Filtered: P(S_t=k | y_1..t)
             filtered[t] = joint / lik_t
+            # Predict: P(S_{t+1}=j | y_1..t) = sum_k P[k, j] * filtered[t, k]
+            prob = filtered[t] @ P
 
-            # Predict: P(S_{t+1}=j | y_1..t) = sum_k P(S_{t+1}=j | S_t=k) * filtered[t,k]
-            prob = self.P.T @ filtered[t]
-            prob = np.clip(prob, 1e-300, None)
-            prob /= prob.sum()
-
+        log_lik = float(np.log(scale).sum() + offsets.sum())
         return filtered, log_lik
 
     def _backward_smooth(
@@ -251,24 +526,43 @@ class RegimeDetector:
         Backward pass (Kim smoother) for smoothed P(S_t | all data).
         """
         T = len(returns)
-        K = self.n_states
-        smoothed = np.zeros((T, K))
+        smoothed = np.empty_like(filtered)
         smoothed[-1] = filtered[-1]
+        if T < 2:
+            return smoothed
+
+        # Predicted next-state probabilities for every t at once
+        pred_next = np.clip(filtered[:-1] @ self.P, 1e-300, None)
 
         for t in range(T - 2, -1, -1):
-            # Predicted next state prob
-            pred_next = self.P.T @ filtered[t]
-            pred_next = np.clip(pred_next, 1e-300, None)
+            # smoothed[t, k] = filtered[t, k] * sum_j P[k, j] * smoothed[t+1, j] / pred_next[t, j]
+            row = filtered[t] * (self.P @ (smoothed[t + 1] / pred_next[t]))
+            s = row.sum()
+            smoothed[t] = row / s if s > 0 else row
 
-            for k in range(K):
-                ratio = (self.P[k, :] * smoothed[t + 1] / pred_next)
-                smoothed[t, k] = filtered[t, k] * ratio.sum()
+        return smoothed
 
-            s = smoothed[t].sum()
-            if s > 0:
-                smoothed[t] /= s
+    def _em_step(self, returns: np.ndarray, filtered: np.ndarray) -> None:
+        """
+        One Baum-Welch update given the filtered probabilities at the current
+        parameters: closed-form means, volatilities and transition matrix from
+        the smoothed state and transition posteriors.
+        """
+        smoothed = self._backward_smooth(returns, filtered)
+        pred_next = np.clip(filtered[:-1] @ self.P, 1e-300, None)
 
-        return smoothed
+        # Expected transition counts: sum_t P(S_t=i, S_{t+1}=j | all data)
+        counts = self.P * (filtered[:-1].T @ (smoothed[1:] / pred_next))
+        P = counts / np.clip(counts.sum(axis=1, keepdims=True), 1e-300, None)
+
+        weight = np.clip(smoothed.sum(axis=0), 1e-300, None)
+        mu = (smoothed.T @ returns) / weight
+        var = (smoothed * (returns[:, None] - mu[None, :]) ** 2).sum(axis=0) / weight
+        sigma = np.sqrt(np.maximum(var, 1e-10))
+
+        # Keep transitions strictly inside (0, 1), as the softmax parameterization does
+        P = np.clip(P, 1e-9, None)
+        self._set_params(mu, sigma, P / P.sum(axis=1, keepdims=True))
 
     # ------------------------------------------------------------------
     # Negative log-likelihood & helpers
@@ -289,7 +583,13 @@ class RegimeDetector:
         self.sigma = np.abs(params[K:2 * K]) + 1e-6
         # Transition probabilities via softmax within each row
         raw_P = params[2 * K:].reshape(K, K)
-        self.P = np.exp(raw_P) / np.exp(raw_P).sum(axis=1, keepdims=True)
+        self._set_params(self.mu, self.sigma, np.exp(raw_P) / np.exp(raw_P).sum(axis=1, keepdims=True))
+
+    def _set_params(self, mu: np.ndarray, sigma: np.ndarray, P: np.ndarray):
+        """Set state parameters; the initial distribution is the stationary one of P."""
+        self.mu = mu
+        self.sigma = sigma
+        self.P = P
         # Stationary distribution as initial pi
         vals, vecs = np.linalg.eig(self.P.T)
         stat = np.real(vecs[:, np.argmin(np.abs(vals - 1))])
@@ -317,22 +617,39 @@ class RegimeDetector:
     # Result builder
     # ------------------------------------------------------------------
 
-    def _build_result(self, returns: np.ndarray) -> Dict:
-        """Build output dict with regime info and trading signal."""
+    def build_result(
+        self, filtered_probs: Optional[np.ndarray] = None, log_likelihood: Optional[float] = None
+    ) -> Dict:
+        """
+        Build output dict with regime info and trading signal.
+
+        Args:
+            filtered_probs: (T, 2) filtered state probabilities to report
+                (defaults to those of the last fit)
+            log_likelihood: log-likelihood to report (defaults to the fit's)
+
+        Returns:
+            dict with regime analysis results for the T observations
+        """
         K = self.n_states
+        if filtered_probs is None:
+            filtered_probs = self.filtered_probs
+        if log_likelihood is None:
+            log_likelihood = self.log_likelihood
+        n_obs = len(filtered_probs)
 
         # Determine which state is "calm" using dual-criterion assignment (MATH-04 fix)
         calm_idx, stressed_idx, label_confidence = _assign_labels(self.mu, self.sigma)
 
         # Current regime: last filtered probability
-        current_probs = self.filtered_probs[-1].tolist()
-        current_regime_idx = int(np.argmax(self.filtered_probs[-1]))
+        current_probs = filtered_probs[-1].tolist()
+        current_regime_idx = int(np.argmax(filtered_probs[-1]))
         current_regime = 'calm' if current_regime_idx == calm_idx else 'stressed'
 
         # Regime sequence (0 = calm, 1 = stressed at each time step)
         regime_sequence = [
-            'calm' if int(np.argmax(self.filtered_probs[t])) == calm_idx else 'stressed'
-            for t in range(len(returns))
+            'calm' if int(np.argmax(filtered_probs[t])) == calm_idx else 'stressed'
+            for t in range(n_obs)
         ]
 
         # Fraction of time in stressed regime
@@ -375,16 +692,17 @@ class RegimeDetector:
         # Recent regime probabilities (last 20 observations)
         recent_filtered = [
             {
-                'calm_prob': float(self.filtered_probs[t, calm_idx]),
-                'stressed_prob': float(self.filtered_probs[t, stressed_idx])
+                'calm_prob': float(filtered_probs[t, calm_idx]),
+                'stressed_prob': float(filtered_probs[t, stressed_idx])
             }
-            for t in range(-min(20, len(returns)), 0)
+            for t in range(-min(20, n_obs), 0)
         ]
 
-        return {
+        result = {
             'model': '2-State HMM (Hamilton Filter)',
-            'log_likelihood': float(self.log_likelihood),
-            'n_observations': len(returns),
+            'fit_method': 'EM (Baum-Welch)' if self.fit_method == 'em' else 'MLE (L-BFGS-B)',
+            'log_likelihood': float(log_likelihood),
+            'n_observations': n_obs,
             'parameters': params_per_state,
             'transition_matrix': transition_matrix,
             'stationary_distribution': {
@@ -401,5 +719,20 @@ class RegimeDetector:
             'stress_fraction_historical': float(stress_fraction),
             'recent_filtered_probs': recent_filtered,
             'label_confidence': label_confidence,
-            'filtered_probs_full': self.filtered_probs.tolist(),  # expose full series for MATH-04/MATH-05 validation
+            'filtered_probs_full': filtered_probs.tolist(),  # expose full series for MATH-04/MATH-05 validation
         }
+
+        if self.em_iterations is not None:
+            result['em_iterations'] = self.em_iterations
+
+        if self.volatility_forecast is not None:
+            # Regime whose sigma is closest (in log terms) to the forecast volatility
+            log_gap = np.abs(np.log(self.sigma) - np.log(max(self.volatility_forecast, 1e-12)))
+            closest = int(np.argmin(log_gap))
+            result['volatility_forecast'] = {
+                'sigma_daily': float(self.volatility_forecast),
+                'sigma_annualized': float(self.volatility_forecast * np.sqrt(252)),
+                'closest_regime': 'calm' if closest == calm_idx else 'stressed',
+            }
+
+        return result
@@ -0,0 +1,266 @@
+"""
+Online Regime Updates
+
+Persisted 2-state HMM per ticker (and request window) so that daily dashboard
+refreshes do not re-run the multi-restart optimization:
+1. The first request fits the model (RegimeDetector.fit) and stores the
+   parameters together with the filtered probability path
+2. Later requests run the Hamilton filter forward over the returns dated after
+   the last stored day only, continuing from the stored one-step prediction,
+   so a refresh costs O(new days)
+3. Parameters are refit on a schedule (``refit_days``) or when the average
+   log-likelihood of the appended observations drifts more than
+   ``drift_threshold`` per observation from the in-sample average
+
+State lives in the local state store, so it is shared by every worker process
+and survives restarts.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from src.analytics.regime_detection import RegimeDetector
+from src.utils import state_store
+
+logger = logging.getLogger(__name__)
+
+# Calendar days after which parameters are refit regardless of fit quality
+DEFAULT_REFIT_DAYS = 30
+# Allowed gap (nats per observation) between the appended observations' and the
+# in-sample average log-likelihood before a refit is forced
+DEFAULT_DRIFT_THRESHOLD = 1.0
+# Appended observations needed before the drift test is applied
+DRIFT_MIN_OBSERVATIONS = 5
+
+
+class OnlineRegimeModel:
+    """
+    Persisted, incrementally updated regime model for one ticker and window.
+
+    Attributes:
+        ticker (str): Ticker symbol
+        window (str): Request window the state belongs to (e.g. start date or '1260d')
+        dates (np.ndarray | None): Trading days covered by ``filtered``
+        filtered (np.ndarray | None): (T, 2) filtered state probabilities
+        fitted_on (str | None): Calendar day of the last parameter fit
+        last_action (str | None): 'refit', 'incremental' or 'cached' for the last update
+        refit_reason (str | None): Why the last refit happened
+    """
+
+    STATE_NAMESPACE = "regime"
+
+    def __init__(
+        self,
+        ticker: str,
+        window: str = "default",
+        method: str = "mle",
+        n_restarts: int = 3,
+        n_jobs: int = 1,
+        refit_days: int = DEFAULT_REFIT_DAYS,
+        drift_threshold: float = DEFAULT_DRIFT_THRESHOLD,
+        persist: bool = True,
+    ):
+        self.ticker = ticker
+        self.window = str(window)
+        self.method = method
+        self.n_restarts = n_restarts
+        self.n_jobs = n_jobs
+        self.refit_days = refit_days
+        self.drift_threshold = drift_threshold
+        self.persist = persist
+        self.state_key = f"{ticker}_{self.window}"
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.detector: Optional[RegimeDetector] = None
+        self.dates: Optional[np.ndarray] = None
+        self.filtered: Optional[np.ndarray] = None
+        self.fit_log_likelihood = 0.0
+        self.fit_observations = 0
+        self.appended_log_likelihood = 0.0
+        self.appended_observations = 0
+        self.fitted_on: Optional[str] = None
+        self.last_action: Optional[str] = None
+        self.refit_reason: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def load(self) -> bool:
+        """
+        Restore the persisted model for this ticker and window.
+
+        Returns:
+            bool: True if a usable state was found
+        """
+        if self.detector is not None:
+            return True
+        if not self.persist:
+            return False
+        state = state_store.load_arrays(self.STATE_NAMESPACE, self.state_key)
+        if state is None:
+            return False
+
+        detector = RegimeDetector()
+        detector._set_params(state["mu"], state["sigma"], state["P"])
+        detector.fit_method = str(state["method"])
+        detector.log_likelihood = float(state["fit_log_likelihood"])
+        self.detector = detector
+        self.dates = state["dates"].astype(str)
+        self.filtered = state["filtered"]
+        self.fit_log_likelihood = float(state["fit_log_likelihood"])
+        self.fit_observations = int(state["fit_observations"])
+        self.appended_log_likelihood = float(state["appended_log_likelihood"])
+        self.appended_observations = int(state["appended_observations"])
+        self.fitted_on = str(state["fitted_on"])
+        return True
+
+    def update(self, dates: Sequence[str], returns: np.ndarray) -> "OnlineRegimeModel":
+        """
+        Bring the model up to date with ``returns``.
+
+        Only returns dated after the last stored day are filtered. The model is
+        refit on the full ``returns`` when there is no usable state, the
+        request starts before the stored path or its trading days differ from
+        it, the refit schedule is due, or the appended observations drift.
+
+        Args:
+            dates (sequence): ISO dates of ``returns`` (ascending)
+            returns (np.ndarray): Daily log-returns
+
+        Returns:
+            OnlineRegimeModel: self, for chaining
+        """
+        dates = np.asarray(dates).astype(str)
+        returns = np.asarray(returns, dtype=float)
+        if len(dates) != len(returns) or len(returns) == 0:
+            raise ValueError("dates and returns must be non-empty and of equal length")
+
+        reason = self._refit_reason(dates)
+        if reason is None:
+            new = dates > self.dates[-1]
+            if not new.any():
+                self.last_action = "cached"
+                return self
+            self._append(dates[new], returns[new])
+            reason = self._drift_reason()
+            if reason is None:
+                self.last_action = "incremental"
+                self._save()
+                return self
+
+        self._refit(dates, returns, reason)
+        self._save()
+        return self
+
+    def result(self, dates: Sequence[str]) -> Dict:
+        """
+        Regime analysis for ``dates`` (must be covered by the stored path), in
+        the RegimeDetector.fit result format plus a 'model_update' summary.
+
+        'log_likelihood' is that of the whole stored path under the current
+        parameters: the fit's plus that of the observations filtered since.
+        """
+        dates = np.asarray(dates).astype(str)
+        lo, hi = np.searchsorted(self.dates, [dates[0], dates[-1]])
+        result = self.detector.build_result(
+            self.filtered[lo: hi + 1],
+            log_likelihood=self.fit_log_likelihood + self.appended_log_likelihood,
+        )
+        result["model_update"] = {
+            "action": self.last_action,
+            "refit_reason": self.refit_reason,
+            "fitted_on": self.fitted_on,
+            "observations_since_fit": self.appended_observations,
+            "fit_log_likelihood": self.fit_log_likelihood,
+            "appended_log_likelihood": self.appended_log_likelihood,
+        }
+        return result
+
+    def analyze(self, dates: Sequence[str], returns: np.ndarray) -> Dict:
+        """Update with ``returns`` and return the result for their dates."""
+        return self.update(dates, returns).result(dates)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _refit_reason(self, dates: np.ndarray) -> Optional[str]:
+        """Why the stored model cannot simply be extended to ``dates`` (None = it can)."""
+        if not self.load():
+            return "no stored model"
+        if dates[0] < self.dates[0]:
+            return "window starts before stored history"
+        # The part of the request up to the last stored day must be exactly the
+        # stored path (same trading days), otherwise the filter cannot be continued
+        lo = int(np.searchsorted(self.dates, dates[0]))
+        overlap = dates[dates <= self.dates[-1]]
+        if len(overlap) == 0 or not np.array_equal(overlap, self.dates[lo: lo + len(overlap)]):
+            return "dates do not match stored history"
+        if dates[-1] > self.dates[-1] and lo + len(overlap) != len(self.dates):
+            return "dates do not match stored history"
+        due = datetime.strptime(self.fitted_on, "%Y-%m-%d") + timedelta(days=self.refit_days)
+        if datetime.now() >= due:
+            return "scheduled refit"
+        return None
+
+    def _drift_reason(self) -> Optional[str]:
+        """Refit reason if the appended observations fit markedly worse or better."""
+        if self.appended_observations < DRIFT_MIN_OBSERVATIONS or self.fit_observations == 0:
+            return None
+        in_sample = self.fit_log_likelihood / self.fit_observations
+        recent = self.appended_log_likelihood / self.appended_observations
+        if abs(recent - in_sample) > self.drift_threshold:
+            return f"log-likelihood drift ({recent:.2f} vs {in_sample:.2f} per observation)"
+        return None
+
+    def _append(self, dates: np.ndarray, returns: np.ndarray) -> None:
+        """Continue the Hamilton filter over returns dated after the stored path."""
+        detector = self.detector
+        prob = self.filtered[-1] @ detector.P
+        filtered, log_lik = detector._hamilton_filter(returns, prob=prob)
+        self.dates = np.concatenate([self.dates, dates])
+        self.filtered = np.vstack([self.filtered, filtered])
+        self.appended_log_likelihood += log_lik
+        self.appended_observations += len(returns)
+        self.logger.debug(f"{self.ticker}: filtered {len(returns)} new observations")
+
+    def _refit(self, dates: np.ndarray, returns: np.ndarray, reason: str) -> None:
+        """Fit the parameters on the full request and reset the stored path."""
+        self.logger.info(f"Refitting regime model for {self.ticker} ({reason})")
+        detector = RegimeDetector()
+        detector.fit(returns, n_restarts=self.n_restarts, method=self.method, n_jobs=self.n_jobs)
+        self.detector = detector
+        self.dates = dates
+        self.filtered = detector.filtered_probs
+        self.fit_log_likelihood = float(detector.log_likelihood)
+        self.fit_observations = len(returns)
+        self.appended_log_likelihood = 0.0
+        self.appended_observations = 0
+        self.fitted_on = datetime.now().strftime("%Y-%m-%d")
+        self.last_action = "refit"
+        self.refit_reason = reason
+
+    def _save(self) -> None:
+        """Persist parameters and the filtered path (no-op when persistence is disabled)."""
+        if not self.persist:
+            return
+        detector = self.detector
+        state_store.save_arrays(
+            self.STATE_NAMESPACE,
+            self.state_key,
+            mu=np.asarray(detector.mu),
+            sigma=np.asarray(detector.sigma),
+            P=np.asarray(detector.P),
+            method=np.array(detector.fit_method),
+            dates=self.dates.astype(str),
+            filtered=self.filtered,
+            fit_log_likelihood=np.array(self.fit_log_likelihood),
+            fit_observations=np.array(self.fit_observations),
+            appended_log_likelihood=np.array(self.appended_log_likelihood),
+            appended_observations=np.array(self.appended_observations),
+            fitted_on=np.array(self.fitted_on),
+        )
@@ -0,0 +1,63 @@
+"""
+Risk Statistics from Simulated Outcomes
+
+Selection-based tail statistics shared by the Monte Carlo, stress-test and
+scenario engines. VaR, Expected Shortfall and any list of percentiles are
+extracted with a single ``np.partition`` over the requested order statistics
+instead of full sorts plus one ``np.percentile`` call per level.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+
+def tail_statistics(
+    values: np.ndarray,
+    confidence_level: float,
+    percentiles: Iterable[float] = (),
+) -> Tuple[float, float, Dict[float, float]]:
+    """
+    Lower-tail quantile, tail mean and percentiles of simulated outcomes.
+
+    The quantile is the order statistic at index ``int((1 - confidence_level) * n)``
+    and the tail mean averages the values strictly below that index — the same
+    convention the sort-based VaR/ES code used. Percentiles match
+    ``np.percentile`` (linear interpolation). Because every statistic is an
+    order statistic, results for any increasing affine transform of ``values``
+    (P&L, percentage return) follow by applying the transform to the output.
+
+    Args:
+        values (np.ndarray): 1-D array of simulated outcomes (final values or P&L)
+        confidence_level (float): Confidence level (e.g., 0.95 for 95%)
+        percentiles (iterable): Percentile levels in [0, 100]
+
+    Returns:
+        tuple: (quantile, tail mean, {percentile: value}); the tail mean is NaN
+            when the tail is empty
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    n = values.size
+    tail_index = min(int((1 - confidence_level) * n), n - 1)
+
+    percentiles = [float(p) for p in percentiles]
+    positions = np.array(percentiles) / 100.0 * (n - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, n - 1)
+
+    kth = np.unique(np.concatenate(([tail_index], lower, upper)).astype(int))
+    part = np.partition(values, kth)
+
+    quantile = float(part[tail_index])
+    tail_mean = float(part[:tail_index].mean()) if tail_index > 0 else float("nan")
+
+    frac = positions - lower
+    levels = part[lower] + frac * (part[upper] - part[lower])
+    return quantile, tail_mean, {p: float(v) for p, v in zip(percentiles, levels)}
+
+
+def tail_indices(values: np.ndarray, ranks: Iterable[int]) -> np.ndarray:
+    """Indices of ``values`` ordered so each requested rank sits in its sorted position."""
+    values = np.asarray(values)
+    kth = np.unique(np.clip(np.asarray(list(ranks), dtype=int), 0, values.size - 1))
+    return np.argpartition(values, kth)
@@ -0,0 +1,173 @@
+"""
+Rolling-Window Statistics
+
+O(n) rolling moments for every column of a returns matrix at once. Window
+sums come from differences of cumulative sums, so each statistic costs a
+constant amount of work per day regardless of the window length:
+1. Rolling mean / volatility, Sharpe and Sortino ratios
+2. Rolling beta and correlation against a benchmark series
+3. Rolling historical VaR via an order-statistic window (skiplist,
+   O(n log w)) instead of a quantile per window
+
+Every function returns an (n, N) array aligned with the input rows; rows
+before the first full window, and windows containing a missing value, are NaN.
+Columns are demeaned by their full-sample mean before accumulation (all
+statistics below are shift-invariant or shifted back), which keeps the
+cumulative sums well conditioned over long histories.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing ``window``-row sums of each column, NaN for the first window - 1 rows."""
+    padded = np.cumsum(np.vstack([np.zeros((1, values.shape[1])), values]), axis=0)
+    out = np.full(values.shape, np.nan)
+    out[window - 1:] = padded[window:] - padded[:-window]
+    return out
+
+
+def _prepare(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Validate, demean and zero-fill; returns (centered, column means, full-window mask)."""
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    if not 1 < window <= len(values):
+        raise ValueError(f"window must be in [2, {len(values)}], got {window}")
+    valid = ~np.isnan(values)
+    center = np.nanmean(values, axis=0)
+    centered = np.where(valid, values - center, 0.0)
+    full = _window_sums(valid.astype(float), window) == window
+    return centered, center, full
+
+
+def rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and sample standard deviation (ddof=1) of each column.
+
+    Args:
+        values (np.ndarray): (n,) or (n, N) daily returns
+        window (int): Window length in rows
+
+    Returns:
+        tuple: (mean (n, N), std (n, N))
+    """
+    centered, center, full = _prepare(values, window)
+    s1 = _window_sums(centered, window)
+    s2 = _window_sums(centered**2, window)
+    mean = s1 / window
+    var = np.clip((s2 - window * mean**2) / (window - 1), 0.0, None)
+    mean, std = mean + center, np.sqrt(var)
+    return np.where(full, mean, np.nan), np.where(full, std, np.nan)
+
+
+def rolling_sharpe_sortino(
+    values: np.ndarray,
+    window: int,
+    risk_free_daily: float = 0.0,
+    periods_per_year: int = 252,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Annualized rolling Sharpe and Sortino ratios of each column.
+
+    The Sortino denominator is the downside deviation
+    ``sqrt(mean(min(r - rf, 0)^2))`` over the window.
+
+    Args:
+        values (np.ndarray): (n,) or (n, N) daily returns
+        window (int): Window length in rows
+        risk_free_daily (float): Daily risk-free rate subtracted from returns
+        periods_per_year (int): Annualization factor
+
+    Returns:
+        tuple: (sharpe (n, N), sortino (n, N)); NaN where the denominator is 0
+    """
+    values = np.asarray(values, dtype=float)
+    mean, std = rolling_mean_std(values, window)
+    excess = mean - risk_free_daily
+
+    if values.ndim == 1:
+        values = values[:, None]
+    downside = np.minimum(np.nan_to_num(values, nan=0.0) - risk_free_daily, 0.0)
+    downside_dev = np.sqrt(_window_sums(downside**2, window) / window)
+
+    scale = np.sqrt(periods_per_year)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sharpe = np.where(std > 0, excess / std * scale, np.nan)
+        sortino = np.where(downside_dev > 0, excess / downside_dev * scale, np.nan)
+    return sharpe, np.where(np.isnan(mean), np.nan, sortino)
+
+
+def rolling_beta_correlation(
+    benchmark: np.ndarray, values: np.ndarray, window: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling OLS beta and Pearson correlation of each column against a benchmark.
+
+    Args:
+        benchmark (np.ndarray): (n,) benchmark returns
+        values (np.ndarray): (n,) or (n, N) asset returns
+        window (int): Window length in rows
+
+    Returns:
+        tuple: (beta (n, N), correlation (n, N))
+    """
+    benchmark = np.asarray(benchmark, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    # A window needs both series; mask each column with the benchmark's gaps
+    values = np.where(np.isnan(benchmark)[:, None], np.nan, values)
+    y, _, full = _prepare(values, window)
+    x, _, x_full = _prepare(benchmark, window)
+    full &= x_full
+
+    sx = _window_sums(x, window)
+    sxx = _window_sums(x**2, window)
+    sy = _window_sums(y, window)
+    syy = _window_sums(y**2, window)
+    sxy = _window_sums(x * y, window)
+
+    cov = sxy - sx * sy / window
+    var_x = np.clip(sxx - sx**2 / window, 0.0, None)
+    var_y = np.clip(syy - sy**2 / window, 0.0, None)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        beta = np.where(var_x > 0, cov / var_x, np.nan)
+        corr = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+    return np.where(full, beta, np.nan), np.where(full, corr, np.nan)
+
+
+def rolling_historical_var(
+    values: np.ndarray, window: int, confidence_level: float = 0.95
+) -> np.ndarray:
+    """
+    Rolling one-day historical VaR (a positive loss fraction) of each column.
+
+    Uses the same order statistic as ``tail_statistics``: index
+    ``int((1 - confidence_level) * window)`` of the sorted window.
+
+    Args:
+        values (np.ndarray): (n,) or (n, N) daily returns
+        window (int): Window length in rows
+        confidence_level (float): Confidence level (e.g., 0.95 for 95%)
+
+    Returns:
+        np.ndarray: (n, N) VaR as a positive fraction of value
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    _prepare(values, window)
+    index = min(int((1 - confidence_level) * window), window - 1)
+    # 'lower' interpolation selects position floor(q * (window - 1)) == index
+    q = min(1.0, (index + 1e-9) / (window - 1))
+    quantile = (
+        pd.DataFrame(values)
+        .rolling(window, min_periods=window)
+        .quantile(q, interpolation="lower")
+        .values
+    )
+    return -quantile
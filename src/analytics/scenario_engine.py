@@ -0,0 +1,419 @@
+"""
+Multi-Asset Scenario Engine
+
+Reusable correlated Monte Carlo engine for portfolio risk:
+1. Factor the covariance matrix once (Cholesky, eigen fallback for near-singular matrices)
+2. Generate correlated Normal or multivariate Student-t (t-copula) shocks in chunks
+3. Evaluate several scenarios (base, stressed volatility, stressed correlation,
+   liquidity haircut) off the same shock tensor
+4. Per-asset contribution VaR / ES (Euler allocation) for every scenario
+"""
+
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .risk_statistics import tail_indices, tail_statistics
+
+
+def factorize_covariance(
+    matrix: np.ndarray, min_eigenvalue: float = 1e-12
+) -> Tuple[np.ndarray, str]:
+    """
+    Factor a covariance (or correlation) matrix as L @ L.T.
+
+    Tries Cholesky first; if the matrix is not numerically positive definite
+    (e.g. near-singular correlation with rho -> 1, or more assets than
+    observations) falls back to a symmetric eigen decomposition with
+    eigenvalues floored at ``min_eigenvalue``.
+
+    Args:
+        matrix (np.ndarray): Symmetric (n, n) matrix
+        min_eigenvalue (float): Floor applied to eigenvalues in the fallback
+
+    Returns:
+        tuple: (factor (n, n), method) where method is 'cholesky' or 'eigen'
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    matrix = 0.5 * (matrix + matrix.T)
+    try:
+        return np.linalg.cholesky(matrix), "cholesky"
+    except np.linalg.LinAlgError:
+        eigvals, eigvecs = np.linalg.eigh(matrix)
+        eigvals = np.clip(eigvals, min_eigenvalue, None)
+        return eigvecs * np.sqrt(eigvals), "eigen"
+
+
+class ScenarioEngine:
+    """
+    Correlated multi-asset Monte Carlo scenario engine.
+
+    The historical covariance is factored once at construction. Scenarios are
+    expressed as transforms of that factor, so a stressed-volatility scenario
+    is a diagonal rescale of the base factor and only a stressed-correlation
+    scenario needs a new (n, n) factorization. Every scenario consumes the
+    same standard-normal shock block, which keeps scenario comparisons free
+    of sampling noise.
+
+    Scenario specification (dict):
+        name (str):                  label used in results
+        vol_multiplier (float|array): scalar or per-asset volatility multiplier (default 1.0)
+        correlation (float|None):    constant pairwise correlation override (default: historical)
+        fat_tails (bool):            apply multivariate Student-t scaling (default False)
+        downside_multiplier (float): amplification of negative asset shocks (default 1.0)
+        haircut (float):             liquidity cost subtracted from portfolio return (default 0.0)
+    """
+
+    DEFAULT_SCENARIOS: List[Dict] = [
+        {"name": "Base Case"},
+        {"name": "Stressed Volatility", "vol_multiplier": 3.0},
+        {"name": "Stressed Correlation", "correlation": 0.95},
+        {"name": "Liquidity Haircut", "haircut": 0.02},
+    ]
+
+    def __init__(
+        self,
+        returns: pd.DataFrame,
+        weights: Optional[Dict[str, float]] = None,
+        use_drift: bool = True,
+        volatility: Optional[Union[Dict[str, float], pd.Series]] = None,
+        covariance: Optional[pd.DataFrame] = None,
+    ):
+        """
+        Initialize the engine from a historical returns matrix
+
+        Args:
+            returns (pd.DataFrame): Daily returns, one column per asset
+            weights (dict, optional): Portfolio weights by ticker (equal weights if None).
+                Weights are normalized to sum to 1.
+            use_drift (bool): Add the historical mean return to simulated shocks
+            volatility (dict | pd.Series, optional): Daily volatility forecasts by ticker
+                (e.g. GARCH) replacing the sample volatility; correlations stay
+                historical and tickers without a forecast keep their sample value
+            covariance (pd.DataFrame, optional): Daily covariance by ticker (e.g. EWMA)
+                replacing the sample covariance; missing entries keep their sample value.
+                Applied before the ``volatility`` override
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        returns = returns.dropna(axis=1, how="all").dropna()
+        if returns.empty or len(returns.columns) == 0:
+            raise ValueError("ScenarioEngine requires a non-empty returns matrix")
+
+        self.tickers: List[str] = list(returns.columns)
+        self.n_assets = len(self.tickers)
+        self.n_observations = len(returns)
+
+        values = returns.values.astype(float)
+        self.mean = values.mean(axis=0) if use_drift else np.zeros(self.n_assets)
+        self.cov = np.atleast_2d(np.cov(values, rowvar=False))
+        if covariance is not None:
+            override = covariance.reindex(index=self.tickers, columns=self.tickers).values
+            self.cov = np.where(np.isnan(override), self.cov, override)
+        self.vol = np.sqrt(np.clip(np.diag(self.cov), 0.0, None))
+
+        safe_vol = np.where(self.vol > 0, self.vol, 1.0)
+        self.corr = self.cov / np.outer(safe_vol, safe_vol)
+        np.fill_diagonal(self.corr, 1.0)
+
+        if volatility is not None:
+            forecast = pd.Series(volatility, dtype=float).reindex(self.tickers)
+            self.vol = np.where(forecast.notna(), forecast.values, self.vol)
+            self.cov = self.corr * np.outer(self.vol, self.vol)
+
+        if weights:
+            w = np.array([float(weights.get(t, 0.0)) for t in self.tickers])
+        else:
+            w = np.ones(self.n_assets)
+        total = w.sum()
+        self.weights = w / total if total > 0 else np.full(self.n_assets, 1.0 / self.n_assets)
+
+        self.factor, self.factorization = factorize_covariance(self.cov)
+        if self.factorization != "cholesky":
+            self.logger.info(
+                f"Covariance not positive definite for {self.n_assets} assets - using eigen factorization"
+            )
+
+    # ------------------------------------------------------------------
+    # Shock generation
+    # ------------------------------------------------------------------
+
+    def generate_shocks(
+        self,
+        simulations: int,
+        degrees_of_freedom: Optional[float] = None,
+        chunk_size: int = 20000,
+        seed: Optional[int] = None,
+    ) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """
+        Yield independent standard-normal shock blocks in chunks.
+
+        Args:
+            simulations (int): Total number of scenarios
+            degrees_of_freedom (float, optional): If given, also draw the
+                chi-squared mixing variable for multivariate Student-t shocks
+            chunk_size (int): Maximum rows per block (bounds peak memory)
+            seed (int, optional): Seed for a local numpy Generator
+
+        Yields:
+            tuple: (Z (m, n_assets), t_scale (m,) or None)
+        """
+        if simulations <= 0:
+            raise ValueError("simulations must be positive")
+        rng = np.random.default_rng(seed)
+        chunk_size = max(1, int(chunk_size))
+        for start in range(0, simulations, chunk_size):
+            m = min(chunk_size, simulations - start)
+            Z = rng.standard_normal((m, self.n_assets))
+            t_scale = None
+            if degrees_of_freedom is not None:
+                W = rng.chisquare(degrees_of_freedom, size=m)
+                t_scale = np.sqrt(degrees_of_freedom / W)
+            yield Z, t_scale
+
+    @staticmethod
+    def _scenario_names(scenarios: List[Dict]) -> List[str]:
+        """Scenario names, defaulting to 'Scenario <position>'; must be unique."""
+        names = [s.get("name", f"Scenario {i + 1}") for i, s in enumerate(scenarios)]
+        if len(set(names)) != len(names):
+            raise ValueError("Scenario names must be unique")
+        return names
+
+    def _scenario_factor(self, scenario: Dict) -> np.ndarray:
+        """Return the (n, n) shock factor for a scenario without refactoring when possible."""
+        multiplier = np.broadcast_to(
+            np.asarray(scenario.get("vol_multiplier", 1.0), dtype=float), (self.n_assets,)
+        )
+        rho = scenario.get("correlation")
+        if rho is None:
+            # cov_s = M cov M  =>  factor_s = M L
+            return multiplier[:, None] * self.factor
+
+        corr = np.full((self.n_assets, self.n_assets), float(rho))
+        np.fill_diagonal(corr, 1.0)
+        vol = self.vol * multiplier
+        factor, _ = factorize_covariance(corr * np.outer(vol, vol))
+        return factor
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def simulate(
+        self,
+        scenarios: Optional[List[Dict]] = None,
+        simulations: int = 10000,
+        horizon_days: int = 1,
+        degrees_of_freedom: float = 5.0,
+        standardize_t: bool = True,
+        chunk_size: int = 20000,
+        seed: Optional[int] = None,
+        keep_asset_returns: bool = True,
+    ) -> Dict[str, Dict[str, Optional[np.ndarray]]]:
+        """
+        Simulate portfolio returns for every scenario off one shock tensor.
+
+        Multi-day horizons use square-root-of-time scaling of daily shocks
+        (drift * h, volatility * sqrt(h)).
+
+        Args:
+            scenarios (list, optional): Scenario specs (defaults to DEFAULT_SCENARIOS)
+            simulations (int): Number of Monte Carlo scenarios
+            horizon_days (int): Risk horizon in trading days
+            degrees_of_freedom (float): DoF for fat-tailed scenarios
+            standardize_t (bool): Rescale Student-t shocks to unit variance so
+                that ``vol_multiplier`` keeps its meaning (requires DoF > 2)
+            chunk_size (int): Rows of shocks generated per block
+            seed (int, optional): Seed for reproducible shocks
+            keep_asset_returns (bool): Keep weighted per-asset returns for contribution VaR
+
+        Returns:
+            dict: {scenario name: {'portfolio': (sims,), 'assets': (sims, n) or None}}
+        """
+        scenarios = scenarios or self.DEFAULT_SCENARIOS
+        names = self._scenario_names(scenarios)
+
+        needs_t = any(s.get("fat_tails") for s in scenarios)
+        t_norm = 1.0
+        if needs_t and standardize_t and degrees_of_freedom > 2:
+            t_norm = np.sqrt((degrees_of_freedom - 2.0) / degrees_of_freedom)
+
+        factors = [self._scenario_factor(s).T for s in scenarios]
+        sqrt_h = np.sqrt(horizon_days)
+        drift = self.mean * horizon_days
+
+        out: Dict[str, Dict[str, Optional[np.ndarray]]] = {
+            name: {
+                "portfolio": np.empty(simulations),
+                "assets": (
+                    np.empty((simulations, self.n_assets)) if keep_asset_returns else None
+                ),
+            }
+            for name in names
+        }
+
+        row = 0
+        for Z, t_scale in self.generate_shocks(
+            simulations,
+            degrees_of_freedom=degrees_of_freedom if needs_t else None,
+            chunk_size=chunk_size,
+            seed=seed,
+        ):
+            m = len(Z)
+            for name, spec, factor_t in zip(names, scenarios, factors):
+                eps = Z @ factor_t
+                if spec.get("fat_tails"):
+                    eps *= (t_scale * t_norm)[:, None]
+                downside = float(spec.get("downside_multiplier", 1.0))
+                if downside != 1.0:
+                    eps[eps < 0] *= downside
+                asset_returns = (drift + sqrt_h * eps) * self.weights
+                out[name]["portfolio"][row:row + m] = (
+                    asset_returns.sum(axis=1) - float(spec.get("haircut", 0.0))
+                )
+                if keep_asset_returns:
+                    out[name]["assets"][row:row + m] = asset_returns
+            row += m
+
+        return out
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def contribution_var(
+        self,
+        simulated: Dict[str, Optional[np.ndarray]],
+        confidence_level: float = 0.95,
+        initial_investment: float = 100000,
+        window: float = 0.005,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Per-asset Euler contributions to VaR and ES for one simulated scenario.
+
+        Contribution VaR averages each asset's weighted loss over the scenarios
+        whose portfolio loss lies within ``window`` (fraction of simulations)
+        of the VaR order statistic. Contribution ES averages over the whole
+        tail. Both sum (up to the liquidity haircut) to the portfolio figure.
+
+        Args:
+            simulated (dict): One entry of ``simulate()`` output
+            confidence_level (float): Confidence level (e.g. 0.95)
+            initial_investment (float): Portfolio value used to express dollars
+            window (float): Half-width of the VaR neighbourhood as a fraction of simulations
+
+        Returns:
+            dict: {'Contribution VaR': {ticker: $}, 'Contribution ES': {ticker: $}}
+        """
+        assets = simulated.get("assets")
+        if assets is None:
+            return {}
+        portfolio = simulated["portfolio"]
+        sims = len(portfolio)
+        var_index = int((1 - confidence_level) * sims)
+        half = max(1, int(window * sims))
+        lo, hi = max(0, var_index - half), min(sims, var_index + half + 1)
+        # Only the VaR neighbourhood boundaries need to be in sorted position
+        order = tail_indices(portfolio, (lo, var_index, hi - 1))
+
+        near_var = order[lo:hi]
+        tail = order[:var_index] if var_index > 0 else order[:1]
+
+        c_var = -assets[near_var].mean(axis=0) * initial_investment
+        c_es = -assets[tail].mean(axis=0) * initial_investment
+        return {
+            "Contribution VaR": {
+                t: round(float(v), 2) for t, v in zip(self.tickers, c_var)
+            },
+            "Contribution ES": {
+                t: round(float(v), 2) for t, v in zip(self.tickers, c_es)
+            },
+        }
+
+    def run(
+        self,
+        scenarios: Optional[List[Dict]] = None,
+        simulations: int = 10000,
+        horizon_days: int = 1,
+        confidence_level: float = 0.95,
+        initial_investment: float = 100000,
+        degrees_of_freedom: float = 5.0,
+        chunk_size: int = 20000,
+        seed: Optional[int] = None,
+    ) -> Dict:
+        """
+        Simulate all scenarios and summarize VaR, ES and per-asset contributions
+
+        Args:
+            scenarios (list, optional): Scenario specs (defaults to DEFAULT_SCENARIOS)
+            simulations (int): Number of Monte Carlo scenarios
+            horizon_days (int): Risk horizon in trading days
+            confidence_level (float): Confidence level (e.g., 0.95 for 95%)
+            initial_investment (float): Initial portfolio value
+            degrees_of_freedom (float): DoF for fat-tailed scenarios
+            chunk_size (int): Rows of shocks generated per block
+            seed (int, optional): Seed for reproducible shocks
+
+        Returns:
+            dict: Per-scenario risk statistics and engine parameters
+        """
+        scenarios = scenarios or self.DEFAULT_SCENARIOS
+        simulated = self.simulate(
+            scenarios,
+            simulations=simulations,
+            horizon_days=horizon_days,
+            degrees_of_freedom=degrees_of_freedom,
+            chunk_size=chunk_size,
+            seed=seed,
+        )
+
+        results: Dict[str, Dict] = {}
+        for name, spec in zip(self._scenario_names(scenarios), scenarios):
+            pnl = simulated[name]["portfolio"] * initial_investment
+            quantile, tail_mean, _ = tail_statistics(pnl, confidence_level)
+            var_value = -quantile
+            es_value = -tail_mean if not np.isnan(tail_mean) else var_value
+
+            rho = spec.get("correlation")
+            multiplier = np.broadcast_to(
+                np.asarray(spec.get("vol_multiplier", 1.0), dtype=float), (self.n_assets,)
+            )
+            results[name] = {
+                "VaR": round(float(var_value), 2),
+                "VaR %": round(float(var_value / initial_investment * 100), 2),
+                "Expected Shortfall": round(float(es_value), 2),
+                "ES %": round(float(es_value / initial_investment * 100), 2),
+                "Probability of Loss": round(float(np.mean(pnl < 0) * 100), 2),
+                "Avg Volatility": round(float(np.mean(self.vol * multiplier) * 100), 2),
+                "Avg Correlation": round(
+                    float(rho if rho is not None else self._average_correlation()), 3
+                ),
+                **self.contribution_var(
+                    simulated[name], confidence_level, initial_investment
+                ),
+            }
+
+        return {
+            "Scenarios": results,
+            "Parameters": {
+                "Assets": self.n_assets,
+                "Simulations": simulations,
+                "Horizon Days": horizon_days,
+                "Confidence Level": confidence_level,
+                "Initial Investment": initial_investment,
+                "Historical Days": self.n_observations,
+                "Factorization": self.factorization,
+            },
+            "Portfolio Composition": {
+                t: round(float(w) * 100, 2) for t, w in zip(self.tickers, self.weights)
+            },
+        }
+
+    def _average_correlation(self) -> float:
+        """Average off-diagonal historical correlation."""
+        n = self.n_assets
+        if n < 2:
+            return 0.0
+        return float((self.corr.sum() - n) / (n * (n - 1)))
@@ -0,0 +1,180 @@
+"""
+Analysis Stage Graph
+
+Small dependency-graph executor for multi-stage analytics requests
+(comprehensive analysis, the /api/scrape analytics block):
+1. Stages declare the stages they depend on; a stage receives its
+   dependencies' results as keyword arguments
+2. Every stage whose dependencies are complete runs immediately on a shared
+   thread pool, so independent stages overlap instead of running back to back
+3. Each stage has an optional time budget; a stage that overruns is reported
+   as timed out and its dependents are skipped, without blocking the request
+4. Per-stage status and wall time are returned alongside the results
+
+Threads rather than processes: stages share the in-process returns cache and
+spend their time in NumPy/SciPy kernels and network I/O, both of which
+release the GIL.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default wall-time budgets (seconds) for the standard analytics stages
+STAGE_BUDGETS: Dict[str, float] = {
+    "returns": 60.0,
+    "fundamental": 15.0,
+    "correlation": 30.0,
+    "regression": 60.0,
+    "monte_carlo": 60.0,
+    "portfolio_monte_carlo": 90.0,
+    "pca": 30.0,
+}
+
+
+class Stage:
+    """A unit of work in a StageGraph."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Tuple[str, ...] = (),
+        budget: Optional[float] = None,
+    ):
+        self.name = name
+        self.func = func
+        self.depends_on = depends_on
+        self.budget = budget
+        self.started = 0.0
+
+
+class StageGraph:
+    """
+    Run named stages concurrently in dependency order.
+
+    Example:
+        graph = StageGraph(max_workers=4)
+        graph.add("returns", lambda: analytics.get_historical_returns(tickers))
+        graph.add("pca", lambda returns: analytics.pca_analysis(tickers),
+                  depends_on=("returns",), budget=30)
+        results, timings = graph.run()
+
+    A stage that raises is recorded with status 'error'; a stage that exceeds
+    its budget is recorded as 'timeout' (the worker thread is left to finish in
+    the background, its result discarded). Dependents of a failed stage are
+    'skipped'. Only completed stages appear in ``results``.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Sequence[str] = (),
+        budget: Optional[float] = None,
+    ) -> "StageGraph":
+        """
+        Register a stage.
+
+        Args:
+            name (str): Unique stage name (also the keyword dependents receive)
+            func (callable): Called with one keyword argument per dependency
+            depends_on (sequence): Names of stages that must complete first
+            budget (float, optional): Wall-time budget in seconds (None = unlimited)
+
+        Returns:
+            StageGraph: self, for chaining
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage '{name}'")
+        missing = [d for d in depends_on if d not in self.stages]
+        if missing:
+            # Requiring dependencies to be registered first also rules out cycles
+            raise ValueError(f"Stage '{name}' depends on unknown stages {missing}")
+        self.stages[name] = Stage(name, func, tuple(depends_on), budget)
+        return self
+
+    def run(self) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        Execute every stage.
+
+        Returns:
+            tuple: (results {stage: return value}, timings {stage: {'status', 'seconds'}})
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, Dict[str, Any]] = {}
+        pending = dict(self.stages)
+        running: Dict[Future, Stage] = {}
+        graph_start = time.perf_counter()
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                self._skip_blocked(pending, timings)
+                for name in [n for n, s in pending.items() if all(d in results for d in s.depends_on)]:
+                    stage = pending.pop(name)
+                    kwargs = {d: results[d] for d in stage.depends_on}
+                    stage.started = time.perf_counter()
+                    running[executor.submit(stage.func, **kwargs)] = stage
+                if not running:
+                    continue
+
+                done, _ = wait(running, timeout=self._next_deadline(running), return_when=FIRST_COMPLETED)
+                now = time.perf_counter()
+                for future in done:
+                    stage = running.pop(future)
+                    elapsed = now - stage.started
+                    try:
+                        results[stage.name] = future.result()
+                        timings[stage.name] = {"status": "ok", "seconds": round(elapsed, 3)}
+                    except Exception as e:
+                        self.logger.warning(f"Stage '{stage.name}' failed: {e}")
+                        timings[stage.name] = {
+                            "status": "error",
+                            "seconds": round(elapsed, 3),
+                            "error": str(e),
+                        }
+                for future, stage in list(running.items()):
+                    if stage.budget is not None and now - stage.started >= stage.budget:
+                        self.logger.warning(f"Stage '{stage.name}' exceeded its {stage.budget}s budget")
+                        future.cancel()
+                        running.pop(future)
+                        timings[stage.name] = {"status": "timeout", "seconds": round(now - stage.started, 3)}
+        finally:
+            # Do not block on stages abandoned after a timeout
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        timings["total"] = {"status": "ok", "seconds": round(time.perf_counter() - graph_start, 3)}
+        return results, timings
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _skip_blocked(pending: Dict[str, Stage], timings: Dict[str, Dict[str, Any]]) -> None:
+        """Mark stages whose dependencies failed, timed out or were skipped."""
+        changed = True
+        while changed:
+            changed = False
+            for name, stage in list(pending.items()):
+                failed = [d for d in stage.depends_on if d in timings and timings[d]["status"] != "ok"]
+                if failed:
+                    pending.pop(name)
+                    timings[name] = {"status": "skipped", "seconds": 0.0, "error": f"{failed[0]} did not complete"}
+                    changed = True
+
+    @staticmethod
+    def _next_deadline(running: Dict[Future, Stage]) -> Optional[float]:
+        """Seconds until the earliest running stage exhausts its budget (None = no budget)."""
+        now = time.perf_counter()
+        remaining = [s.budget - (now - s.started) for s in running.values() if s.budget is not None]
+        return max(0.0, min(remaining)) if remaining else None
@@ -5,6 +5,11 @@ Phases 19–22 replace stub bodies with real compute.
 IMPORTANT: Uses yf.Ticker().history() — NOT yf.download() — to avoid
 concurrent-call 2D/1D shape corruption (Phase 09-01 decision).
 """
+import copy
+import logging
+import threading
+import weakref
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
@@ -12,6 +17,12 @@ from plotly.subplots import make_subplots
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
+from cachetools import LRUCache
+
+from src.utils import state_store
+
+logger = logging.getLogger(__name__)
+
 
 def fetch_ohlcv(ticker: str, days: int, auto_adjust: bool = True) -> pd.DataFrame:
     """
@@ -41,10 +52,237 @@ def fetch_ohlcv(ticker: str, days: int, auto_adjust: bool = True) -> pd.DataFram
 # Stub compute functions — replaced by real logic in Phases 19–22
 # ---------------------------------------------------------------------------
 
-def compute_volume_profile(df: pd.DataFrame, ticker: str = '', lookback: int = 0) -> dict:
+def _volume_by_price(lows: np.ndarray, highs: np.ndarray, volumes: np.ndarray,
+                     bin_edges: np.ndarray) -> np.ndarray:
+    """
+    Spread each bar's volume uniformly over its [low, high] range and sum it per price bin.
+
+    Cumulative volume below a price p is piecewise linear in p:
+    sum over bars of density * (min(p, high) - low) for bars with low < p, where
+    density = volume / (high - low). Sorting lows and highs once and taking
+    prefix sums of density and density * price evaluates it at every edge in
+    O((bars + bins) log bars); bin volumes are the differences between edges.
+    Bars with (near) zero range put their whole volume in the bin holding the
+    price.
+    """
+    n_bins = len(bin_edges) - 1
+    ranges = highs - lows
+    point = ranges < 1e-10
+
+    # Zero-range bars: whole volume into the bin containing the price
+    idx = np.clip(np.searchsorted(bin_edges, lows[point], side='right') - 1, 0, n_bins - 1)
+    volume_by_bin = np.bincount(idx, weights=volumes[point], minlength=n_bins).astype(float)
+
+    density = volumes[~point] / ranges[~point]
+
+    def _below(bounds: np.ndarray) -> np.ndarray:
+        # sum of density * (edge - bound) over bars whose bound lies below each edge
+        order = np.argsort(bounds)
+        d_sum = np.concatenate(([0.0], np.cumsum(density[order])))
+        dp_sum = np.concatenate(([0.0], np.cumsum(density[order] * bounds[order])))
+        k = np.searchsorted(bounds[order], bin_edges, side='left')
+        return d_sum[k] * bin_edges - dp_sum[k]
+
+    cumulative = _below(lows[~point]) - _below(highs[~point])
+    return volume_by_bin + np.diff(cumulative)
+
+
+def _value_area_mask(volume_by_bin: np.ndarray, fraction: float = 0.70) -> np.ndarray:
+    """Bins that, taken in decreasing volume order, first reach ``fraction`` of total volume."""
+    order = np.argsort(volume_by_bin)[::-1]
+    accumulated = np.cumsum(volume_by_bin[order])
+    n_in = min(int(np.searchsorted(accumulated, fraction * volume_by_bin.sum(), side='left')) + 1, len(order))
+    mask = np.zeros(len(volume_by_bin), dtype=bool)
+    mask[order[:n_in]] = True
+    return mask
+
+
+class VolumeProfileIndex:
+    """
+    Prefix sums of volume-by-price over bars on a fixed price grid.
+
+    Row t of ``prefix`` holds the volume of bars [0, t) per grid cell (each
+    bar's volume spread uniformly over its [low, high] range), so the profile
+    of any contiguous run of bars is the difference of two rows: O(cells) per
+    lookback instead of a pass over the bars. Cells are ``step`` wide and
+    aligned to multiples of ``step``; the grid grows in either direction as
+    new bars trade outside it.
+    """
+
+    # Cell width as a fraction of the reference price (compute_volume_profile's 0.2% bins)
+    GRID_STEP_PCT = 0.002
+
+    def __init__(self, step: float):
+        self.step = float(step)
+        self.base = 0
+        self.dates = pd.DatetimeIndex([])
+        self.prefix = np.zeros((1, 0))
+
+    @classmethod
+    def from_ohlcv(cls, df: pd.DataFrame) -> 'VolumeProfileIndex':
+        """Index ``df`` (non-empty) on a grid sized from its median close."""
+        index = cls(step=float(np.median(df['Close'].values)) * cls.GRID_STEP_PCT)
+        index.extend(df)
+        return index
+
+    @property
+    def edges(self) -> np.ndarray:
+        return (self.base + np.arange(self.prefix.shape[1] + 1)) * self.step
+
+    def extend(self, df: pd.DataFrame) -> None:
+        """Append bars dated after the last indexed bar."""
+        if len(self.dates):
+            df = df[df.index > self.dates[-1]]
+        if df.empty:
+            return
+        lows = df['Low'].values.astype(float)
+        highs = df['High'].values.astype(float)
+        volumes = df['Volume'].values.astype(float)
+
+        lo_cell = int(np.floor(lows.min() / self.step))
+        hi_cell = int(np.floor(highs.max() / self.step)) + 1
+        if self.prefix.shape[1] == 0:
+            self.base = lo_cell
+            self.prefix = np.zeros((1, hi_cell - lo_cell))
+        pad_lo = max(0, self.base - lo_cell)
+        pad_hi = max(0, hi_cell - (self.base + self.prefix.shape[1]))
+        if pad_lo or pad_hi:
+            self.prefix = np.pad(self.prefix, ((0, 0), (pad_lo, pad_hi)))
+            self.base -= pad_lo
+
+        # Share of each bar's range below every edge; differences give per-cell volume
+        edges = self.edges
+        ranges = highs - lows
+        point = ranges < 1e-10
+        below = np.clip((edges[None, :] - lows[:, None]) / np.where(point, 1.0, ranges)[:, None], 0.0, 1.0)
+        cells = np.diff(below, axis=1) * volumes[:, None]
+        point_rows = np.flatnonzero(point)
+        cells[point_rows] = 0.0
+        point_cells = np.clip(np.searchsorted(edges, lows[point], side='right') - 1, 0, len(edges) - 2)
+        cells[point_rows, point_cells] = volumes[point]
+
+        self.prefix = np.vstack([self.prefix, self.prefix[-1] + np.cumsum(cells, axis=0)])
+        self.dates = self.dates.append(df.index)
+
+    def profile(self, df: pd.DataFrame):
+        """
+        (bin_edges, volume_by_bin) for the bars of ``df``, trimmed to its price range.
+
+        Returns None when ``df`` is not a contiguous run of indexed bars.
+        """
+        if df.empty or not len(self.dates):
+            return None
+        start = int(self.dates.searchsorted(df.index[0], side='left'))
+        stop = int(self.dates.searchsorted(df.index[-1], side='right'))
+        if stop - start != len(df) or not self.dates[start:stop].equals(pd.DatetimeIndex(df.index)):
+            return None
+        lo = int(np.floor(df['Low'].min() / self.step)) - self.base
+        hi = int(np.floor(df['High'].max() / self.step)) + 1 - self.base
+        lo, hi = max(lo, 0), min(hi, self.prefix.shape[1])
+        volume_by_bin = np.maximum(self.prefix[stop, lo:hi] - self.prefix[start, lo:hi], 0.0)
+        return self.edges[lo: hi + 1], volume_by_bin
+
+
+# ---------------------------------------------------------------------------
+# Per-ticker OHLCV cache (with its volume-profile index)
+# ---------------------------------------------------------------------------
+
+# Daily history kept per ticker: the longest Trading Indicators lookback
+OHLCV_CACHE_DAYS = 365
+# Window re-fetched on a new day to append bars
+OHLCV_REFRESH_DAYS = 10
+# Tickers kept in memory (least recently used evicted); each entry holds a
+# year of bars plus its volume-profile prefix matrix
+OHLCV_CACHE_TICKERS = 64
+
+_ohlcv_cache: LRUCache = LRUCache(maxsize=OHLCV_CACHE_TICKERS)
+_ohlcv_cache_lock = threading.Lock()
+# Per-ticker load locks live only while some thread holds them
+_ohlcv_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_key_locks_guard = threading.Lock()
+
+
+def _key_lock(locks: weakref.WeakValueDictionary, key: str) -> threading.Lock:
+    """The lock for ``key`` in ``locks``, created on first use and dropped once unreferenced."""
+    with _key_locks_guard:
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks[key] = threading.Lock()
+        return lock
+
+
+def _load_ohlcv_entry(ticker: str) -> dict:
+    df = fetch_ohlcv(ticker, OHLCV_CACHE_DAYS).dropna(subset=['Open', 'High', 'Low', 'Close'])
+    return {'frame': df, 'vp_index': VolumeProfileIndex.from_ohlcv(df), 'as_of': datetime.now().date()}
+
+
+def _extend_ohlcv_entry(entry: dict, ticker: str) -> dict:
+    """Append bars after the cached ones; reload when they do not line up (gap or restated closes)."""
+    frame = entry['frame']
+    recent = fetch_ohlcv(ticker, OHLCV_REFRESH_DAYS).dropna(subset=['Open', 'High', 'Low', 'Close'])
+    overlap = recent.index[recent.index <= frame.index[-1]]
+    if len(overlap) == 0 or not np.allclose(
+        recent.loc[overlap, 'Close'].values, frame.loc[overlap, 'Close'].values, rtol=1e-6
+    ):
+        return _load_ohlcv_entry(ticker)
+    new = recent[recent.index > frame.index[-1]]
+    vp_index = entry['vp_index']
+    if not new.empty:
+        frame = pd.concat([frame, new])
+        # extend() rebinds its arrays, so readers of the old index are unaffected
+        vp_index = copy.copy(vp_index)
+        vp_index.extend(new)
+    return {'frame': frame, 'vp_index': vp_index, 'as_of': datetime.now().date()}
+
+
+def _ohlcv_entry(ticker: str) -> dict:
+    key = ticker.upper()
+    with _key_lock(_ohlcv_locks, key):
+        with _ohlcv_cache_lock:
+            entry = _ohlcv_cache.get(key)
+        if entry is None:
+            entry = _load_ohlcv_entry(ticker)
+        elif entry['as_of'] != datetime.now().date():
+            entry = _extend_ohlcv_entry(entry, ticker)
+        with _ohlcv_cache_lock:
+            _ohlcv_cache[key] = entry
+    return entry
+
+
+def get_ohlcv(ticker: str, days: int) -> pd.DataFrame:
+    """
+    Cached fetch_ohlcv(ticker, days) with incomplete (NaN OHLC) rows dropped.
+
+    Daily bars are downloaded once per ticker and extended with new bars on
+    later days; windows up to OHLCV_CACHE_DAYS are slices of the cache,
+    starting ``days`` × 1.4 calendar days (fetch_ohlcv's buffer) before the
+    last cached bar. Longer windows are fetched directly.
+    """
+    if days > OHLCV_CACHE_DAYS:
+        return fetch_ohlcv(ticker, days).dropna(subset=['Open', 'High', 'Low', 'Close'])
+    frame = _ohlcv_entry(ticker)['frame']
+    return frame[frame.index >= frame.index[-1] - timedelta(days=int(days * 1.4))]
+
+
+def get_volume_profile_index(ticker: str) -> VolumeProfileIndex:
+    """Volume-by-price index over the cached bars of ``ticker`` (see get_ohlcv)."""
+    return _ohlcv_entry(ticker)['vp_index']
+
+
+def clear_ohlcv_cache() -> None:
+    """Drop all cached OHLCV frames and volume-profile indexes. Intended for testing."""
+    with _ohlcv_cache_lock:
+        _ohlcv_cache.clear()
+
+
+def compute_volume_profile(df: pd.DataFrame, ticker: str = '', lookback: int = 0, profile=None) -> dict:
     """
     Compute Volume Profile (POC, VAH, VAL, 70% value area) and return a
     Plotly subplot payload {traces, layout, signal, bin_width_usd, poc, vah, val}.
+
+    ``profile`` may supply precomputed (bin_edges, volume_by_bin) for ``df``,
+    e.g. from VolumeProfileIndex.profile; otherwise bins spanning the window's
+    price range are computed from the bars.
     """
     highs = df['High'].values.astype(float)
     lows = df['Low'].values.astype(float)
@@ -61,50 +299,24 @@ def compute_volume_profile(df: pd.DataFrame, ticker: str = '', lookback: int = 0
     else:
         n_bins = 20
 
-    bin_edges = np.linspace(price_min, price_max, n_bins + 1)
+    if profile is not None:
+        bin_edges, volume_by_bin = profile
+        n_bins = len(volume_by_bin)
+    else:
+        bin_edges = np.linspace(price_min, price_max, n_bins + 1)
+        volume_by_bin = _volume_by_price(lows, highs, volumes, bin_edges)
     bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2.0
-    bin_lo = bin_edges[:-1]
-    bin_hi = bin_edges[1:]
     bin_width = float(bin_edges[1] - bin_edges[0])
 
-    volume_by_bin = np.zeros(n_bins, dtype=float)
-
-    for i in range(len(df)):
-        bar_lo = lows[i]
-        bar_hi = highs[i]
-        bar_vol = volumes[i]
-        bar_range = bar_hi - bar_lo
-
-        if bar_range < 1e-10:
-            idx = np.searchsorted(bin_edges, bar_lo, side='right') - 1
-            idx = max(0, min(n_bins - 1, idx))
-            volume_by_bin[idx] += bar_vol
-        else:
-            overlaps = np.maximum(0.0, np.minimum(bin_hi, bar_hi) - np.maximum(bin_lo, bar_lo))
-            total_overlap = overlaps.sum()
-            if total_overlap > 1e-10:
-                volume_by_bin += bar_vol * overlaps / total_overlap
-
     # POC
     poc_idx = int(np.argmax(volume_by_bin))
     poc = float(bin_centers[poc_idx])
 
-    # Value area (greedy expansion from POC until >= 70% of total volume)
-    total_volume = volume_by_bin.sum()
-    target = 0.70 * total_volume
-
-    sorted_idx = np.argsort(volume_by_bin)[::-1]
-    accumulated = 0.0
-    va_set = set()
-    for idx in sorted_idx:
-        va_set.add(idx)
-        accumulated += volume_by_bin[idx]
-        if accumulated >= target:
-            break
-
-    va_indices = sorted(va_set)
-    vah = float(bin_centers[max(va_indices)])
-    val = float(bin_centers[min(va_indices)])
+    # Value area: highest-volume bins until >= 70% of total volume
+    in_value_area = _value_area_mask(volume_by_bin)
+    va_indices = np.flatnonzero(in_value_area)
+    vah = float(bin_centers[va_indices[-1]])
+    val = float(bin_centers[va_indices[0]])
 
     current_price = float(closes[-1])
     signal = 'inside' if val <= current_price <= vah else 'outside'
@@ -129,10 +341,7 @@ def compute_volume_profile(df: pd.DataFrame, ticker: str = '', lookback: int = 0
     ), row=1, col=1)
 
     # Horizontal bar histogram on col 2
-    bar_colors = [
-        'rgba(70,130,180,0.7)' if i in va_set else 'rgba(150,150,150,0.4)'
-        for i in range(n_bins)
-    ]
+    bar_colors = np.where(in_value_area, 'rgba(70,130,180,0.7)', 'rgba(150,150,150,0.4)').tolist()
     fig.add_trace(go.Bar(
         x=volume_by_bin.tolist(),
         y=bin_centers.tolist(),
@@ -542,6 +751,17 @@ def _adaptive_n(lookback: int) -> int:
     return 5
 
 
+def _swing_indices(values: np.ndarray, n: int, beats) -> np.ndarray:
+    """
+    Indices i in [n, len - n) whose value beats (strictly, via ``beats`` =
+    np.greater / np.less) each of its n neighbours on both sides.
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(values, 2 * n + 1)
+    centre = windows[:, n:n + 1]
+    neighbours = np.delete(windows, n, axis=1)
+    return n + np.flatnonzero(beats(centre, neighbours).all(axis=1))
+
+
 def compute_liquidity_sweep(df: pd.DataFrame, lookback: int = 90) -> dict:
     n = _adaptive_n(lookback)
     min_bars = 2 * n + 1
@@ -554,19 +774,11 @@ def compute_liquidity_sweep(df: pd.DataFrame, lookback: int = 90) -> dict:
     closes = df['Close'].values
     dates  = list(df.index.astype(str))
 
-    swing_high_indices = []
-    swing_low_indices  = []
-
     # range(n, len-n) prevents look-ahead bias (SWEEP-02)
-    for i in range(n, len(highs) - n):
-        if all(highs[i] > highs[i - j] for j in range(1, n + 1)) and \
-           all(highs[i] > highs[i + j] for j in range(1, n + 1)):
-            swing_high_indices.append(i)
-        if all(lows[i] < lows[i - j] for j in range(1, n + 1)) and \
-           all(lows[i] < lows[i + j] for j in range(1, n + 1)):
-            swing_low_indices.append(i)
-
-    if not swing_high_indices and not swing_low_indices:
+    swing_high_indices = _swing_indices(highs, n, np.greater)
+    swing_low_indices  = _swing_indices(lows, n, np.less)
+
+    if not len(swing_high_indices) and not len(swing_low_indices):
         fig = go.Figure()
         fig.add_trace(go.Candlestick(
             x=dates, open=df['Open'].tolist(), high=df['High'].tolist(),
@@ -585,52 +797,54 @@ def compute_liquidity_sweep(df: pd.DataFrame, lookback: int = 90) -> dict:
             'signal': 'no_swings', 'n': n, 'swept_price': None, 'sweep_count': 0,
         }
 
-    sweep_events = []
     annotations  = []
     shapes       = []
 
-    last_swing_high = highs[swing_high_indices[-1]] if swing_high_indices else None
-    last_swing_low  = lows[swing_low_indices[-1]]   if swing_low_indices  else None
-
-    if last_swing_high is not None:
+    # Closes beyond the last confirmed swing, at or after the bar following it
+    bullish_idx = np.array([], dtype=int)
+    bearish_idx = np.array([], dtype=int)
+    if len(swing_high_indices):
         ref_idx = swing_high_indices[-1]
-        for i in range(ref_idx + 1, len(closes)):
-            if closes[i] > last_swing_high:
-                sweep_events.append((i, 'bullish', last_swing_high))
-                annotations.append(dict(
-                    x=dates[i], y=highs[i] * 1.002,
-                    text='▲', showarrow=False,
-                    font=dict(size=14, color='#2ecc71'),
-                    xanchor='center', yanchor='bottom',
-                ))
-                shapes.append(dict(
-                    type='line', xref='paper', yref='y',
-                    x0=0, x1=1, y0=last_swing_high, y1=last_swing_high,
-                    line=dict(dash='dash', color='#2ecc71', width=1),
-                ))
-
-    if last_swing_low is not None:
+        last_swing_high = highs[ref_idx]
+        bullish_idx = ref_idx + 1 + np.flatnonzero(closes[ref_idx + 1:] > last_swing_high)
+        for i in bullish_idx:
+            annotations.append(dict(
+                x=dates[i], y=highs[i] * 1.002,
+                text='▲', showarrow=False,
+                font=dict(size=14, color='#2ecc71'),
+                xanchor='center', yanchor='bottom',
+            ))
+            shapes.append(dict(
+                type='line', xref='paper', yref='y',
+                x0=0, x1=1, y0=last_swing_high, y1=last_swing_high,
+                line=dict(dash='dash', color='#2ecc71', width=1),
+            ))
+
+    if len(swing_low_indices):
         ref_idx = swing_low_indices[-1]
-        for i in range(ref_idx + 1, len(closes)):
-            if closes[i] < last_swing_low:
-                sweep_events.append((i, 'bearish', last_swing_low))
-                annotations.append(dict(
-                    x=dates[i], y=lows[i] * 0.998,
-                    text='▼', showarrow=False,
-                    font=dict(size=14, color='#e74c3c'),
-                    xanchor='center', yanchor='top',
-                ))
-                shapes.append(dict(
-                    type='line', xref='paper', yref='y',
-                    x0=0, x1=1, y0=last_swing_low, y1=last_swing_low,
-                    line=dict(dash='dash', color='#e74c3c', width=1),
-                ))
-
-    if sweep_events:
-        sweep_events.sort(key=lambda e: e[0])
-        last_event  = sweep_events[-1]
-        signal      = last_event[1]
-        swept_price = float(last_event[2])
+        last_swing_low = lows[ref_idx]
+        bearish_idx = ref_idx + 1 + np.flatnonzero(closes[ref_idx + 1:] < last_swing_low)
+        for i in bearish_idx:
+            annotations.append(dict(
+                x=dates[i], y=lows[i] * 0.998,
+                text='▼', showarrow=False,
+                font=dict(size=14, color='#e74c3c'),
+                xanchor='center', yanchor='top',
+            ))
+            shapes.append(dict(
+                type='line', xref='paper', yref='y',
+                x0=0, x1=1, y0=last_swing_low, y1=last_swing_low,
+                line=dict(dash='dash', color='#e74c3c', width=1),
+            ))
+
+    sweep_count = len(bullish_idx) + len(bearish_idx)
+    # The latest event sets the signal; a bar sweeping both sides counts as bearish
+    if len(bearish_idx) and (not len(bullish_idx) or bearish_idx[-1] >= bullish_idx[-1]):
+        signal      = 'bearish'
+        swept_price = float(last_swing_low)
+    elif len(bullish_idx):
+        signal      = 'bullish'
+        swept_price = float(last_swing_high)
     else:
         signal      = 'none'
         swept_price = None
@@ -656,7 +870,7 @@ def compute_liquidity_sweep(df: pd.DataFrame, lookback: int = 90) -> dict:
         'signal':      signal,
         'n':           n,
         'swept_price': swept_price,
-        'sweep_count': len(sweep_events),
+        'sweep_count': sweep_count,
     }
 
 
@@ -738,42 +952,273 @@ def fetch_intraday(ticker: str, days: int = 60) -> pd.DataFrame:
     return df[['Open', 'High', 'Low', 'Close', 'Volume']]
 
 
-def compute_footprint(df_15m: pd.DataFrame, ticker: str = '') -> dict:
-    if df_15m is None or df_15m.empty:
-        return {'signal': None, 'error': 'No intraday data', 'traces': [], 'layout': {}}
+# ---------------------------------------------------------------------------
+# Local intraday archive (footprint history beyond the 60-day download limit)
+# ---------------------------------------------------------------------------
+
+# Longest lookback fetch_intraday can download
+INTRADAY_FETCH_DAYS = 59
+
+_intraday_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
-    df = df_15m.copy()
-    if df.index.tz is not None:
-        df.index = df.index.tz_localize(None)
 
+def _bar_delta(df: pd.DataFrame) -> np.ndarray:
+    """Buy minus sell volume per bar, splitting volume by where the close sits in the bar's range."""
     ranges = (df['High'] - df['Low']).clip(lower=1e-10)
     buy_volume = (df['Close'] - df['Low']) / ranges * df['Volume']
     sell_volume = df['Volume'] - buy_volume
-    df['delta'] = buy_volume - sell_volume
+    return (buy_volume - sell_volume).values.astype(float)
 
-    price_min = df['Low'].min()
-    price_max = df['High'].max()
-    price_range = price_max - price_min
-    mid_price = (price_min + price_max) / 2.0
-    n_bins = max(20, min(200, int(price_range / (mid_price * 0.002))))
-    bin_edges = np.linspace(price_min, price_max, n_bins + 1)
-    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2.0
 
-    df['bin_idx'] = np.digitize(df['Close'], bin_edges) - 1
-    df['bin_idx'] = df['bin_idx'].clip(0, n_bins - 1)
-    df['date'] = df.index.date
+class IntradayArchive:
+    """
+    Local archive of 15m bars for one ticker, with footprint cells.
+
+    Bars are kept in the local state store and only bars newer than the last
+    stored timestamp are appended, so history accumulates past the download
+    limit. Alongside the bars the archive maintains the footprint aggregates:
+    per trading day and price cell, the delta and volume of the bars closing
+    in that cell. Cells are ``step`` wide and aligned to multiples of ``step``
+    (grown in either direction as prices move), so appending bars only adds
+    to the rows of their days.
+
+    Attributes:
+        ticker (str): Ticker symbol
+        bars (pd.DataFrame): OHLCV bars, ascending tz-naive timestamps
+        step (float): Cell width (0 until the first bars are appended)
+        base (int): Grid index of the first cell column
+        days (np.ndarray): datetime64[D] day of each cells row
+        delta (np.ndarray): (n_days, n_cells) delta per day and cell
+        volume (np.ndarray): (n_days, n_cells) volume per day and cell
+        as_of (str | None): Calendar day of the last download
+    """
 
-    unique_dates = sorted(df['date'].unique())
-    date_strings = [str(d) for d in unique_dates]
+    STATE_NAMESPACE = "intraday"
+    # Cell width as a fraction of the first batch's median close (compute_footprint's 0.2% bins)
+    GRID_STEP_PCT = 0.002
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        self.state_key = f"{ticker.upper()}_15m"
+        self.bars = pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'], index=pd.DatetimeIndex([]))
+        self.step = 0.0
+        self.base = 0
+        self.days = np.array([], dtype='datetime64[D]')
+        self.delta = np.zeros((0, 0))
+        self.volume = np.zeros((0, 0))
+        self.as_of = None
+
+    @property
+    def empty(self) -> bool:
+        return self.bars.empty
+
+    @property
+    def edges(self) -> np.ndarray:
+        return (self.base + np.arange(self.delta.shape[1] + 1)) * self.step
+
+    def load(self) -> bool:
+        """
+        Restore the archived bars and cells.
+
+        Returns:
+            bool: True if a stored archive was found
+        """
+        state = state_store.load_arrays(self.STATE_NAMESPACE, self.state_key)
+        if state is None:
+            return False
+        self.bars = pd.DataFrame(
+            {col: state[col.lower()] for col in ('Open', 'High', 'Low', 'Close', 'Volume')},
+            index=pd.DatetimeIndex(state['times']),
+        )
+        self.step = float(state['step'])
+        self.base = int(state['base'])
+        self.days = state['days']
+        self.delta = state['cell_delta']
+        self.volume = state['cell_volume']
+        self.as_of = str(state['as_of']) or None
+        return True
+
+    def save(self) -> bool:
+        """Persist bars and cells (best-effort, see state_store)."""
+        return state_store.save_arrays(
+            self.STATE_NAMESPACE,
+            self.state_key,
+            times=self.bars.index.values,
+            **{col.lower(): self.bars[col].values.astype(float) for col in self.bars.columns},
+            step=np.array(self.step),
+            base=np.array(self.base),
+            days=self.days,
+            cell_delta=self.delta,
+            cell_volume=self.volume,
+            as_of=np.array(self.as_of or ''),
+        )
 
-    delta_matrix = np.zeros((len(unique_dates), n_bins))
-    vol_matrix = np.zeros((len(unique_dates), n_bins))
-    for i, d in enumerate(unique_dates):
-        day_df = df[df['date'] == d]
-        for _, row in day_df.iterrows():
-            b = int(row['bin_idx'])
-            delta_matrix[i, b] += row['delta']
-            vol_matrix[i, b] += row['Volume']
+    def append(self, df: pd.DataFrame) -> int:
+        """
+        Append the bars of ``df`` dated after the last archived bar and add
+        them to the cells of their days.
+
+        Returns:
+            int: Number of bars appended
+        """
+        df = df[['Open', 'High', 'Low', 'Close', 'Volume']].dropna(subset=['Open', 'High', 'Low', 'Close'])
+        if df.index.tz is not None:
+            df = df.tz_localize(None)
+        if not self.empty:
+            df = df[df.index > self.bars.index[-1]]
+        if df.empty:
+            return 0
+        closes = df['Close'].values.astype(float)
+
+        if self.step == 0.0:
+            self.step = float(np.median(closes)) * self.GRID_STEP_PCT
+            self.base = int(np.floor(closes.min() / self.step))
+        lo_cell = int(np.floor(closes.min() / self.step))
+        hi_cell = int(np.floor(closes.max() / self.step)) + 1
+        pad_lo = max(0, self.base - lo_cell)
+        pad_hi = max(0, hi_cell - (self.base + self.delta.shape[1]))
+
+        bar_days = df.index.values.astype('datetime64[D]')
+        new_days = np.unique(bar_days)
+        if len(self.days):
+            new_days = new_days[new_days > self.days[-1]]
+        pad = ((0, len(new_days)), (pad_lo, pad_hi))
+        self.delta = np.pad(self.delta, pad)
+        self.volume = np.pad(self.volume, pad)
+        self.base -= pad_lo
+        self.days = np.concatenate([self.days, new_days])
+
+        # Only rows from the first appended day on change: one bincount over their (day, cell) ids
+        n_cells = self.delta.shape[1]
+        rows = np.searchsorted(self.days, bar_days)
+        first = int(rows[0])
+        cells = (rows - first) * n_cells + (np.floor(closes / self.step).astype(int) - self.base)
+        size = (len(self.days) - first) * n_cells
+        shape = (len(self.days) - first, n_cells)
+        self.delta[first:] += np.bincount(cells, weights=_bar_delta(df), minlength=size).reshape(shape)
+        self.volume[first:] += np.bincount(
+            cells, weights=df['Volume'].values.astype(float), minlength=size
+        ).reshape(shape)
+
+        self.bars = pd.concat([self.bars, df.astype(float)]) if not self.empty else df.astype(float)
+        return len(df)
+
+    def window(self, days: int) -> pd.DataFrame:
+        """Bars of the last ``days`` calendar days, counted back from the last archived bar's day."""
+        if self.empty:
+            return self.bars
+        start = self.bars.index[-1].normalize() - timedelta(days=int(days) - 1)
+        return self.bars[self.bars.index >= start]
+
+    def footprint_cells(self, df: pd.DataFrame):
+        """
+        (date_strings, bin_edges, delta_matrix, volume_matrix) for the bars of
+        ``df``, trimmed to its price range.
+
+        Returns None unless ``df`` is a contiguous run of archived bars that
+        covers whole days.
+        """
+        if df.empty or self.empty:
+            return None
+        times = self.bars.index
+        start = int(times.searchsorted(df.index[0], side='left'))
+        stop = int(times.searchsorted(df.index[-1], side='right'))
+        if stop - start != len(df) or not times[start:stop].equals(pd.DatetimeIndex(df.index)):
+            return None
+        if start > 0 and times[start - 1].normalize() == times[start].normalize():
+            return None
+        if stop < len(times) and times[stop].normalize() == times[stop - 1].normalize():
+            return None
+
+        first, last = np.searchsorted(self.days, times[[start, stop - 1]].values.astype('datetime64[D]'))
+        lo = int(np.floor(df['Low'].min() / self.step)) - self.base
+        hi = int(np.floor(df['High'].max() / self.step)) + 1 - self.base
+        lo, hi = max(lo, 0), min(hi, self.delta.shape[1])
+        date_strings = pd.DatetimeIndex(self.days[first: last + 1]).strftime('%Y-%m-%d').tolist()
+        return (
+            date_strings,
+            self.edges[lo: hi + 1],
+            self.delta[first: last + 1, lo:hi],
+            self.volume[first: last + 1, lo:hi],
+        )
+
+
+def get_intraday(ticker: str, days: int = 60):
+    """
+    15m bars of the last ``days`` calendar days from the local intraday
+    archive, with their footprint cells (see IntradayArchive.footprint_cells).
+
+    On the first call of a calendar day the archive is extended with the bars
+    after its last stored timestamp (fetch_intraday, at most
+    INTRADAY_FETCH_DAYS back). If that download fails, archived bars are
+    served; with nothing archived the error is raised.
+
+    Returns:
+        tuple: (DataFrame of bars, cells or None)
+    """
+    with _key_lock(_intraday_locks, ticker.upper()):
+        archive = IntradayArchive(ticker)
+        archive.load()
+        today = datetime.now().strftime('%Y-%m-%d')
+        if archive.as_of != today:
+            since = INTRADAY_FETCH_DAYS
+            if not archive.empty:
+                since = min(since, (datetime.now() - archive.bars.index[-1]).days + 1)
+            try:
+                recent = fetch_intraday(ticker, since)
+            except Exception as e:
+                if archive.empty:
+                    raise
+                logger.warning(f"Serving archived intraday bars for {ticker}: {e}")
+            else:
+                archive.append(recent)
+                archive.as_of = today
+                archive.save()
+    df = archive.window(days)
+    return df, archive.footprint_cells(df)
+
+
+def compute_footprint(df_15m: pd.DataFrame, ticker: str = '', cells=None) -> dict:
+    """
+    Footprint delta heatmap (delta per day and close-price bin) with per-day
+    POC markers, plus the cumulative-delta signal.
+
+    ``cells`` may supply precomputed (date_strings, bin_edges, delta_matrix,
+    volume_matrix) for ``df_15m``, e.g. from IntradayArchive.footprint_cells;
+    otherwise bins spanning the window's price range are computed from the bars.
+    """
+    if df_15m is None or df_15m.empty:
+        return {'signal': None, 'error': 'No intraday data', 'traces': [], 'layout': {}}
+
+    df = df_15m.copy()
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    df['delta'] = _bar_delta(df)
+
+    if cells is not None:
+        date_strings, bin_edges, delta_matrix, vol_matrix = cells
+    else:
+        price_min = df['Low'].min()
+        price_max = df['High'].max()
+        price_range = price_max - price_min
+        mid_price = (price_min + price_max) / 2.0
+        n_bins = max(20, min(200, int(price_range / (mid_price * 0.002))))
+        bin_edges = np.linspace(price_min, price_max, n_bins + 1)
+
+        bin_idx = (np.digitize(df['Close'].values, bin_edges) - 1).clip(0, n_bins - 1)
+        # Integer day codes (sorted), then one weighted bincount over the flattened (day, bin) cell
+        unique_days, day_codes = np.unique(df.index.normalize().values, return_inverse=True)
+        date_strings = pd.DatetimeIndex(unique_days).strftime('%Y-%m-%d').tolist()
+        n_days = len(unique_days)
+
+        flat = day_codes * n_bins + bin_idx
+        delta_matrix = np.bincount(
+            flat, weights=df['delta'].values, minlength=n_days * n_bins
+        ).reshape(n_days, n_bins)
+        vol_matrix = np.bincount(
+            flat, weights=df['Volume'].values.astype(float), minlength=n_days * n_bins
+        ).reshape(n_days, n_bins)
+    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2.0
 
     heatmap = go.Heatmap(
         z=delta_matrix.tolist(),
@@ -785,13 +1230,9 @@ def compute_footprint(df_15m: pd.DataFrame, ticker: str = '') -> dict:
         hovertemplate='Date: %{x}<br>Price: %{y:.2f}<br>Delta: %{z:.0f}<extra></extra>',
     )
 
-    poc_x, poc_y = [], []
-    for i, d in enumerate(unique_dates):
-        best_bin = int(np.argmax(vol_matrix[i]))
-        poc_x.append(date_strings[i])
-        poc_y.append(float(bin_centers[best_bin]))
+    poc_y = bin_centers[np.argmax(vol_matrix, axis=1)].tolist()
     poc_scatter = go.Scatter(
-        x=poc_x, y=poc_y, mode='markers',
+        x=date_strings, y=poc_y, mode='markers',
         marker=dict(symbol='circle', size=6, color='#f9e2af', opacity=0.85),
         name='POC',
     )
@@ -824,9 +1265,10 @@ def compute_footprint(df_15m: pd.DataFrame, ticker: str = '') -> dict:
     else:
         signal = 'neutral'
 
+    fig_dict = fig.to_dict()
     return {
-        'traces': fig.to_dict()['data'],
-        'layout': fig.to_dict()['layout'],
+        'traces': fig_dict['data'],
+        'layout': fig_dict['layout'],
         'signal': signal,
         'cum_delta': cum_delta,
         'total_volume': total_volume,
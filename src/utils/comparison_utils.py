@@ -11,6 +11,8 @@ from datetime import datetime
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 
+from src.utils.metric_index import MetricIndex
+
 def normalize_data(data_dict):
     """
     Normalize data from different sources into a consistent format
@@ -43,28 +45,20 @@ def normalize_data(data_dict):
     }
     
     for ticker, stock_data in data_dict.items():
+        index = MetricIndex.of(stock_data)
         normalized[ticker] = {
             'Ticker': ticker,
-            'Data Timestamp': stock_data.get('Data Timestamp', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            'Data Timestamp': index.get('Data Timestamp', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         }
         
-        # Process each metric type
+        # Process each metric type: first key (in payload order) matching any label,
+        # parsed to a number when possible (suffixes, %, $ handled by the index)
         for normalized_name, possible_names in metric_mappings.items():
-            for key in stock_data:
-                if any(name in key for name in possible_names):
-                    # Try to convert string values to numeric
-                    try:
-                        # Remove % and convert to float
-                        value = stock_data[key]
-                        if isinstance(value, str):
-                            if '%' in value:
-                                value = value.replace('%', '')
-                            value = float(value)
-                        normalized[ticker][normalized_name] = value
-                        break
-                    except (ValueError, TypeError):
-                        normalized[ticker][normalized_name] = stock_data[key]
-                        break
+            key = index.first_key_containing(possible_names)
+            if key is None:
+                continue
+            value = index.number(key)
+            normalized[ticker][normalized_name] = value if value is not None else index.get(key)
     
     return normalized
 
@@ -12,6 +12,8 @@ from datetime import datetime
 import pandas as pd
 from dotenv import load_dotenv
 from tabulate import tabulate
+
+from src.utils.metric_index import MetricIndex
 # Load environment variables
 load_dotenv()
 
@@ -172,14 +174,15 @@ def get_all_sources_data(data, metric):
     Get all values for a metric from different sources.
 
     Args:
-        data (dict): Dictionary containing all data.
+        data (dict): Dictionary containing all data (or a MetricIndex over it).
         metric (str): The metric to retrieve (e.g., "P/E Ratio").
 
     Returns:
         str: Concatenated values from all sources.
     """
-     # Filter keys that match the metric
-    matching_keys = [key for key in data.keys() if metric in key]
+    index = MetricIndex.of(data)
+    # Filter keys that match the metric
+    matching_keys = index.keys_containing(metric, case_sensitive=True)
 
     # Group and format the values
     values = []
@@ -188,7 +191,7 @@ def get_all_sources_data(data, metric):
         source = key.split('(')[-1][:-1] if '(' in key else "Unknown"
         # Format the value with the source and specific metric label
         specific_metric = key.replace(f" ({source})", "").strip()  # Remove source from key
-        values.append(f"{specific_metric} ({source}): {data[key]}")
+        values.append(f"{specific_metric} ({source}): {index.get(key)}")
 
     return ", ".join(values) if values else "--"
 
@@ -300,16 +303,16 @@ def generate_enhanced_html_metrics_table(all_data):
     """
     key_metrics = ["Ticker", "Current Price", "Analyst Price Target", "P/E Ratio", "Forward P/E", "PEG Ratio", "EPS", "ROE", "P/B Ratio", "P/S Ratio", "Profit Margin"]
     
-    def get_metric_color(metric, value_str):
+    def get_metric_color(metric, index):
         """Get color coding for different metrics."""
         try:
-            # Extract numeric value from string
-            import re
-            numbers = re.findall(r'-?\d+\.?\d*', value_str.replace('%', ''))
-            if not numbers:
+            # Colour by the first source that reports a numeric value
+            values = [index.number(key) for key in index.keys_containing(metric, case_sensitive=True)]
+            values = [v for v in values if v is not None]
+            if not values:
                 return "#95a5a6"
             
-            value = float(numbers[0])
+            value = values[0]
             
             if "P/E" in metric:
                 if value < 15: return "#27ae60"  # Good
@@ -360,8 +363,9 @@ def generate_enhanced_html_metrics_table(all_data):
             </td>
         '''
         
+        index = MetricIndex.of(data)
         for metric in key_metrics[1:]:  # Skip ticker
-            value = get_all_sources_data(data, metric)
+            value = get_all_sources_data(index, metric)
             # Add bullet points for each line
             if value != "--":
                 # Split by ", " (which is replaced by <br>), then join with <br>• 
@@ -372,7 +376,7 @@ def generate_enhanced_html_metrics_table(all_data):
                     clean_value = "• " + lines[0]
             else:
                 clean_value = '<span style="color: #95a5a6;">--</span>'
-            color = get_metric_color(metric, value)
+            color = get_metric_color(metric, index)
             
             html += f'''
                 <td style="padding: 15px; border-bottom: 1px solid #ecf0f1; color: {color}; font-weight: 500;">
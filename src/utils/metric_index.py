@@ -0,0 +1,200 @@
+"""
+Metric index for scraped ticker payloads
+
+Scraper output is a flat dict of display strings keyed by source-tagged labels
+("P/E Ratio (Yahoo)": "28.4", "Market Cap (Finviz)": "2.80T",
+"ROE (Yahoo)": "15.3%"), optionally with nested sections ("valuation",
+"profitability", ...). Fundamental analysis, the Sheets export, the comparison
+report and the email builders all look up the same metrics by several candidate
+labels and parse the same strings.
+
+``MetricIndex`` does that work once per payload:
+1. Keys are lower-cased and positioned in a single pass, so source-tagged
+   labels ("ROE (Yahoo)", "ROE (Finviz)") resolve without re-lowering the dict
+2. Each value is parsed to a float at most once (suffixes T/B/M/K, percent
+   signs, currency symbols, thousands separators, accounting negatives)
+3. Lookups by candidate-label lists are memoized
+
+Build an index with ``MetricIndex.of(data)`` (returns ``data`` unchanged if it
+is already an index) and pass it to every consumer of the same payload.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Nested sections searched (exact key match) after the top-level keys
+NESTED_SECTIONS = (
+    "valuation",
+    "profitability",
+    "financial_metrics",
+    "earnings",
+    "cashflow",
+    "statistics",
+    "financials",
+)
+
+MISSING_VALUES = frozenset({"", "N/A", "N/A%", "--", "-", "None", "nan", "NaN"})
+
+_SUFFIX_MULTIPLIERS = {
+    "T": 1_000_000_000_000,
+    "B": 1_000_000_000,
+    "M": 1_000_000,
+    "K": 1_000,
+}
+
+
+def parse_numeric(value: Any) -> Optional[float]:
+    """
+    Parse a scraped display value to a float.
+
+    Handles plain numbers, "15.3%", "$1,234.5", "2.80T"/"350B"/"12M"/"8K" and
+    accounting negatives such as "(1.2B)".
+
+    Args:
+        value: Raw value from a scraper payload
+
+    Returns:
+        float or None: Parsed value, or None when missing or not numeric
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return None if value != value else float(value)
+    if not isinstance(value, str):
+        return None
+
+    text = value.strip()
+    if text in MISSING_VALUES:
+        return None
+    text = text.replace("%", "").replace(",", "").replace("$", "").strip()
+
+    sign = 1.0
+    if text.startswith("(") and text.endswith(")"):
+        sign = -1.0
+        text = text[1:-1].strip()
+
+    multiplier = 1
+    if text and text[-1] in _SUFFIX_MULTIPLIERS:
+        multiplier = _SUFFIX_MULTIPLIERS[text[-1]]
+        text = text[:-1].strip()
+
+    try:
+        return sign * float(text) * multiplier
+    except ValueError:
+        return None
+
+
+class MetricIndex:
+    """
+    One-pass index over a single ticker payload.
+
+    Example:
+        index = MetricIndex.of(stock_data)
+        pe = index.lookup(["P/E Ratio", "PE Ratio", "P/E"])
+        margin = index.number("Profit Margin (Yahoo)")
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data if isinstance(data, dict) else {}
+        self.keys: List[str] = [k for k in self.data if isinstance(k, str)]
+        self._lower = [k.lower() for k in self.keys]
+        self._position = {k: i for i, k in enumerate(self.keys)}
+        self.sections: Dict[str, Dict[str, Any]] = {
+            name: self.data[name]
+            for name in NESTED_SECTIONS
+            if isinstance(self.data.get(name), dict)
+        }
+        self._numbers: Dict[Tuple[Optional[str], str], Optional[float]] = {}
+        self._lookups: Dict[Tuple[str, ...], Optional[float]] = {}
+        self._contains: Dict[Tuple[str, bool], List[str]] = {}
+
+    @classmethod
+    def of(cls, data: Any) -> "MetricIndex":
+        """Return ``data`` if it is already an index, otherwise index it."""
+        return data if isinstance(data, cls) else cls(data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Raw value of a top-level key."""
+        return self.data.get(key, default)
+
+    def number(self, key: str, section: Optional[str] = None) -> Optional[float]:
+        """Parsed float for an exact key (top level or within ``section``), cached."""
+        cache_key = (section, key)
+        if cache_key not in self._numbers:
+            source = self.sections.get(section, {}) if section else self.data
+            self._numbers[cache_key] = parse_numeric(source.get(key))
+        return self._numbers[cache_key]
+
+    def keys_containing(self, pattern: str, case_sensitive: bool = False) -> List[str]:
+        """Top-level keys containing ``pattern``, in payload order."""
+        cache_key = (pattern, case_sensitive)
+        if cache_key not in self._contains:
+            if case_sensitive:
+                matches = [k for k in self.keys if pattern in k]
+            else:
+                needle = pattern.lower()
+                matches = [k for k, low in zip(self.keys, self._lower) if needle in low]
+            self._contains[cache_key] = matches
+        return self._contains[cache_key]
+
+    def first_key_containing(self, patterns: Iterable[str], case_sensitive: bool = True) -> Optional[str]:
+        """Earliest key in payload order that contains any of ``patterns``."""
+        best = None
+        for pattern in patterns:
+            matches = self.keys_containing(pattern, case_sensitive)
+            if matches and (best is None or self._position[matches[0]] < self._position[best]):
+                best = matches[0]
+        return best
+
+    def first_present(self, keys: Sequence[str]) -> Any:
+        """Raw value of the first exact key whose value is not None."""
+        for key in keys:
+            value = self.data.get(key)
+            if value is not None:
+                return value
+        return None
+
+    def first_number(self, keys: Sequence[str]) -> Optional[float]:
+        """Parsed float of the first exact key that holds a numeric value."""
+        for key in keys:
+            value = self.number(key)
+            if value is not None:
+                return value
+        return None
+
+    def lookup(self, possible_keys: Sequence[str]) -> Optional[float]:
+        """
+        Resolve a metric from candidate labels.
+
+        For each candidate in order: exact top-level key, then any top-level key
+        containing it (case-insensitive, payload order), then an exact key in
+        the nested sections. The first numeric value wins.
+
+        Args:
+            possible_keys (list): Candidate labels, most specific first
+
+        Returns:
+            float or None: Metric value
+        """
+        cache_key = tuple(possible_keys)
+        if cache_key in self._lookups:
+            return self._lookups[cache_key]
+
+        result = None
+        for key in possible_keys:
+            result = self.number(key)
+            if result is None:
+                for data_key in self.keys_containing(key):
+                    result = self.number(data_key)
+                    if result is not None:
+                        break
+            if result is None:
+                for section, values in self.sections.items():
+                    if key in values:
+                        result = self.number(key, section)
+                        if result is not None:
+                            break
+            if result is not None:
+                break
+
+        self._lookups[cache_key] = result
+        return result
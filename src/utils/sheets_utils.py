@@ -66,6 +66,8 @@ import gspread.exceptions
 from dotenv import load_dotenv
 from gspread.utils import ValueInputOption
 
+from src.utils.metric_index import MetricIndex
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -189,23 +191,30 @@ def _append_below_existing(ws, rows):
 
 
 def _extract_fields(ticker_data):
-    """Normalize scraper field names (source-suffixed) into a flat dict."""
+    """Normalize scraper field names (source-suffixed) into a flat dict.
+
+    ticker_data may be a raw payload or a prebuilt MetricIndex. Plain numeric
+    fields (price, ratios, RSI, sentiment, DCF) are parsed to floats once here;
+    percent and text fields keep their display strings for the sheet cells.
+    """
+    index = MetricIndex.of(ticker_data)
 
     def _first(*keys):
-        for k in keys:
-            v = ticker_data.get(k)
-            if v is not None:
-                return v
-        return None
+        return index.first_present(keys)
+
+    def _number(*keys):
+        raw = index.first_present(keys)
+        parsed = index.first_number(keys)
+        return parsed if parsed is not None else raw
 
     return {
-        "price": _first(
+        "price": _number(
             "Price",
             "Current Price (Yahoo)",
             "Current Price (Finviz)",
             "Current Price (Google)",
         ),
-        "pe": _first(
+        "pe": _number(
             "P/E Ratio (Yahoo)",
             "P/E Ratio (Google)",
             "P/E Ratio (Finviz)",
@@ -213,14 +222,14 @@ def _extract_fields(ticker_data):
             "P/E Ratio",
             "P/E",
         ),
-        "fwd_pe": _first(
+        "fwd_pe": _number(
             "Forward P/E (Yahoo)",
             "Forward P/E (Finviz)",
             "Forward P/E (AlphaVantage)",
             "Forward P/E",
             "Forward P/E Ratio",
         ),
-        "pb": _first(
+        "pb": _number(
             "P/B Ratio (Yahoo)",
             "P/B Ratio (Google)",
             "P/B Ratio (Finviz)",
@@ -228,14 +237,14 @@ def _extract_fields(ticker_data):
             "P/B Ratio",
             "P/B",
         ),
-        "eps": _first(
+        "eps": _number(
             "EPS (Yahoo)",
             "EPS (Google)",
             "EPS (AlphaVantage)",
             "EPS (TTM) (Finviz)",
             "EPS",
         ),
-        "rsi": _first(
+        "rsi": _number(
             "RSI (14) (Technical)",
             "RSI (Technical)",
             "RSI",
@@ -243,7 +252,7 @@ def _extract_fields(ticker_data):
         "ma10": _first("MA10 Signal (Technical)", "MA10 Signal", "10-Day MA Signal"),
         "ma20": _first("MA20 Signal (Technical)", "MA20 Signal", "20-Day MA Signal"),
         "ma50": _first("MA50 Signal (Technical)", "MA50 Signal", "50-Day MA Signal"),
-        "sentiment": _first(
+        "sentiment": _number(
             "Overall Sentiment Score (Enhanced)",
             "Sentiment Score",
         ),
@@ -270,7 +279,7 @@ def _extract_fields(ticker_data):
         ),
         "health": _first("Health Score"),
         "eq_flag": _first("Earnings Quality Flag"),
-        "dcf": _first("DCF Intrinsic Value"),
+        "dcf": _number("DCF Intrinsic Value"),
         "peer_pe": _first("Peer P/E Percentile"),
     }
 
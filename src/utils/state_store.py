@@ -0,0 +1,120 @@
+"""
+Local state store for persisted analytics results
+
+Fitted parameters and other state that is expensive to recompute (GARCH fits,
+covariance state, model snapshots) are kept on disk so they survive restarts
+and can be shared by every worker process on the host. Files live under
+``ANALYTICS_STATE_DIR`` (default: ``<project>/data/state``), one sub-directory
+per namespace. Writes are atomic (temporary file + ``os.replace``), so readers
+never observe a partially written file.
+
+Persistence is best-effort: read and write failures are logged and reported as
+a cache miss rather than raised, so analytics keep working on read-only or
+ephemeral filesystems.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_WRITE_LOCK = threading.Lock()
+
+
+def get_state_dir() -> str:
+    """Root directory for persisted state (``ANALYTICS_STATE_DIR`` overrides the default)."""
+    return os.environ.get("ANALYTICS_STATE_DIR") or os.path.join(_PROJECT_ROOT, "data", "state")
+
+
+def state_path(namespace: str, key: str, suffix: str) -> str:
+    """
+    Path of the file holding ``key`` within ``namespace``.
+
+    Args:
+        namespace (str): Sub-directory, e.g. 'garch'
+        key (str): Logical name; characters unsafe in file names are replaced
+        suffix (str): File extension including the dot, e.g. '.json'
+
+    Returns:
+        str: Absolute file path (the directory is not created)
+    """
+    safe_key = re.sub(r"[^A-Za-z0-9_.=-]", "_", key)
+    return os.path.join(get_state_dir(), namespace, f"{safe_key}{suffix}")
+
+
+def _atomic_write(path: str, write_fn) -> bool:
+    """Write via ``write_fn(file_obj)`` to a temp file and move it into place."""
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        with _WRITE_LOCK:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    write_fn(fh)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        return True
+    except Exception as e:
+        logger.warning(f"Could not persist state to {path}: {e}")
+        return False
+
+
+def save_json(namespace: str, key: str, payload: Dict[str, Any]) -> bool:
+    """
+    Persist a JSON-serializable dict.
+
+    Returns:
+        bool: True if the state was written
+    """
+    data = json.dumps(payload, default=float).encode("utf-8")
+    return _atomic_write(state_path(namespace, key, ".json"), lambda fh: fh.write(data))
+
+
+def load_json(namespace: str, key: str) -> Optional[Dict[str, Any]]:
+    """Load a dict saved with save_json, or None if missing/unreadable."""
+    path = state_path(namespace, key, ".json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except Exception as e:
+        logger.warning(f"Could not read state from {path}: {e}")
+        return None
+
+
+def save_arrays(namespace: str, key: str, **arrays: np.ndarray) -> bool:
+    """
+    Persist named NumPy arrays as an uncompressed ``.npz`` archive.
+
+    Returns:
+        bool: True if the state was written
+    """
+    return _atomic_write(
+        state_path(namespace, key, ".npz"), lambda fh: np.savez(fh, **arrays)
+    )
+
+
+def load_arrays(namespace: str, key: str) -> Optional[Dict[str, np.ndarray]]:
+    """Load arrays saved with save_arrays, or None if missing/unreadable."""
+    path = state_path(namespace, key, ".npz")
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return {name: data[name] for name in data.files}
+    except Exception as e:
+        logger.warning(f"Could not read state from {path}: {e}")
+        return None
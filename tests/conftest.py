@@ -30,6 +30,13 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "e2e: full browser end-to-end via Playwright")
 
 
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    """Point persisted analytics state (src/utils/state_store) at a per-test directory."""
+    monkeypatch.setenv('ANALYTICS_STATE_DIR', str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def client():
     import webapp
@@ -551,9 +551,9 @@ class TestRegimeDetection:
             "label_confidence": "HIGH",
         }
         with patch("yfinance.Ticker", return_value=self._mock_yf_ticker()), patch(
-            "src.analytics.regime_detection.RegimeDetector"
-        ) as MockRD:
-            MockRD.return_value.fit.return_value = mock_result
+            "src.analytics.regime_online.OnlineRegimeModel"
+        ) as MockModel:
+            MockModel.return_value.analyze.return_value = mock_result
             resp = client.post(
                 "/api/regime_detection",
                 json={
@@ -1035,6 +1035,32 @@ def test_ml_signals_missing_ticker(client):
     assert "error" in data
 
 
+def test_ml_signals_batch_route_streams_per_ticker(client):
+    """POST /api/ml_signals/batch → one SSE event per ticker, then a done event."""
+    items = [
+        {"ticker": "MSFT", "signals": {"direction": {"signal": "Bearish"}}, "elapsed": 1.0},
+        {"ticker": "AAPL", "error": "timed out after 180s"},
+    ]
+    with patch("src.analytics.ml_signals.iter_ml_signals_batch", return_value=iter(items)) as mock_batch:
+        resp = client.post(
+            "/api/ml_signals/batch", json={"tickers": ["AAPL", "MSFT"], "features": ["direction"]}
+        )
+        body = resp.get_data(as_text=True)
+
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+    events = [json.loads(line[len("data: "):]) for line in body.split("\n\n") if line]
+    assert [e.get("ticker") for e in events[:2]] == ["MSFT", "AAPL"]
+    assert events[-1] == {"done": True, "count": 2}
+    assert mock_batch.call_args[0][:2] == (["AAPL", "MSFT"], ["direction"])
+
+
+def test_ml_signals_batch_route_rejects_unknown_feature(client):
+    resp = client.post("/api/ml_signals/batch", json={"tickers": ["AAPL"], "features": ["pca"]})
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()
+
+
 # ---------------------------------------------------------------------------
 # Phase 28 Price History route
 # ---------------------------------------------------------------------------
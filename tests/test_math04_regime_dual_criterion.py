@@ -5,7 +5,7 @@ These tests verify:
 1. _assign_labels() is a module-level function
 2. Dual-criterion logic: both sigma and mu criteria must agree for HIGH confidence
 3. Low sigma separation (< 20%) yields AMBIGUOUS even if criteria agree
-4. _build_result() emits NEUTRAL signal when label_confidence is AMBIGUOUS
+4. build_result() emits NEUTRAL signal when label_confidence is AMBIGUOUS
 5. Return dict includes label_confidence and filtered_probs_full
 """
 import sys
@@ -55,31 +55,31 @@ def test_assign_labels_low_sigma_separation_ambiguous():
 
 
 def test_build_result_has_label_confidence():
-    """Test 4: _build_result source includes label_confidence."""
+    """Test 4: build_result source includes label_confidence."""
     from src.analytics.regime_detection import RegimeDetector
     rd = RegimeDetector()
-    src = inspect.getsource(rd._build_result)
-    assert 'label_confidence' in src, 'label_confidence not in _build_result source'
+    src = inspect.getsource(rd.build_result)
+    assert 'label_confidence' in src, 'label_confidence not in build_result source'
 
 
 def test_build_result_has_filtered_probs_full():
-    """Test 4b: _build_result source includes filtered_probs_full in return dict."""
+    """Test 4b: build_result source includes filtered_probs_full in return dict."""
     from src.analytics.regime_detection import RegimeDetector
     rd = RegimeDetector()
-    src = inspect.getsource(rd._build_result)
+    src = inspect.getsource(rd.build_result)
     assert 'filtered_probs_full' in src, \
-        'filtered_probs_full not in _build_result source'
+        'filtered_probs_full not in build_result source'
 
 
 def test_build_result_neutral_when_ambiguous():
     """Test 4c: When label_confidence is AMBIGUOUS, signal must be NEUTRAL."""
     from src.analytics.regime_detection import RegimeDetector
     rd = RegimeDetector()
-    src = inspect.getsource(rd._build_result)
+    src = inspect.getsource(rd.build_result)
     # The signal assignment must check label_confidence == 'AMBIGUOUS' before thresholds
     assert "label_confidence == 'AMBIGUOUS'" in src or \
            "label_confidence==" in src.replace(" ", ""), \
-        "AMBIGUOUS check not found in _build_result signal assignment"
+        "AMBIGUOUS check not found in build_result signal assignment"
 
 
 if __name__ == '__main__':
@@ -47,6 +47,93 @@ def test_assign_labels_low_separation_gives_ambiguous():
     )
 
 
+def _reference_filter(rd, returns):
+    """Per-(t, state) Hamilton recursion with scipy densities, for comparison."""
+    from scipy.stats import norm
+
+    prob = rd.pi.copy()
+    filtered = np.zeros((len(returns), 2))
+    log_lik = 0.0
+    for t, y in enumerate(returns):
+        joint = prob * np.array([norm.pdf(y, rd.mu[k], rd.sigma[k]) for k in range(2)])
+        log_lik += np.log(joint.sum())
+        filtered[t] = joint / joint.sum()
+        prob = rd.P.T @ filtered[t]
+    return filtered, log_lik
+
+
+def test_vectorized_filter_matches_reference():
+    """Log-space vectorized Hamilton filter reproduces the per-step scipy recursion."""
+    rng = np.random.default_rng(3)
+    returns = np.concatenate([rng.normal(0.0005, 0.008, 300), rng.normal(-0.002, 0.03, 100)])
+    rd = RegimeDetector()
+    rd._unpack_params(rd._random_init(returns, 1))
+
+    filtered, log_lik = rd._hamilton_filter(returns)
+    ref_filtered, ref_log_lik = _reference_filter(rd, returns)
+    np.testing.assert_allclose(filtered, ref_filtered, atol=1e-12)
+    assert log_lik == pytest.approx(ref_log_lik, rel=1e-12)
+
+    smoothed = rd._backward_smooth(returns, filtered)
+    np.testing.assert_allclose(smoothed.sum(axis=1), 1.0)
+    np.testing.assert_allclose(smoothed[-1], filtered[-1])
+
+
+def test_filter_survives_extreme_returns():
+    """A return far in both tails must not underflow the likelihood to -inf."""
+    returns = np.array([0.001, -0.002, 0.9, 0.0005])
+    rd = RegimeDetector()
+    rd._unpack_params(np.array([0.0, 0.0, 0.01, 0.02, 1.0, 0.0, 0.0, 1.0]))
+    filtered, log_lik = rd._hamilton_filter(returns)
+    assert np.isfinite(log_lik)
+    assert filtered[2, 1] > 0.99
+
+
+def _two_regime_returns(seed=5):
+    rng = np.random.default_rng(seed)
+    return np.concatenate([
+        rng.normal(0.0006, 0.008, 400), rng.normal(-0.002, 0.03, 120), rng.normal(0.0006, 0.008, 200)
+    ])
+
+
+def test_em_fit_recovers_regimes_and_matches_parallel_run():
+    """Baum-Welch converges in tens of iterations; worker processes give the same fit."""
+    returns = _two_regime_returns()
+    serial = RegimeDetector().fit(returns, n_restarts=3, method='em')
+    parallel = RegimeDetector().fit(returns, n_restarts=3, method='em', n_jobs=2)
+
+    assert serial['fit_method'] == 'EM (Baum-Welch)'
+    assert serial['em_iterations'] < 100
+    sigmas = sorted(p['sigma_daily'] for p in serial['parameters'].values())
+    assert sigmas[0] == pytest.approx(0.008, rel=0.15)
+    assert sigmas[1] == pytest.approx(0.03, rel=0.15)
+    assert parallel['log_likelihood'] == pytest.approx(serial['log_likelihood'], abs=1e-9)
+
+
+def test_em_and_mle_reach_similar_likelihood():
+    returns = _two_regime_returns()[:300]
+    em = RegimeDetector().fit(returns, n_restarts=2, method='em')
+    mle = RegimeDetector().fit(returns, n_restarts=2, method='mle')
+    assert em['log_likelihood'] == pytest.approx(mle['log_likelihood'], abs=0.5)
+
+
+def test_fit_rejects_unknown_method():
+    with pytest.raises(ValueError, match='Supported values'):
+        RegimeDetector().fit(_two_regime_returns(), method='gibbs')
+
+
+def test_analyze_fits_every_ticker(monkeypatch):
+    series = {'AAA': _two_regime_returns(1), 'BBB': _two_regime_returns(2)}
+    monkeypatch.setattr(RegimeDetector, 'fetch_returns', lambda self, ticker, days=1260: series[ticker])
+    result = RegimeDetector().analyze(['AAA', 'BBB', 'ZZZ'], method='em')
+
+    assert result['ticker_used'] == 'AAA'
+    assert set(result['tickers']) == {'AAA', 'BBB', 'ZZZ'}
+    assert result['tickers']['BBB']['n_observations'] == len(series['BBB'])
+    assert 'error' in result['tickers']['ZZZ']
+    assert result['signal'] == result['tickers']['AAA']['signal']
+
+
 @pytest.mark.slow
 def test_spy_march_2020_is_stressed(spy_returns):
     """
@@ -17,6 +17,12 @@ def client():
         yield c
 
 
+@pytest.fixture(autouse=True)
+def _clear_ohlcv_cache():
+    from src.analytics.trading_indicators import clear_ohlcv_cache
+    clear_ohlcv_cache()
+
+
 def _stub_ohlcv():
     """Minimal valid OHLCV DataFrame with tz-naive index (simulates yfinance output)."""
     idx = pd.date_range('2024-01-01', periods=90, freq='B')
@@ -134,6 +140,84 @@ class TestComputeVolumeProfile:
         assert result['bin_width_usd'] > 0
         assert isinstance(result['bin_width_usd'], float)
 
+    @pytest.mark.unit
+    def test_volume_by_price_matches_per_bar_overlap(self):
+        """Prefix-sum binning equals spreading each bar over its overlapping bins."""
+        import numpy as np
+        from src.analytics.trading_indicators import _volume_by_price, _value_area_mask
+        rng = np.random.default_rng(7)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 400))
+        highs = closes + rng.uniform(0, 2, 400)
+        lows = closes - rng.uniform(0, 2, 400)
+        lows[::25] = highs[::25]  # zero-range bars
+        volumes = rng.uniform(1e5, 1e6, 400)
+        edges = np.linspace(lows.min(), highs.max(), 121)
+
+        expected = np.zeros(120)
+        for lo, hi, vol in zip(lows, highs, volumes):
+            if hi - lo < 1e-10:
+                expected[min(max(np.searchsorted(edges, lo, side='right') - 1, 0), 119)] += vol
+            else:
+                overlaps = np.maximum(0.0, np.minimum(edges[1:], hi) - np.maximum(edges[:-1], lo))
+                expected += vol * overlaps / overlaps.sum()
+
+        result = _volume_by_price(lows, highs, volumes, edges)
+        np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-6)
+        mask = _value_area_mask(result)
+        assert result[mask].sum() >= 0.70 * result.sum()
+        assert result[mask].min() >= result[~mask].max()
+
+    @pytest.mark.unit
+    def test_profile_index_windows_match_direct_binning(self):
+        """Any lookback's profile is two prefix rows; appending bars equals rebuilding."""
+        import numpy as np
+        from src.analytics.trading_indicators import VolumeProfileIndex, _volume_by_price
+        rng = np.random.default_rng(3)
+        closes = 150 + np.cumsum(rng.normal(0, 2, 250))
+        df = pd.DataFrame({
+            'Open': closes, 'High': closes + rng.uniform(0, 3, 250), 'Low': closes - rng.uniform(0, 3, 250),
+            'Close': closes, 'Volume': rng.uniform(1e6, 5e6, 250),
+        }, index=pd.date_range('2023-01-02', periods=250, freq='B'))
+
+        index = VolumeProfileIndex.from_ohlcv(df.iloc[:200])
+        index.extend(df.iloc[190:])  # overlapping bars are skipped
+        full = VolumeProfileIndex(step=index.step)
+        full.extend(df)
+        np.testing.assert_allclose(index.prefix[-1].sum(), df['Volume'].sum())
+
+        for lookback in (20, 60, 250):
+            window = df.iloc[-lookback:]
+            edges, volume = index.profile(window)
+            assert edges[0] <= window['Low'].min() and edges[-1] >= window['High'].max()
+            expected = _volume_by_price(window['Low'].values, window['High'].values,
+                                        window['Volume'].values, edges)
+            np.testing.assert_allclose(volume, expected, rtol=1e-9, atol=1e-3)
+            np.testing.assert_allclose(volume, full.profile(window)[1], rtol=1e-9, atol=1e-3)
+        assert index.profile(df.iloc[::2]) is None
+
+    @pytest.mark.unit
+    def test_get_ohlcv_serves_lookbacks_from_one_download(self):
+        from src.analytics import trading_indicators as ti
+        stub = _stub_ohlcv()
+        with patch('src.analytics.trading_indicators.fetch_ohlcv', return_value=stub) as mock_fetch:
+            df_30 = ti.get_ohlcv('AAPL', 30)
+            df_90 = ti.get_ohlcv('AAPL', 90)
+            profile = ti.get_volume_profile_index('AAPL').profile(df_30)
+            result = ti.compute_volume_profile(df_30, 'AAPL', 30, profile=profile)
+        assert mock_fetch.call_count == 1
+        assert df_30.index[0] >= df_90.index[0] and df_30.index[-1] == stub.index[-1]
+        assert df_30['Low'].min() <= result['poc'] <= df_30['High'].max()
+
+    def test_ohlcv_cache_is_bounded(self):
+        from src.analytics import trading_indicators as ti
+        with patch('src.analytics.trading_indicators.fetch_ohlcv', return_value=_stub_ohlcv()):
+            for i in range(ti.OHLCV_CACHE_TICKERS + 5):
+                ti.get_ohlcv(f'T{i}', 30)
+            assert len(ti._ohlcv_cache) == ti.OHLCV_CACHE_TICKERS
+            assert 'T0' not in ti._ohlcv_cache and f'T{ti.OHLCV_CACHE_TICKERS + 4}' in ti._ohlcv_cache
+        # Per-ticker load locks are released once no request holds them
+        assert len(ti._ohlcv_locks) == 0
+
     @pytest.mark.integration
     def test_route_includes_volume_profile_traces(self, client):
         stub_vp = {
@@ -473,6 +557,29 @@ class TestComputeLiquiditySweep:
         types = [t.get('type') for t in result.get('traces', [])]
         assert 'candlestick' in types, f"No candlestick trace found: {types}"
 
+    def test_swing_indices_match_neighbour_loop(self):
+        import numpy as np
+        from src.analytics.trading_indicators import _swing_indices
+        rng = np.random.default_rng(4)
+        values = np.round(100 + np.cumsum(rng.normal(0, 1, 300)))  # rounded: includes equal neighbours
+        for n in (2, 3, 5):
+            expected_high = [i for i in range(n, len(values) - n)
+                             if all(values[i] > values[i + j] for j in range(-n, n + 1) if j)]
+            expected_low = [i for i in range(n, len(values) - n)
+                            if all(values[i] < values[i + j] for j in range(-n, n + 1) if j)]
+            assert _swing_indices(values, n, np.greater).tolist() == expected_high
+            assert _swing_indices(values, n, np.less).tolist() == expected_low
+
+    def test_sweep_signal_from_latest_event(self):
+        from src.analytics.trading_indicators import compute_liquidity_sweep
+        df = self._sweep_ohlcv(90)
+        df.iloc[-1, df.columns.get_loc('Close')] = df['High'].max() + 5.0
+        result = compute_liquidity_sweep(df, 90)
+        assert result['signal'] == 'bullish'
+        assert result['swept_price'] in df['High'].values[:-3]
+        assert df['Close'].iloc[-1] > result['swept_price']
+        assert result['sweep_count'] == len(result['layout']['annotations'])
+
 
 @pytest.mark.unit
 class TestComputeCompositeBias:
@@ -623,7 +730,7 @@ class TestFootprintRoute:
         d = json.loads(r.data)
         assert 'error' in d
 
-    def test_with_ticker_calls_fetch_intraday(self):
+    def test_with_ticker_calls_fetch_intraday(self, state_dir):
         import json
         from unittest.mock import patch
         df_stub = _synthetic_15m()
@@ -633,6 +740,9 @@ class TestFootprintRoute:
         assert r.status_code == 200
         assert d.get('ticker') == 'AAPL'
         assert 'signal' in d
+        _mock.assert_called_once()
+        # The stub bars are archived under the per-test state dir, never the app's
+        assert (state_dir / 'intraday' / 'AAPL_15m.npz').exists()
 
 
 class TestComputeCompositeBias5Voice:
@@ -0,0 +1,141 @@
+"""
+Unit tests for src/analytics/ewma_covariance.py
+
+Covers: EwmaCovariance incremental updates vs a from-scratch build, agreement
+with the RiskMetrics recursion, missing data, persistence across instances,
+and the FinancialAnalytics consumers (ewma_covariance refresh logic,
+correlation_analysis, Monte Carlo and stress test).
+
+No live network calls — returns are synthetic and persisted state goes to a
+per-test temporary directory.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.ewma_covariance import EwmaCovariance
+
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(3)
+    corr = np.array([[1.0, 0.6, 0.2], [0.6, 1.0, 0.3], [0.2, 0.3, 1.0]])
+    vol = np.array([0.01, 0.015, 0.02])
+    cov = corr * np.outer(vol, vol)
+    data = rng.multivariate_normal(np.zeros(3), cov, size=300)
+    # History ends on the previous business day, as a daily download would
+    end = pd.Timestamp.today().normalize() - pd.offsets.BDay(1)
+    index = pd.bdate_range(end=end, periods=300)
+    return pd.DataFrame(data, index=index, columns=['AAA', 'BBB', 'CCC'])
+
+
+@pytest.mark.unit
+def test_incremental_update_matches_full_build(returns):
+    EwmaCovariance(list(returns.columns)).update(returns.iloc[:250])
+    state = EwmaCovariance(list(returns.columns)).update(returns)
+    assert state.rows_added == 50
+    assert state.n_observations == 300
+
+    full = EwmaCovariance(list(returns.columns), persist=False).update(returns)
+    np.testing.assert_allclose(state.covariance().values, full.covariance().values, rtol=1e-10)
+
+
+@pytest.mark.unit
+def test_matches_riskmetrics_recursion(returns):
+    lam = 0.94
+    s = np.zeros((3, 3))
+    for r in returns.values:
+        s = lam * s + (1 - lam) * np.outer(r, r)
+    expected = s / (1 - lam ** len(returns))
+
+    state = EwmaCovariance(list(returns.columns), decay=lam, persist=False).update(returns)
+    np.testing.assert_allclose(state.covariance().values, expected, rtol=1e-10)
+    corr = state.correlation().values
+    np.testing.assert_allclose(np.diag(corr), 1.0)
+    assert state.volatility()['CCC'] > state.volatility()['AAA']
+
+
+@pytest.mark.unit
+def test_ticker_order_and_missing_values(returns):
+    data = returns.copy()
+    data.iloc[:40, 2] = np.nan  # late listing
+    EwmaCovariance(['AAA', 'BBB', 'CCC']).update(data)
+
+    reordered = EwmaCovariance(['CCC', 'AAA', 'BBB'])
+    assert reordered.load()
+    cov = reordered.covariance()
+    assert list(cov.columns) == ['CCC', 'AAA', 'BBB']
+    assert np.isfinite(cov.values).all()
+    np.testing.assert_allclose(cov.values, cov.values.T)
+
+
+@pytest.mark.unit
+def test_gap_in_history_rebuilds_state(returns):
+    EwmaCovariance(list(returns.columns)).update(returns.iloc[:100])
+    state = EwmaCovariance(list(returns.columns)).update(returns.iloc[200:])
+    assert state.n_observations == 100
+    assert state.last_date == returns.index[-1].strftime('%Y-%m-%d')
+
+
+@pytest.mark.unit
+def test_invalid_decay_rejected():
+    with pytest.raises(ValueError):
+        EwmaCovariance(['AAA'], decay=1.0)
+
+
+# ---------------------------------------------------------------------------
+# FinancialAnalytics consumers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def analytics(returns, monkeypatch):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    fa = FinancialAnalytics()
+    fa.requested_days = []
+
+    def fake_returns(tickers, days=252, return_type='simple'):
+        fa.requested_days.append(days)
+        return returns.tail(days)
+
+    monkeypatch.setattr(fa, 'get_historical_returns', fake_returns)
+    return fa
+
+
+@pytest.mark.unit
+def test_refresh_downloads_only_recent_days(analytics, returns):
+    tickers = list(returns.columns)
+    analytics.ewma_covariance(tickers)
+    analytics.ewma_covariance(tickers)
+    # Second call on the same day reads the persisted snapshot without a download
+    assert analytics.requested_days == [252]
+
+    stale = EwmaCovariance(tickers)
+    stale.load()
+    stale.updated_on = '2000-01-01'
+    stale._save()
+    analytics.ewma_covariance(tickers)
+    assert analytics.requested_days[-1] < 252
+
+
+@pytest.mark.unit
+def test_correlation_analysis_ewma(analytics, returns):
+    result = analytics.correlation_analysis(list(returns.columns), method='ewma')
+    assert result['Summary Statistics']['Method'] == 'EWMA'
+    assert result['Correlation Matrix']['AAA']['AAA'] == 1.0
+    assert set(result['Correlation Matrix']) == {'AAA', 'BBB', 'CCC'}
+
+
+@pytest.mark.unit
+def test_monte_carlo_and_stress_test_use_ewma(analytics, returns):
+    tickers = list(returns.columns)
+    result = analytics.monte_carlo_var_es(
+        tickers, simulations=1000, forecast_days=5, covariance_model='ewma'
+    )
+    assert result['Simulation Parameters']['Model'].endswith('with EWMA covariance')
+    assert result['Stress Test']['Parameters']['Covariance Model'] == 'EWMA'
+
+    ewma_vol = EwmaCovariance(tickers).volatility()
+    assert result['Stress Test']['Base Case']['Avg Volatility'] == pytest.approx(
+        ewma_vol.mean() * 100, abs=0.01
+    )
@@ -0,0 +1,116 @@
+"""
+Unit tests for src/analytics/factor_pca.py
+
+Covers: resolve_pca_method, fit_pca (randomized vs full agreement),
+IncrementalFactorModel (persisted partial updates, universe changes) and the
+large-universe path of FinancialAnalytics.pca_analysis.
+
+No live network calls — returns come from a synthetic 3-factor model.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.factor_pca import (
+    LARGE_UNIVERSE_THRESHOLD,
+    IncrementalFactorModel,
+    fit_pca,
+    resolve_pca_method,
+)
+
+
+def _factor_returns(n_days=400, n_tickers=120, seed=0):
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(0, [0.010, 0.006, 0.004], size=(n_days, 3))
+    loadings = rng.normal(1.0, 0.4, size=(3, n_tickers)) * np.array([[1.0], [0.8], [0.6]])
+    data = factors @ loadings + rng.normal(0, 0.008, size=(n_days, n_tickers))
+    index = pd.bdate_range('2022-01-03', periods=n_days)
+    return pd.DataFrame(data, index=index, columns=[f'TK{i:03d}' for i in range(n_tickers)])
+
+
+@pytest.mark.unit
+def test_resolve_method_by_universe_size():
+    assert resolve_pca_method('auto', LARGE_UNIVERSE_THRESHOLD) == 'full'
+    assert resolve_pca_method('auto', LARGE_UNIVERSE_THRESHOLD + 1) == 'randomized'
+    assert resolve_pca_method('incremental', 5) == 'incremental'
+    with pytest.raises(ValueError):
+        resolve_pca_method('kernel', 5)
+
+
+@pytest.mark.unit
+def test_randomized_matches_full_top_components():
+    X = _factor_returns().values
+    X = (X - X.mean(axis=0)) / X.std(axis=0)
+    full = fit_pca(X, 5, 'full')
+    fast = fit_pca(X, 5, 'randomized')
+    # The factor components are recovered exactly; the noise tail only approximately
+    np.testing.assert_allclose(fast.explained_variance_ratio_[:3], full.explained_variance_ratio_[:3], rtol=1e-3)
+    np.testing.assert_allclose(fast.explained_variance_ratio_, full.explained_variance_ratio_, rtol=0.02)
+    np.testing.assert_allclose(np.abs(fast.components_[:2]), np.abs(full.components_[:2]), atol=1e-3)
+
+
+@pytest.mark.unit
+def test_incremental_model_only_folds_in_new_days():
+    returns = _factor_returns()
+    tickers = list(returns.columns)
+
+    first = IncrementalFactorModel(tickers, 3)
+    first.update(returns.iloc[:-5])
+    assert first.rows_added == len(returns) - 5
+
+    # A new process picks up the persisted state and only sees the last 5 days
+    second = IncrementalFactorModel(tickers, 3)
+    pca, scaler = second.update(returns)
+    assert second.rows_added == 5
+    assert pca.n_samples_seen_ == len(returns)
+    assert scaler.mean_.shape == (len(tickers),)
+
+    reference = IncrementalFactorModel(tickers, 3, persist=False)
+    ref_pca, _ = reference.update(returns)
+    np.testing.assert_allclose(
+        pca.explained_variance_ratio_, ref_pca.explained_variance_ratio_, rtol=0.05
+    )
+
+    third = IncrementalFactorModel(tickers, 3)
+    third.update(returns)
+    assert third.rows_added == 0
+
+
+@pytest.mark.unit
+def test_incremental_model_refits_for_new_universe():
+    returns = _factor_returns()
+    IncrementalFactorModel(list(returns.columns), 3).update(returns)
+    subset = list(returns.columns[:40])
+    model = IncrementalFactorModel(subset, 3)
+    pca, _ = model.update(returns[subset])
+    assert model.rows_added == len(returns)
+    assert pca.components_.shape == (3, 40)
+
+
+@pytest.mark.unit
+def test_pca_analysis_large_universe_mode(monkeypatch):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    returns = _factor_returns()
+    fa = FinancialAnalytics()
+    monkeypatch.setattr(fa, 'get_historical_returns', lambda *a, **k: returns)
+    result = fa.pca_analysis(list(returns.columns))
+
+    assert result['Summary']['Method'] == 'randomized'
+    assert result['Summary']['Total Components'] == 10
+    assert len(result['Component Loadings']['PC1']) == returns.shape[1]
+    # Three factors dominate: the top-10 components explain most, not all, variance
+    assert 0.5 < result['Summary']['Total Variance Explained'] < 1.0
+    assert result['Summary']['Components for 95% Variance'] is None
+
+
+@pytest.mark.unit
+def test_pca_analysis_incremental_method(monkeypatch):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    returns = _factor_returns(n_tickers=20)
+    fa = FinancialAnalytics()
+    monkeypatch.setattr(fa, 'get_historical_returns', lambda *a, **k: returns)
+    result = fa.pca_analysis(list(returns.columns), n_components=3, method='incremental')
+    assert result['Summary']['Method'] == 'incremental'
+    assert list(result['Explained Variance Ratio']) == ['PC1', 'PC2', 'PC3']
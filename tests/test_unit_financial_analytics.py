@@ -3,9 +3,11 @@ Unit tests for src/analytics/financial_analytics.py
 
 Covers: fundamental_analysis, _analyze_valuation, _analyze_profitability,
 _analyze_financial_health, _analyze_growth, compute_pct_increase,
-_parse_numeric_value, _extract_metric, _interpret_regression.
+_parse_numeric_value, _extract_metric, _interpret_regression,
+monte_carlo_var_es_batch, _simulate_growth, _simulate_fhs_growth,
+_ewma_standardize, _regression_statistics, linear_regression_batch.
 
-No live network calls — all inputs are synthetic dicts.
+No live network calls — all inputs are synthetic dicts or return frames.
 """
 import pytest
 from src.analytics.financial_analytics import FinancialAnalytics
@@ -196,3 +198,171 @@ def test_extract_metric_missing_returns_none(fa):
 def test_extract_metric_na_string_returns_none(fa):
     val = fa._extract_metric({'P/E Ratio': 'N/A'}, ['P/E Ratio'])
     assert val is None
+
+
+# ---------------------------------------------------------------------------
+# monte_carlo_var_es_batch — one fetch, per-ticker results
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def synthetic_returns():
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({
+        'AAA': rng.normal(0.0005, 0.010, 300),
+        'BBB': rng.normal(0.0002, 0.025, 300),
+    })
+
+
+@pytest.mark.unit
+def test_mc_batch_fetches_returns_once(fa, synthetic_returns, monkeypatch):
+    calls = []
+
+    def _fake_returns(tickers, *args, **kwargs):
+        calls.append(list(tickers))
+        return synthetic_returns[[t for t in tickers if t in synthetic_returns]]
+
+    monkeypatch.setattr(fa, 'get_historical_returns', _fake_returns)
+    result = fa.monte_carlo_var_es_batch(
+        ['AAA', 'BBB', 'ZZZ'], simulations=2000, forecast_days=20
+    )
+    assert len(calls) == 1
+    assert result['ZZZ'] == {'error': 'No valid data for ticker'}
+    for ticker in ('AAA', 'BBB'):
+        assert 'error' not in result[ticker]
+        assert result[ticker]['Portfolio Composition'] == {ticker: 100.0}
+    # The more volatile name carries the larger tail risk
+    key = 'VaR at 95.0% confidence'
+    assert result['BBB']['VaR'][key]['Value'] > result['AAA']['VaR'][key]['Value']
+
+
+@pytest.mark.unit
+def test_mc_batch_block_size_does_not_change_shape(fa, synthetic_returns, monkeypatch):
+    import numpy as np
+
+    means = synthetic_returns.mean().values
+    stds = synthetic_returns.std().values
+    growth, label = fa._simulate_growth(means, stds, 500, 10, max_block_elements=1)
+    assert growth.shape == (2, 500)
+    assert label == 'GBM (Black-Scholes)'
+    assert np.all(growth > 0)
+
+
+@pytest.mark.unit
+def test_mc_batch_unknown_model_reports_error(fa, synthetic_returns, monkeypatch):
+    monkeypatch.setattr(fa, 'get_historical_returns', lambda *a, **k: synthetic_returns)
+    result = fa.monte_carlo_var_es_batch(['AAA', 'BBB'], simulations=100, model='heston')
+    assert all('error' in r for r in result.values())
+
+
+# ---------------------------------------------------------------------------
+# Filtered historical simulation (model="fhs")
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_ewma_standardize_matches_recursion(fa, synthetic_returns):
+    import numpy as np
+
+    x = synthetic_returns.values - synthetic_returns.values.mean(axis=0)
+    residuals, current_vol = fa._ewma_standardize(x, 0.94)
+
+    var = (x**2).mean(axis=0)
+    expected = np.empty_like(x)
+    for t in range(len(x)):
+        expected[t] = x[t] / np.sqrt(var)
+        var = 0.94 * var + 0.06 * x[t] ** 2
+    np.testing.assert_allclose(residuals, expected, rtol=1e-10)
+    np.testing.assert_allclose(current_vol, np.sqrt(var), rtol=1e-10)
+
+
+@pytest.mark.unit
+def test_fhs_rescales_by_current_volatility(fa):
+    import numpy as np
+
+    rng = np.random.default_rng(5)
+    calm_then_stressed = np.concatenate([rng.normal(0, 0.005, 250), rng.normal(0, 0.04, 20)])
+    stressed_then_calm = calm_then_stressed[::-1].copy()
+    history = np.column_stack([calm_then_stressed, stressed_then_calm])
+
+    np.random.seed(0)
+    growth, label = fa._simulate_fhs_growth(history, 4000, 10, {'block_size': 3})
+    assert growth.shape == (2, 4000)
+    assert label.startswith('Filtered Historical Simulation')
+    # Same residual pool, but the series that ends in turbulence is scaled up
+    assert np.std(growth[0]) > 2 * np.std(growth[1])
+
+
+@pytest.mark.unit
+def test_monte_carlo_fhs_uses_fetched_returns(fa, synthetic_returns, monkeypatch):
+    calls = []
+
+    def _fake_returns(tickers, *args, **kwargs):
+        calls.append(list(tickers))
+        return synthetic_returns
+
+    monkeypatch.setattr(fa, 'get_historical_returns', _fake_returns)
+    result = fa.monte_carlo_var_es(
+        ['AAA', 'BBB'], simulations=2000, forecast_days=20, model='fhs'
+    )
+    assert 'error' not in result
+    assert len(calls) == 1
+    assert result['Simulation Parameters']['Model'].startswith('Filtered Historical Simulation')
+    assert 'Stress Test' in result
+
+
+# ---------------------------------------------------------------------------
+# Batched regression — closed-form OLS, one benchmark fetch per exchange
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_regression_statistics_match_linregress(fa):
+    import numpy as np
+    from scipy import stats
+
+    rng = np.random.default_rng(11)
+    x = rng.normal(0, 0.01, 250)
+    Y = np.column_stack([0.0002 + 1.3 * x + rng.normal(0, 0.01, 250),
+                         -0.0001 + 0.4 * x + rng.normal(0, 0.02, 250)])
+    Y[:30, 1] = np.nan  # late listing
+    result = fa._regression_statistics(x, Y)
+
+    for j in range(2):
+        ok = ~np.isnan(Y[:, j])
+        ref = stats.linregress(x[ok], Y[ok, j])
+        assert result['beta'][j] == pytest.approx(ref.slope)
+        assert result['alpha'][j] == pytest.approx(ref.intercept)
+        assert result['r_squared'][j] == pytest.approx(ref.rvalue**2)
+        assert result['beta_se'][j] == pytest.approx(ref.stderr)
+        assert result['alpha_se'][j] == pytest.approx(ref.intercept_stderr)
+    assert list(result['n']) == [250, 220]
+
+
+@pytest.mark.unit
+def test_regression_batch_fetches_each_benchmark_once(fa, monkeypatch):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(2)
+    market = rng.normal(0, 0.01, 252)
+    columns = {'SPY': market, '^STI': rng.normal(0, 0.008, 252)}
+    for i, beta in enumerate([0.5, 1.0, 1.5]):
+        columns[f'US{i}'] = beta * market + rng.normal(0, 0.005, 252)
+    columns['D05.SI'] = 0.9 * columns['^STI'] + rng.normal(0, 0.004, 252)
+    frame = pd.DataFrame(columns)
+    calls = []
+
+    def _fake_returns(tickers, *args, **kwargs):
+        calls.append(list(tickers))
+        return frame[[t for t in tickers if t in frame]]
+
+    monkeypatch.setattr(fa, 'get_historical_returns', _fake_returns)
+    result = fa.linear_regression_batch(['US0', 'US1', 'US2', 'D05.SI', 'ZZZ'])
+
+    assert sorted(call[-1] for call in calls) == ['SPY', '^STI']
+    assert result['US2']['Benchmark'] == 'SPY'
+    assert result['D05.SI']['Benchmark'] == '^STI'
+    assert result['US2']['US2']['Beta'] == pytest.approx(1.5, abs=0.1)
+    assert result['US2']['US2']['Beta t-Stat'] > 10
+    assert 'error' in result['ZZZ']
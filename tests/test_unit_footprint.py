@@ -153,3 +153,115 @@ def test_composite_footprint_dissenter():
     result = compute_composite_bias(results, footprint_result=fp)
     assert result['direction'] == 'bullish'
     assert 'Footprint' in result['dissenters'], f"Footprint should dissent, got {result['dissenters']}"
+
+
+# FOOT-02: heatmap cells and POC match a per-row (day, bin) aggregation
+def test_footprint_matrix_matches_per_row_aggregation(fp_df):
+    result = compute_footprint(fp_df, 'TEST')
+    heatmap, poc = result['traces'][0], result['traces'][1]
+    z = np.array(heatmap['z'])
+    centers = np.array(heatmap['y'])
+    edges = np.linspace(fp_df['Low'].min(), fp_df['High'].max(), len(centers) + 1)
+
+    days = sorted({ts.strftime('%Y-%m-%d') for ts in fp_df.index})
+    assert list(heatmap['x']) == days
+    ref_delta = np.zeros_like(z)
+    ref_vol = np.zeros_like(z)
+    for ts, row in fp_df.iterrows():
+        b = min(max(int(np.digitize(row['Close'], edges)) - 1, 0), len(centers) - 1)
+        d = days.index(ts.strftime('%Y-%m-%d'))
+        rng = max(row['High'] - row['Low'], 1e-10)
+        buy = (row['Close'] - row['Low']) / rng * row['Volume']
+        ref_delta[d, b] += 2 * buy - row['Volume']
+        ref_vol[d, b] += row['Volume']
+    np.testing.assert_allclose(z, ref_delta, rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(poc['y'], centers[ref_vol.argmax(axis=1)])
+
+
+def _make_sessions(n_days, start='2024-01-02', seed=3):
+    days = pd.bdate_range(start, periods=n_days)
+    idx = pd.DatetimeIndex([d + pd.Timedelta(minutes=570 + 15 * i) for d in days for i in range(26)])
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.3, len(idx)))
+    return pd.DataFrame({
+        'Open': close, 'High': close + rng.uniform(0, 0.4, len(idx)),
+        'Low': close - rng.uniform(0, 0.4, len(idx)), 'Close': close,
+        'Volume': rng.uniform(1e4, 1e5, len(idx)),
+    }, index=idx)
+
+
+# FOOT-04: cells appended in batches (one split mid-day) match a per-bar aggregation
+def test_archive_cells_are_maintained_incrementally(state_dir):
+    from src.analytics.trading_indicators import IntradayArchive
+    bars = _make_sessions(30)
+    archive = IntradayArchive('AAA')
+    assert archive.append(bars.iloc[:400]) == 400
+    archive.save()
+    for chunk in (bars.iloc[300:610], bars.iloc[610:]):
+        archive = IntradayArchive('AAA')
+        assert archive.load()
+        archive.append(chunk)
+        archive.save()
+    assert archive.bars.equals(bars)
+
+    day_rows = np.unique(bars.index.normalize(), return_inverse=True)[1]
+    cell_cols = np.floor(bars['Close'].values / archive.step).astype(int) - archive.base
+    ref_delta = np.zeros_like(archive.delta)
+    ref_vol = np.zeros_like(archive.volume)
+    delta = (2 * (bars['Close'] - bars['Low']) / (bars['High'] - bars['Low']) - 1) * bars['Volume']
+    np.add.at(ref_delta, (day_rows, cell_cols), delta.values)
+    np.add.at(ref_vol, (day_rows, cell_cols), bars['Volume'].values)
+    np.testing.assert_allclose(archive.delta, ref_delta, atol=1e-6)
+    np.testing.assert_allclose(archive.volume, ref_vol, atol=1e-6)
+
+
+# FOOT-04: archived cells feed compute_footprint; partial days are rejected
+def test_footprint_from_archive_cells(state_dir):
+    from src.analytics.trading_indicators import IntradayArchive
+    bars = _make_sessions(20)
+    archive = IntradayArchive('AAA')
+    archive.append(bars)
+    window = archive.window(10)
+    assert window.index[0] == pd.Timestamp('2024-01-22 09:30')
+
+    cells = archive.footprint_cells(window)
+    result = compute_footprint(window, 'AAA', cells=cells)
+    heatmap = result['traces'][0]
+    assert len(heatmap['x']) == 6
+    np.testing.assert_allclose(np.array(heatmap['z']).sum(), result['cum_delta'], rtol=1e-9)
+    assert result['cum_delta'] == pytest.approx(compute_footprint(window, 'AAA')['cum_delta'])
+    assert archive.footprint_cells(window.iloc[1:]) is None
+
+
+# FOOT-04: get_intraday downloads only bars after the archive and serves longer windows offline
+def test_get_intraday_appends_and_serves_archive(state_dir):
+    from src.analytics.trading_indicators import IntradayArchive, get_intraday
+    bars = _make_sessions(90)
+    with patch('src.analytics.trading_indicators.fetch_intraday') as mock_fetch:
+        mock_fetch.return_value = bars.iloc[:26 * 60]
+        df, cells = get_intraday('AAA', 60)
+        assert mock_fetch.call_args[0][1] == 59
+        assert df.index[-1] == bars.index[26 * 60 - 1] and cells is not None
+
+        # Same day: served from the archive without downloading
+        get_intraday('AAA', 60)
+        assert mock_fetch.call_count == 1
+
+        archive = IntradayArchive('AAA')
+        archive.load()
+        archive.as_of = None
+        archive.save()
+        mock_fetch.return_value = bars.iloc[26 * 50:]
+        df, cells = get_intraday('AAA', 200)
+        assert mock_fetch.call_count == 2
+        assert df.equals(bars)
+        assert len(cells[0]) == 90
+
+        # Download failures fall back to the archive
+        archive.load()
+        archive.as_of = None
+        archive.save()
+        mock_fetch.side_effect = ValueError('No 15m intraday data returned for AAA')
+        assert get_intraday('AAA', 200)[0].equals(bars)
+        with pytest.raises(ValueError):
+            get_intraday('BBB', 60)
@@ -0,0 +1,174 @@
+"""
+Unit tests for src/analytics/garch_volatility.py
+
+Covers: garch_neg_log_likelihood (analytic gradient, missing values),
+GarchForecaster.fit parameter recovery, persisted warm starts / reuse,
+forecast term structure, and the volatility feeds into stress_test_var and
+RegimeDetector.
+
+No live network calls — returns are simulated GARCH(1,1) paths. Persisted
+state goes to a per-test temporary directory.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.garch_volatility import GarchForecaster, garch_neg_log_likelihood
+
+
+def _simulate_garch(n_obs, n_assets, omega=2e-6, alpha=0.08, beta=0.90, seed=0):
+    rng = np.random.default_rng(seed)
+    h = np.full(n_assets, omega / (1 - alpha - beta))
+    out = np.empty((n_obs, n_assets))
+    for t in range(n_obs):
+        e = rng.standard_normal(n_assets) * np.sqrt(h)
+        out[t] = e
+        h = omega + alpha * e**2 + beta * h
+    index = pd.bdate_range('2021-01-04', periods=n_obs)
+    return pd.DataFrame(out, index=index, columns=[f'T{i}' for i in range(n_assets)])
+
+
+@pytest.fixture
+def universe():
+    return _simulate_garch(1000, 40)
+
+
+# ---------------------------------------------------------------------------
+# Likelihood
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_gradient_matches_finite_differences(universe):
+    values = universe.values.copy()
+    values[:40, 2] = np.nan  # late listing
+    mask = ~np.isnan(values)
+    eps = np.where(mask, values - np.nanmean(values, axis=0), 0.0)
+    target = (eps**2).sum(axis=0) / mask.sum(axis=0)
+    x = np.tile([0.95, 0.2], (values.shape[1], 1))
+
+    _, grad, opg, _, _ = garch_neg_log_likelihood(x, eps, mask, target)
+    numeric = np.zeros_like(grad)
+    for j in range(2):
+        d = np.zeros_like(x)
+        d[:, j] = 1e-6
+        up = garch_neg_log_likelihood(x + d, eps, mask, target, with_grad=False)[0]
+        down = garch_neg_log_likelihood(x - d, eps, mask, target, with_grad=False)[0]
+        numeric[:, j] = (up - down) / 2e-6
+    np.testing.assert_allclose(grad, numeric, rtol=1e-4, atol=1e-3)
+    assert opg.shape == (values.shape[1], 2, 2)
+
+
+# ---------------------------------------------------------------------------
+# GarchForecaster
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_fit_recovers_parameters(universe):
+    result = GarchForecaster(persist=False).fit(universe)
+    alpha = np.median([r['alpha'] for r in result.values()])
+    beta = np.median([r['beta'] for r in result.values()])
+    assert alpha == pytest.approx(0.08, abs=0.03)
+    assert beta == pytest.approx(0.90, abs=0.04)
+    assert all(r['persistence'] < 1 for r in result.values())
+
+
+@pytest.mark.unit
+def test_short_series_reported_not_fitted(universe):
+    data = universe.iloc[:, :3].copy()
+    data.iloc[:-10, 0] = np.nan
+    result = GarchForecaster(persist=False).fit(data)
+    assert 'error' in result['T0']
+    assert 'next_day_vol' in result['T1']
+
+
+@pytest.mark.unit
+def test_persisted_fit_is_reused_then_warm_started(universe):
+    first = GarchForecaster().fit(universe)
+    assert not any(r['warm_start'] for r in first.values())
+
+    same_day = GarchForecaster().fit(universe)
+    assert all(r['reused'] for r in same_day.values())
+    assert same_day['T0']['alpha'] == pytest.approx(first['T0']['alpha'])
+
+    next_day = GarchForecaster().fit(universe.iloc[1:])
+    assert all(r['warm_start'] and not r['reused'] for r in next_day.values())
+
+
+@pytest.mark.unit
+def test_fits_of_disjoint_tickers_are_all_kept(universe):
+    # Workers fitting different tickers (stale views of the state included)
+    # must not drop each other's fits
+    stale = GarchForecaster()
+    stale.fit(universe.iloc[:, :20])
+    GarchForecaster().fit(universe.iloc[:, 20:])
+    stale._save_state({'T0': stale.params['T0']})
+
+    combined = GarchForecaster().fit(universe)
+    assert all(r['reused'] for r in combined.values())
+
+
+@pytest.mark.unit
+def test_forecast_term_structure_reverts_to_long_run(universe):
+    forecaster = GarchForecaster(persist=False)
+    forecaster.fit(universe)
+    one_day = forecaster.forecast(1)
+    long_horizon = forecaster.forecast(5000)
+    long_run = pd.Series({t: p['long_run_vol'] for t, p in forecaster.params.items()})
+
+    np.testing.assert_allclose(one_day, np.sqrt(forecaster.next_variance))
+    assert (
+        (long_horizon - long_run).abs() < (one_day - long_run).abs() + 1e-12
+    ).all()
+    assert forecaster.conditional_volatility.shape == universe.shape
+
+
+# ---------------------------------------------------------------------------
+# Volatility feeds
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_stress_test_uses_garch_volatility(universe):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    returns = universe.iloc[:, :3].copy()
+    # End the sample in a volatility spike: GARCH vol rises, sample vol barely moves
+    returns.iloc[-10:] *= 6
+    fa = FinancialAnalytics()
+    kwargs = dict(simulations=5000, returns=returns)
+    historical = fa.stress_test_var(list(returns.columns), **kwargs)
+    garch = fa.stress_test_var(list(returns.columns), volatility_model='garch', **kwargs)
+
+    assert garch['Parameters']['Volatility Model'] == 'GARCH(1,1)'
+    assert garch['Base Case']['Avg Volatility'] > historical['Base Case']['Avg Volatility']
+
+
+@pytest.mark.unit
+def test_regime_detector_reports_volatility_forecast(universe):
+    from src.analytics.regime_detection import RegimeDetector
+
+    returns = universe['T0'].values[:80]
+    np.random.seed(0)
+    result = RegimeDetector().fit(returns, n_restarts=1, volatility_forecast=0.05)
+    assert result['volatility_forecast']['closest_regime'] in ('calm', 'stressed')
+    assert result['volatility_forecast']['sigma_annualized'] == pytest.approx(0.05 * np.sqrt(252))
+
+
+@pytest.mark.unit
+def test_monte_carlo_garch_volatility_and_fhs_filter(universe, monkeypatch):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    returns = universe.iloc[:, :2]
+    fa = FinancialAnalytics()
+    monkeypatch.setattr(fa, 'get_historical_returns', lambda *a, **k: returns)
+
+    gbm = fa.monte_carlo_var_es(
+        list(returns.columns), simulations=1000, forecast_days=5, volatility_model='garch'
+    )
+    assert gbm['Simulation Parameters']['Model'].endswith('with GARCH(1,1) volatility')
+    assert gbm['Stress Test']['Parameters']['Volatility Model'] == 'GARCH(1,1)'
+
+    fhs = fa.monte_carlo_var_es(
+        list(returns.columns), simulations=1000, forecast_days=5,
+        model='fhs', fhs_params={'filter': 'garch'},
+    )
+    assert fhs['Simulation Parameters']['Model'] == 'Filtered Historical Simulation (GARCH(1,1))'
@@ -0,0 +1,85 @@
+"""
+Unit tests for src/utils/metric_index.py
+
+Covers: parse_numeric suffix / percent / currency / missing-value handling,
+MetricIndex.lookup precedence (exact, substring, nested section), memoized
+parsing, and the consumers that share an index (fundamental_analysis,
+sheets _extract_fields, comparison normalize_data).
+"""
+import pytest
+
+from src.utils.metric_index import MetricIndex, parse_numeric
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('raw, expected', [
+    (42, 42.0),
+    ('15.3%', 15.3),
+    ('$1,234.50', 1234.5),
+    ('2.80T', 2.8e12),
+    ('350B', 3.5e11),
+    ('12.5M', 1.25e7),
+    ('8K', 8000.0),
+    ('(1.2B)', -1.2e9),
+    ('-4.1%', -4.1),
+])
+def test_parse_numeric_values(raw, expected):
+    assert parse_numeric(raw) == pytest.approx(expected)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('raw', [None, 'N/A', 'N/A%', '--', '', 'Bullish', True, float('nan')])
+def test_parse_numeric_missing(raw):
+    assert parse_numeric(raw) is None
+
+
+@pytest.mark.unit
+def test_lookup_precedence():
+    data = {
+        'Trailing P/E (Finviz)': '31.0',
+        'P/E Ratio (Yahoo)': 'N/A',
+        'P/E Ratio (Google)': '28.4',
+        'valuation': {'PEG Ratio': '1.7'},
+    }
+    index = MetricIndex(data)
+    # Exact key is not numeric, so the first substring match in payload order wins
+    assert index.lookup(['P/E Ratio', 'P/E']) == pytest.approx(28.4)
+    assert index.lookup(['PEG Ratio']) == pytest.approx(1.7)
+    assert index.lookup(['Nonexistent']) is None
+
+
+@pytest.mark.unit
+def test_values_are_parsed_once(monkeypatch):
+    import src.utils.metric_index as metric_index
+
+    calls = []
+    real = metric_index.parse_numeric
+    monkeypatch.setattr(metric_index, 'parse_numeric', lambda v: calls.append(v) or real(v))
+    index = MetricIndex({'ROE (Yahoo)': '15.3%'})
+    for _ in range(3):
+        assert index.lookup(['ROE']) == pytest.approx(15.3)
+        assert index.lookup(['Return on Equity', 'ROE']) == pytest.approx(15.3)
+    assert calls.count('15.3%') == 1
+
+
+@pytest.mark.unit
+def test_consumers_share_one_index():
+    from src.analytics.financial_analytics import FinancialAnalytics
+    from src.utils.comparison_utils import normalize_data
+    from src.utils.sheets_utils import _extract_fields
+
+    index = MetricIndex.of({
+        'P/E Ratio (Yahoo)': '12.5',
+        'ROE (Yahoo)': '24.0%',
+        'Market Cap (Yahoo)': '2.80T',
+        'Current Price (Yahoo)': '$189.30',
+    })
+    assert MetricIndex.of(index) is index
+
+    analysis = FinancialAnalytics().fundamental_analysis(index, 'AAA')
+    assert analysis['valuation_score'] > 5
+    assert _extract_fields(index)['pe'] == pytest.approx(12.5)
+    assert _extract_fields(index)['price'] == pytest.approx(189.30)
+    normalized = normalize_data({'AAA': index})['AAA']
+    assert normalized['ROE'] == pytest.approx(24.0)
+    assert normalized['Current Price'] == pytest.approx(189.30)
@@ -210,6 +210,30 @@ def test_credit_risk_degenerate_labels():
     )
 
 
+@pytest.mark.unit
+def test_credit_scorer_is_shared_and_batch_matches_single():
+    """One persisted scorer serves every ratio vector; global RNG is untouched."""
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    rng_state = np.random.get_state()[1].copy()
+    distressed = {"debt_to_equity": 3.0, "earnings_growth": -0.3}
+    batch = ml_signals.score_credit_risk_batch(
+        {"AAA": _GOOD_RATIOS, "BBB": distressed, "CCC": _EXCEPTIONAL_RATIOS}
+    )
+    np.testing.assert_array_equal(np.random.get_state()[1], rng_state)
+
+    assert batch["BBB"]["p_distress"] > batch["AAA"]["p_distress"]
+    assert batch["CCC"]["degenerate_labels"] is True
+
+    # A cold process loads the stored scorer instead of training it again
+    clear_ml_caches()
+    with patch("src.analytics.ml_signals._train_credit_model", side_effect=AssertionError):
+        single = compute_credit_risk_score("BBB", distressed)
+    assert single == batch["BBB"]
+
+
 # ---------------------------------------------------------------------------
 # Tests — LSTM direction signal
 # ---------------------------------------------------------------------------
@@ -295,7 +319,329 @@ def test_kmeans_regime_ranging_sets_models_agree_to_none():
             hmm_instance = mock_hmm_cls.return_value
             hmm_instance.fit.return_value = {"current_regime": "calm"}
 
-            result = compute_kmeans_regime("AAPL")
+            result = compute_kmeans_regime("AAPL", incremental=False)
 
     assert result["current_regime"] == "Ranging"
     assert result["models_agree"] is None
+
+
+# ---------------------------------------------------------------------------
+# Feature store
+# ---------------------------------------------------------------------------
+
+
+class _FakeFeed:
+    """fetch_ohlcv stand-in over a fixed history, 'today' movable by the test."""
+
+    def __init__(self, n=900):
+        self.full = _make_ohlcv(n)
+        self.end = self.full.index[-40]
+        self.calls = []
+
+    def __call__(self, ticker, days):
+        self.calls.append(days)
+        start = self.end - pd.Timedelta(days=int(days * 1.4))
+        return self.full[(self.full.index >= start) & (self.full.index <= self.end)]
+
+
+@pytest.mark.unit
+def test_feature_store_downloads_once_for_all_models():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics.ml_signals import get_feature_frame
+
+    feed = _FakeFeed()
+    with patch("src.analytics.ml_signals.fetch_ohlcv", side_effect=feed), patch(
+        "src.analytics.regime_detection.RegimeDetector"
+    ):
+        compute_ml_direction_signal("AAPL")
+        compute_kmeans_regime("AAPL")
+        window = get_feature_frame("AAPL", days=365)
+
+    assert len(feed.calls) == 1
+    # The 365-day window matches a fresh download of that window
+    fresh = feed(None, 365)
+    pd.testing.assert_index_equal(window.index, fresh.index)
+    np.testing.assert_allclose(
+        window["Return"].values, fresh["Close"].pct_change().values, equal_nan=True
+    )
+
+
+@pytest.mark.unit
+def test_feature_store_extends_incrementally_on_new_day():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    feed = _FakeFeed()
+    with patch("src.analytics.ml_signals.fetch_ohlcv", side_effect=feed):
+        ml_signals.get_feature_frame("AAPL")
+        feed.end = feed.full.index[-35]
+        with patch("src.analytics.ml_signals._today", return_value="2099-01-01"):
+            extended = ml_signals.get_feature_frame("AAPL")
+
+    assert feed.calls == [ml_signals.FEATURE_HISTORY_DAYS, ml_signals.FEATURE_REFRESH_DAYS]
+    fresh = ml_signals._build_features(feed(None, ml_signals.FEATURE_HISTORY_DAYS))
+    pd.testing.assert_index_equal(extended.index, fresh.index)
+    pd.testing.assert_frame_equal(extended, fresh, check_exact=False, rtol=1e-10)
+
+
+@pytest.mark.unit
+def test_feature_store_is_bounded():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from cachetools import LRUCache
+    from src.analytics import ml_signals
+
+    feed = _FakeFeed()
+    with patch("src.analytics.ml_signals.fetch_ohlcv", side_effect=feed), patch.object(
+        ml_signals, "_feature_store", LRUCache(maxsize=3)
+    ):
+        for ticker in ["AAA", "BBB", "CCC", "DDD"]:
+            ml_signals.get_feature_frame(ticker)
+        assert set(ml_signals._feature_store) == {"BBB", "CCC", "DDD"}
+    # Per-ticker build locks are released once no request holds them
+    assert len(ml_signals._feature_locks) == 0
+
+
+# ---------------------------------------------------------------------------
+# Model registry
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_direction_model_is_reused_across_processes():
+    """A stored model serves a cold process without any training."""
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    with patch("src.analytics.ml_signals.fetch_ohlcv", return_value=_make_ohlcv()):
+        first = compute_ml_direction_signal("AAPL")
+        clear_ml_caches()
+        with patch("src.analytics.ml_signals._halving_search", side_effect=AssertionError), patch(
+            "src.analytics.ml_signals.RandomForestClassifier", side_effect=AssertionError
+        ):
+            second = compute_ml_direction_signal("AAPL")
+
+    assert first["model_update"]["action"] == "searched"
+    assert second["model_update"]["action"] == "loaded"
+    assert second["confidence"] == pytest.approx(first["confidence"])
+    assert second["best_params"] == first["best_params"]
+    # Per-model locks are released once no request holds them
+    assert len(ml_signals._model_locks) == 0
+
+
+@pytest.mark.unit
+def test_direction_model_retrains_on_schedule_with_stored_params():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    with patch("src.analytics.ml_signals.fetch_ohlcv", return_value=_make_ohlcv()):
+        with patch("src.analytics.ml_signals._today", return_value="2024-01-01"):
+            first = compute_ml_direction_signal("AAPL")
+        retrain_day = "2024-01-%02d" % (1 + ml_signals.MODEL_RETRAIN_DAYS)
+        with patch("src.analytics.ml_signals._today", return_value=retrain_day), patch(
+            "src.analytics.ml_signals._halving_search", side_effect=AssertionError
+        ):
+            retrained = compute_ml_direction_signal("AAPL")
+        clear_ml_caches()
+        with patch("src.analytics.ml_signals._today", return_value="2024-03-01"):
+            searched = compute_ml_direction_signal("AAPL")
+
+    assert retrained["model_update"] == {
+        "action": "retrained", "trained_on": retrain_day, "searched_on": "2024-01-01"
+    }
+    assert retrained["best_params"] == first["best_params"]
+    assert searched["model_update"]["action"] == "searched"
+
+
+@pytest.mark.unit
+def test_halving_search_reaches_full_forest():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 4))
+    y = (X[:, 0] + 0.5 * rng.normal(size=300) > 0).astype(int)
+
+    params = ml_signals._halving_search(X, y)
+    assert params["n_estimators"] == ml_signals.RF_SEARCH_MAX_TREES
+    assert params["max_depth"] in ml_signals._RF_PARAM_DIST["max_depth"]
+
+    # An exhausted budget stops after the first (cheapest) round but still asks for a full forest
+    capped = ml_signals._halving_search(X, y, time_budget=0.0)
+    assert capped["n_estimators"] == ml_signals.RF_SEARCH_MAX_TREES
+
+
+@pytest.mark.unit
+def test_budget_cut_search_stores_full_forest():
+    """A search stopped by the time budget must not persist a small forest for later retrains."""
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import model_registry, ml_signals
+
+    with patch("src.analytics.ml_signals.fetch_ohlcv", return_value=_make_ohlcv()), patch(
+        "src.analytics.ml_signals.RF_SEARCH_TIME_BUDGET", 0.0
+    ):
+        result = compute_ml_direction_signal("AAPL")
+
+    assert result["model_update"]["action"] == "searched"
+    model, manifest = model_registry.load_model("rf_direction", "AAPL")
+    assert manifest["best_params"]["n_estimators"] == ml_signals.RF_SEARCH_MAX_TREES
+    assert len(model["model"].estimators_) == ml_signals.RF_SEARCH_MAX_TREES
+
+
+# ---------------------------------------------------------------------------
+# Batch signals
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_batch_signals_inline_per_ticker():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics.ml_signals import compute_ml_signals_batch
+
+    feed = _FakeFeed()
+    with patch("src.analytics.ml_signals.fetch_ohlcv", side_effect=feed), patch(
+        "src.analytics.ml_signals.compute_kmeans_regime", side_effect=RuntimeError("boom")
+    ):
+        results = compute_ml_signals_batch(["aapl", "AAPL ", "msft"], ["direction", "regime"], max_workers=1)
+
+    assert list(results) == ["AAPL", "MSFT"]
+    assert results["AAPL"]["signals"]["direction"]["signal"] in ("Bullish", "Bearish")
+    # A failing feature is reported without losing the others
+    assert results["MSFT"]["signals"]["regime"] == {"error": "boom"}
+    # One price download per ticker, shared by its features
+    assert len(feed.calls) == 2
+
+    with pytest.raises(ValueError, match="Supported values"):
+        compute_ml_signals_batch(["AAPL"], ["pca"])
+
+
+@pytest.mark.unit
+def test_batch_workers_start_from_parent_frames_and_results():
+    """Workers get the frames built here (no download of their own); results are shared both ways."""
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    feed = _FakeFeed()
+    with patch("src.analytics.ml_signals.fetch_ohlcv", side_effect=feed):
+        single = compute_ml_direction_signal("AAPL")
+        # Spawned workers do not see this patch, so they must work from the frames built here
+        results = ml_signals.compute_ml_signals_batch(["AAPL", "MSFT", "NVDA"], ["direction"], max_workers=2)
+
+    assert results["AAPL"]["signals"]["direction"] == single
+    for ticker in ("MSFT", "NVDA"):
+        assert results[ticker]["signals"]["direction"]["signal"] in ("Bullish", "Bearish")
+    assert feed.calls == [ml_signals.FEATURE_HISTORY_DAYS] * 3
+    assert ml_signals._cached_signals("MSFT", ["direction"]) == {"direction": results["MSFT"]["signals"]["direction"]}
+
+
+@pytest.mark.unit
+def test_batch_credit_scores_each_tickers_ratios():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    ratios = {"AAA": _GOOD_RATIOS, "BBB": {"debt_to_equity": 3.0, "earnings_growth": -0.3}}
+
+    def fake_ratios(ticker):
+        if ticker not in ratios:
+            raise ValueError(f"No credit ratios reported for {ticker}")
+        return ratios[ticker]
+
+    with patch("src.analytics.ml_signals.fetch_credit_ratios", side_effect=fake_ratios), patch(
+        "src.analytics.ml_signals._iter_pool", side_effect=AssertionError
+    ):
+        results = ml_signals.compute_ml_signals_batch(["AAA", "BBB", "ZZZ"], ["credit"])
+
+    expected = ml_signals.score_credit_risk_batch(ratios)
+    assert results["AAA"]["signals"]["credit"] == expected["AAA"]
+    assert results["BBB"]["signals"]["credit"]["p_distress"] > results["AAA"]["signals"]["credit"]["p_distress"]
+    assert results["ZZZ"]["signals"]["credit"] == {"error": "No credit ratios reported for ZZZ"}
+
+
+@pytest.mark.unit
+def test_fetch_credit_ratios_maps_fundamentals():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from src.analytics import ml_signals
+
+    info = {"currentRatio": 1.2, "debtToEquity": 148.5, "earningsGrowth": -0.1, "revenueGrowth": None}
+    with patch("src.analytics.ml_signals.yf.Ticker") as mock_ticker:
+        mock_ticker.return_value.info = info
+        ratios = ml_signals.fetch_credit_ratios("AAPL")
+        mock_ticker.return_value.info = {}
+        with pytest.raises(ValueError, match="No credit ratios"):
+            ml_signals.fetch_credit_ratios("AAPL")
+
+    assert ratios == {"current_ratio": 1.2, "debt_to_equity": pytest.approx(1.485), "earnings_growth": -0.1}
+
+
+@pytest.mark.unit
+def test_batch_pool_reports_timeouts_and_errors():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    import time
+
+    from src.analytics.ml_signals import _iter_pool
+
+    tasks = [(0.05,), (2.5,), ("x",), (0.05,)]
+    outcomes = dict(_iter_pool(time.sleep, tasks, max_workers=2, timeout=1.0))
+
+    assert outcomes[(0.05,)] is None
+    assert isinstance(outcomes[(2.5,)], TimeoutError)
+    assert isinstance(outcomes[("x",)], TypeError)
+
+
+# ---------------------------------------------------------------------------
+# Incremental K-Means regime
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_kmeans_regime_updates_with_new_days_only():
+    if not IMPORT_OK:
+        pytest.skip("ml_signals not yet implemented")
+    from sklearn.cluster import MiniBatchKMeans
+
+    from src.analytics import model_registry
+
+    feed = _FakeFeed()
+    real_partial_fit = MiniBatchKMeans.partial_fit
+    batches = []
+
+    def spy_partial_fit(self, X, *args, **kwargs):
+        batches.append(len(X))
+        return real_partial_fit(self, X, *args, **kwargs)
+
+    with patch("src.analytics.ml_signals.fetch_ohlcv", side_effect=feed), patch(
+        "src.analytics.regime_detection.RegimeDetector"
+    ), patch.object(MiniBatchKMeans, "partial_fit", spy_partial_fit):
+        with patch("src.analytics.ml_signals._today", return_value="2024-01-01"):
+            first = compute_kmeans_regime("AAPL")
+            clear_ml_caches()
+            cached = compute_kmeans_regime("AAPL")
+        labels = model_registry.load_manifest("kmeans_regime", "AAPL")["labels"]
+
+        feed.end = feed.full.index[-35]
+        with patch("src.analytics.ml_signals._today", return_value="2024-01-02"), patch(
+            "src.analytics.ml_signals._label_clusters", side_effect=AssertionError
+        ):
+            updated = compute_kmeans_regime("AAPL")
+
+    assert first["model_update"]["action"] == "refit"
+    assert cached["model_update"]["action"] == "cached"
+    assert updated["model_update"]["action"] == "incremental"
+    assert updated["model_update"]["updated_through"] == str(feed.end.date())
+    # Only the five new trading days are fed to the model; cluster names are kept
+    assert batches == [5]
+    assert model_registry.load_manifest("kmeans_regime", "AAPL")["labels"] == labels
+    timeline = updated["regime_timeline_traces"][0]["y"]
+    assert set(timeline) <= set(labels.values())
+    assert updated["current_regime"] == timeline[-1]
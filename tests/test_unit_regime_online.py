@@ -0,0 +1,98 @@
+"""
+Unit tests for src/analytics/regime_online.py
+
+Covers: first-request fit and persistence, incremental forward filtering of new
+days (matching a full filter with the same parameters), cached re-reads,
+scheduled and drift-triggered refits, and refits on mismatched history.
+
+No live network calls — returns are synthetic; state is written under tmp_path.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.regime_detection import RegimeDetector
+from src.analytics.regime_online import OnlineRegimeModel
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(11)
+    returns = np.concatenate([
+        rng.normal(0.0006, 0.008, 250), rng.normal(-0.002, 0.03, 60), rng.normal(0.0006, 0.008, 100)
+    ])
+    dates = pd.bdate_range('2022-01-03', periods=len(returns)).strftime('%Y-%m-%d').to_numpy()
+    return dates, returns
+
+
+def _model(**kwargs):
+    return OnlineRegimeModel('AAA', window='test', method='em', **kwargs)
+
+
+@pytest.mark.unit
+def test_new_days_are_filtered_incrementally(series):
+    dates, returns = series
+    first = _model().analyze(dates[:-5], returns[:-5])
+    assert first['model_update']['action'] == 'refit'
+
+    model = _model()
+    result = model.analyze(dates, returns)
+    assert result['model_update']['action'] == 'incremental'
+    assert result['model_update']['observations_since_fit'] == 5
+    assert result['n_observations'] == len(returns)
+
+    # Same parameters, one uninterrupted filter over every day
+    reference, log_lik = model.detector._hamilton_filter(returns)
+    np.testing.assert_allclose(np.array(result['filtered_probs_full']), reference, atol=1e-12)
+    # Reported likelihood covers the appended days too, not just the fit
+    update = result['model_update']
+    assert update['appended_log_likelihood'] != 0.0
+    assert result['log_likelihood'] == pytest.approx(update['fit_log_likelihood'] + update['appended_log_likelihood'])
+    assert result['log_likelihood'] == pytest.approx(log_lik, abs=1e-3)
+
+
+@pytest.mark.unit
+def test_stored_model_is_reused_without_fitting(series, monkeypatch):
+    dates, returns = series
+    _model().analyze(dates[:-1], returns[:-1])
+
+    def no_fit(*args, **kwargs):
+        raise AssertionError('refit not expected')
+
+    monkeypatch.setattr(RegimeDetector, 'fit', no_fit)
+    assert _model().analyze(dates[:-1], returns[:-1])['model_update']['action'] == 'cached'
+    # A shorter window inside the stored path is served from it as well
+    sub = _model().analyze(dates[50:-1], returns[50:-1])
+    assert sub['n_observations'] == len(returns) - 51
+    assert _model().analyze(dates, returns)['model_update']['action'] == 'incremental'
+
+
+@pytest.mark.unit
+def test_refit_on_schedule(series):
+    dates, returns = series
+    _model().analyze(dates[:-1], returns[:-1])
+    result = _model(refit_days=0).analyze(dates, returns)
+    assert result['model_update']['action'] == 'refit'
+    assert result['model_update']['refit_reason'] == 'scheduled refit'
+
+
+@pytest.mark.unit
+def test_refit_on_likelihood_drift(series):
+    dates, returns = series
+    _model().analyze(dates[:-6], returns[:-6])
+    shocked = returns.copy()
+    shocked[-6:] = [0.2, -0.25, 0.3, -0.2, 0.22, -0.3]
+    result = _model().analyze(dates, shocked)
+    assert result['model_update']['action'] == 'refit'
+    assert 'drift' in result['model_update']['refit_reason']
+
+
+@pytest.mark.unit
+def test_refit_when_history_does_not_match(series):
+    dates, returns = series
+    _model().analyze(dates[10:], returns[10:])
+    assert _model().analyze(dates, returns)['model_update']['refit_reason'] == 'window starts before stored history'
+
+    gappy = np.delete(np.arange(len(dates)), 100)
+    result = _model().analyze(dates[gappy], returns[gappy])
+    assert result['model_update']['refit_reason'] == 'dates do not match stored history'
@@ -0,0 +1,60 @@
+"""
+Unit tests for src/analytics/risk_statistics.py
+
+Covers: tail_statistics (agreement with the sort / np.percentile reference,
+affine invariance, empty tail) and tail_indices.
+
+No live network calls — inputs are synthetic arrays.
+"""
+import numpy as np
+import pytest
+
+from src.analytics.risk_statistics import tail_indices, tail_statistics
+
+
+PERCENTILES = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+
+
+@pytest.fixture
+def outcomes():
+    return np.random.default_rng(0).standard_t(4, size=10001) * 1000 + 100000
+
+
+@pytest.mark.unit
+def test_tail_statistics_match_sort_reference(outcomes):
+    quantile, tail_mean, levels = tail_statistics(outcomes, 0.95, PERCENTILES)
+    ordered = np.sort(outcomes)
+    idx = int(0.05 * len(outcomes))
+    assert quantile == ordered[idx]
+    assert tail_mean == pytest.approx(ordered[:idx].mean(), rel=1e-12)
+    for p in PERCENTILES:
+        assert levels[p] == pytest.approx(np.percentile(outcomes, p), rel=1e-12)
+
+
+@pytest.mark.unit
+def test_tail_statistics_commute_with_affine_map(outcomes):
+    investment = 100000
+    pct = (outcomes / investment - 1) * 100
+    q, es, levels = tail_statistics(outcomes, 0.99, PERCENTILES)
+    q_pct, es_pct, levels_pct = tail_statistics(pct, 0.99, PERCENTILES)
+    assert (q / investment - 1) * 100 == pytest.approx(q_pct, abs=1e-9)
+    assert (es / investment - 1) * 100 == pytest.approx(es_pct, abs=1e-9)
+    for p in PERCENTILES:
+        assert (levels[p] / investment - 1) * 100 == pytest.approx(levels_pct[p], abs=1e-9)
+
+
+@pytest.mark.unit
+def test_tail_statistics_empty_tail_is_nan():
+    quantile, tail_mean, levels = tail_statistics(np.array([3.0, 1.0, 2.0]), 0.95)
+    assert quantile == 1.0
+    assert np.isnan(tail_mean)
+    assert levels == {}
+
+
+@pytest.mark.unit
+def test_tail_indices_places_requested_ranks(outcomes):
+    order = tail_indices(outcomes, (10, 500, 9999))
+    ordered = np.sort(outcomes)
+    for rank in (10, 500, 9999):
+        assert outcomes[order[rank]] == ordered[rank]
+    assert set(outcomes[order[:500]]) == set(ordered[:500])
@@ -0,0 +1,117 @@
+"""
+Unit tests for src/analytics/rolling_statistics.py
+
+Covers: rolling_mean_std, rolling_sharpe_sortino, rolling_beta_correlation and
+rolling_historical_var against naive per-window computations, missing-value
+masking, and FinancialAnalytics.rolling_analysis output shape.
+
+No live network calls — returns are synthetic.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.risk_statistics import tail_statistics
+from src.analytics.rolling_statistics import (
+    rolling_beta_correlation,
+    rolling_historical_var,
+    rolling_mean_std,
+    rolling_sharpe_sortino,
+)
+
+WINDOW = 40
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(9)
+    market = rng.normal(0.0004, 0.01, 300)
+    assets = np.column_stack([
+        1.2 * market + rng.normal(0, 0.008, 300),
+        -0.3 * market + rng.normal(0.001, 0.015, 300),
+    ])
+    return market, assets
+
+
+@pytest.mark.unit
+def test_mean_std_match_pandas(data):
+    _, assets = data
+    mean, std = rolling_mean_std(assets, WINDOW)
+    frame = pd.DataFrame(assets).rolling(WINDOW)
+    np.testing.assert_allclose(mean, frame.mean().values, atol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(std, frame.std().values, atol=1e-12, equal_nan=True)
+    assert np.isnan(mean[: WINDOW - 1]).all()
+
+
+@pytest.mark.unit
+def test_beta_and_correlation_match_per_window_ols(data):
+    market, assets = data
+    beta, corr = rolling_beta_correlation(market, assets, WINDOW)
+    for end in (WINDOW - 1, 150, 299):
+        x = market[end - WINDOW + 1: end + 1]
+        for j in range(2):
+            y = assets[end - WINDOW + 1: end + 1, j]
+            assert beta[end, j] == pytest.approx(np.polyfit(x, y, 1)[0], rel=1e-8)
+            assert corr[end, j] == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-8)
+
+
+@pytest.mark.unit
+def test_sharpe_sortino_match_definitions(data):
+    _, assets = data
+    rf = 0.0001
+    sharpe, sortino = rolling_sharpe_sortino(assets, WINDOW, risk_free_daily=rf)
+    window = assets[-WINDOW:, 0]
+    excess = window.mean() - rf
+    downside = np.sqrt(np.mean(np.minimum(window - rf, 0) ** 2))
+    assert sharpe[-1, 0] == pytest.approx(excess / window.std(ddof=1) * np.sqrt(252))
+    assert sortino[-1, 0] == pytest.approx(excess / downside * np.sqrt(252))
+
+
+@pytest.mark.unit
+def test_historical_var_matches_tail_statistics(data):
+    _, assets = data
+    var = rolling_historical_var(assets, WINDOW, confidence_level=0.95)
+    for end in (WINDOW - 1, 200, 299):
+        window = assets[end - WINDOW + 1: end + 1, 1]
+        assert var[end, 1] == pytest.approx(-tail_statistics(window, 0.95)[0])
+
+
+@pytest.mark.unit
+def test_missing_values_only_blank_their_windows(data):
+    market, assets = data
+    assets = assets.copy()
+    assets[100, 0] = np.nan
+    beta, _ = rolling_beta_correlation(market, assets, WINDOW)
+    assert np.isnan(beta[100: 100 + WINDOW, 0]).all()
+    assert np.isfinite(beta[100 + WINDOW:, 0]).all()
+    assert np.isfinite(beta[WINDOW - 1:, 1]).all()
+
+
+@pytest.mark.unit
+def test_window_validated(data):
+    _, assets = data
+    with pytest.raises(ValueError):
+        rolling_mean_std(assets, 1)
+
+
+@pytest.mark.unit
+def test_rolling_analysis_plotly_series(data, monkeypatch):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    market, assets = data
+    index = pd.bdate_range('2023-01-02', periods=len(market))
+    frame = pd.DataFrame({'SPY': market, 'AAA': assets[:, 0], 'BBB': assets[:, 1]}, index=index)
+    fa = FinancialAnalytics()
+    monkeypatch.setattr(
+        fa, 'get_historical_returns', lambda tickers, *a, **k: frame[[t for t in tickers if t in frame]]
+    )
+    result = fa.rolling_analysis(['AAA', 'BBB'], window=WINDOW)
+
+    series = result['Series']['AAA']
+    assert len(series['Dates']) == len(market) - WINDOW + 1
+    assert series['Dates'][0] == index[WINDOW - 1].strftime('%Y-%m-%d')
+    for name in ('Beta', 'Correlation', 'Volatility (Ann.)', 'Sharpe', 'Sortino', 'Historical VaR'):
+        assert len(series[name]) == len(series['Dates'])
+    assert result['Benchmarks'] == {'AAA': 'SPY', 'BBB': 'SPY'}
+    assert result['Latest']['AAA']['Beta'] == pytest.approx(1.2, abs=0.4)
+    assert result['Latest']['BBB']['Beta'] < 0.3
@@ -0,0 +1,168 @@
+"""
+Unit tests for src/analytics/scenario_engine.py
+
+Covers: factorize_covariance (Cholesky + eigen fallback), ScenarioEngine.simulate
+shared-shock semantics, run() statistics and per-asset contribution VaR, and the
+stress_test_var integration through a pre-fetched returns matrix.
+
+No live network calls — returns are synthetic.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics.scenario_engine import ScenarioEngine, factorize_covariance
+
+
+@pytest.fixture
+def synthetic_returns():
+    rng = np.random.default_rng(7)
+    cov = np.array([
+        [0.00040, 0.00018, 0.00010],
+        [0.00018, 0.00025, 0.00008],
+        [0.00010, 0.00008, 0.00016],
+    ])
+    data = rng.multivariate_normal([0.0005, 0.0003, 0.0002], cov, size=500)
+    return pd.DataFrame(data, columns=['AAA', 'BBB', 'CCC'])
+
+
+# ---------------------------------------------------------------------------
+# factorize_covariance
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_factorize_positive_definite_uses_cholesky():
+    cov = np.array([[1.0, 0.3], [0.3, 2.0]])
+    L, method = factorize_covariance(cov)
+    assert method == 'cholesky'
+    np.testing.assert_allclose(L @ L.T, cov, atol=1e-12)
+
+
+@pytest.mark.unit
+def test_factorize_singular_falls_back_to_eigen():
+    corr = np.ones((3, 3))  # rank 1 — Cholesky fails
+    L, method = factorize_covariance(corr)
+    assert method == 'eigen'
+    np.testing.assert_allclose(L @ L.T, corr, atol=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# ScenarioEngine.simulate
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_simulate_reproduces_historical_covariance(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns, use_drift=False)
+    sims = engine.simulate([{'name': 'Base Case'}], simulations=40000, seed=1)
+    assets = sims['Base Case']['assets'] / engine.weights
+    np.testing.assert_allclose(np.cov(assets, rowvar=False), engine.cov, rtol=0.05, atol=2e-6)
+
+
+@pytest.mark.unit
+def test_vol_multiplier_scales_same_shocks(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns, use_drift=False)
+    sims = engine.simulate(
+        [{'name': 'Base Case'}, {'name': 'Stressed Volatility', 'vol_multiplier': 3.0}],
+        simulations=1000, seed=3,
+    )
+    np.testing.assert_allclose(
+        sims['Stressed Volatility']['portfolio'], 3.0 * sims['Base Case']['portfolio']
+    )
+
+
+@pytest.mark.unit
+def test_haircut_shifts_portfolio_returns(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns)
+    sims = engine.simulate(
+        [{'name': 'Base Case'}, {'name': 'Liquidity Haircut', 'haircut': 0.02}],
+        simulations=1000, seed=3,
+    )
+    np.testing.assert_allclose(
+        sims['Liquidity Haircut']['portfolio'], sims['Base Case']['portfolio'] - 0.02
+    )
+
+
+@pytest.mark.unit
+def test_seeded_chunked_simulation_is_reproducible(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns)
+    a = engine.simulate(simulations=2500, seed=11, chunk_size=2500)
+    b = engine.simulate(simulations=2500, seed=11, chunk_size=2500)
+    c = engine.simulate(simulations=2500, seed=11, chunk_size=700)
+    np.testing.assert_array_equal(a['Base Case']['portfolio'], b['Base Case']['portfolio'])
+    assert c['Base Case']['portfolio'].shape == (2500,)
+
+
+@pytest.mark.unit
+def test_duplicate_scenario_names_rejected(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns)
+    with pytest.raises(ValueError):
+        engine.simulate([{'name': 'X'}, {'name': 'X'}], simulations=10)
+
+
+@pytest.mark.unit
+def test_run_names_unnamed_scenarios_by_position(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns)
+    result = engine.run([{'name': 'Base'}, {'vol_multiplier': 2.0}], simulations=2000, seed=3)
+    assert list(result['Scenarios']) == ['Base', 'Scenario 2']
+    assert result['Scenarios']['Scenario 2']['VaR'] > result['Scenarios']['Base']['VaR']
+
+
+# ---------------------------------------------------------------------------
+# ScenarioEngine.run — statistics and contributions
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_run_default_scenarios_ordering(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns)
+    result = engine.run(simulations=20000, seed=5)
+    scen = result['Scenarios']
+    assert set(scen) == {'Base Case', 'Stressed Volatility', 'Stressed Correlation', 'Liquidity Haircut'}
+    assert scen['Stressed Volatility']['VaR'] > scen['Base Case']['VaR']
+    assert scen['Stressed Correlation']['VaR'] > scen['Base Case']['VaR']
+    assert scen['Liquidity Haircut']['VaR'] == pytest.approx(scen['Base Case']['VaR'] + 2000, abs=1.0)
+    for s in scen.values():
+        assert s['Expected Shortfall'] >= s['VaR']
+
+
+@pytest.mark.unit
+def test_contribution_es_sums_to_portfolio_es(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns)
+    result = engine.run(scenarios=[{'name': 'Base Case'}], simulations=20000, seed=9)
+    base = result['Scenarios']['Base Case']
+    assert sum(base['Contribution ES'].values()) == pytest.approx(base['Expected Shortfall'], rel=1e-3)
+    assert sum(base['Contribution VaR'].values()) == pytest.approx(base['VaR'], rel=0.05)
+
+
+@pytest.mark.unit
+def test_fat_tails_increase_tail_risk(synthetic_returns):
+    engine = ScenarioEngine(synthetic_returns)
+    result = engine.run(
+        scenarios=[{'name': 'Normal'}, {'name': 'Fat', 'fat_tails': True}],
+        simulations=50000, confidence_level=0.99, degrees_of_freedom=3, seed=2,
+    )
+    assert result['Scenarios']['Fat']['Expected Shortfall'] > result['Scenarios']['Normal']['Expected Shortfall']
+
+
+# ---------------------------------------------------------------------------
+# stress_test_var integration
+# ---------------------------------------------------------------------------
+
+@pytest.mark.unit
+def test_stress_test_var_uses_prefetched_returns(synthetic_returns, monkeypatch):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    fa = FinancialAnalytics()
+
+    def _no_fetch(*args, **kwargs):
+        raise AssertionError('stress_test_var must not refetch returns')
+
+    monkeypatch.setattr(fa, 'get_historical_returns', _no_fetch)
+    result = fa.stress_test_var(
+        ['AAA', 'BBB', 'CCC'], simulations=5000, returns=synthetic_returns
+    )
+    assert 'error' not in result
+    assert result['Stress Case']['VaR'] > result['Base Case']['VaR']
+    assert set(result['Base Case']['Contribution VaR']) == {'AAA', 'BBB', 'CCC'}
+    assert set(result['Scenario Breakdown']) == {
+        'Stressed Volatility', 'Stressed Correlation', 'Liquidity Haircut'
+    }
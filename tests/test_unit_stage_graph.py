@@ -0,0 +1,136 @@
+"""
+Unit tests for src/analytics/stage_graph.py
+
+Covers: StageGraph dependency ordering and argument passing, concurrent
+execution of independent stages, error / timeout handling with skipped
+dependents, registration validation, and the stage timings reported by
+FinancialAnalytics.comprehensive_analysis.
+
+No live network calls — stages are small synthetic callables.
+"""
+import time
+
+import pytest
+
+from src.analytics.stage_graph import StageGraph
+
+
+@pytest.mark.unit
+def test_dependencies_receive_results_as_keywords():
+    graph = StageGraph()
+    graph.add('a', lambda: 2)
+    graph.add('b', lambda: 3)
+    graph.add('product', lambda a, b: a * b, depends_on=('a', 'b'))
+    results, timings = graph.run()
+    assert results == {'a': 2, 'b': 3, 'product': 6}
+    assert all(timings[name]['status'] == 'ok' for name in ('a', 'b', 'product'))
+
+
+@pytest.mark.unit
+def test_independent_stages_overlap():
+    graph = StageGraph(max_workers=3)
+    for name in ('x', 'y', 'z'):
+        graph.add(name, lambda: time.sleep(0.3))
+    start = time.perf_counter()
+    _, timings = graph.run()
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.8
+    assert timings['total']['seconds'] < 0.8
+
+
+@pytest.mark.unit
+def test_failure_skips_dependents_only():
+    def boom():
+        raise RuntimeError('no data')
+
+    graph = StageGraph()
+    graph.add('load', boom)
+    graph.add('analyze', lambda load: load, depends_on=('load',))
+    graph.add('report', lambda analyze: analyze, depends_on=('analyze',))
+    graph.add('independent', lambda: 'ok')
+    results, timings = graph.run()
+
+    assert timings['load'] == {'status': 'error', 'seconds': timings['load']['seconds'], 'error': 'no data'}
+    assert timings['analyze']['status'] == 'skipped'
+    assert timings['report']['status'] == 'skipped'
+    assert results == {'independent': 'ok'}
+
+
+@pytest.mark.unit
+def test_budget_overrun_is_reported_without_blocking():
+    graph = StageGraph()
+    graph.add('slow', lambda: time.sleep(2), budget=0.2)
+    graph.add('after_slow', lambda slow: 'never', depends_on=('slow',))
+    graph.add('fast', lambda: 'done', budget=5)
+    start = time.perf_counter()
+    results, timings = graph.run()
+
+    assert time.perf_counter() - start < 1.0
+    assert timings['slow']['status'] == 'timeout'
+    assert timings['after_slow']['status'] == 'skipped'
+    assert results == {'fast': 'done'}
+
+
+@pytest.mark.unit
+def test_registration_is_validated():
+    graph = StageGraph()
+    graph.add('a', lambda: 1)
+    with pytest.raises(ValueError):
+        graph.add('a', lambda: 1)
+    with pytest.raises(ValueError):
+        graph.add('b', lambda c: c, depends_on=('c',))
+
+
+@pytest.mark.unit
+def test_comprehensive_analysis_reports_stage_timings(monkeypatch):
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    fa = FinancialAnalytics()
+    monkeypatch.setattr(fa, 'get_historical_returns', lambda *a, **k: None)
+    monkeypatch.setattr(fa, 'linear_regression_analysis', lambda *a, **k: {'AAA': {}})
+    monkeypatch.setattr(fa, 'correlation_analysis', lambda *a, **k: {'Correlation Matrix': {}})
+    monkeypatch.setattr(fa, 'pca_analysis', lambda *a, **k: {'Summary': {}})
+
+    def failing_mc(*args, **kwargs):
+        raise RuntimeError('simulation failed')
+
+    monkeypatch.setattr(fa, 'monte_carlo_var_es', failing_mc)
+    result = fa.comprehensive_analysis(['AAA', 'BBB'])
+
+    timings = result['Analysis Metadata']['Stage Timings']
+    assert set(timings) == {'returns', 'regression', 'correlation', 'pca', 'monte_carlo', 'total'}
+    assert result['2. Correlation Analysis'] == {'Correlation Matrix': {}}
+    assert result['4. Monte Carlo VaR & ES'] == {'error': 'simulation failed'}
+
+
+@pytest.mark.unit
+def test_comprehensive_analysis_hands_returns_to_stages(monkeypatch):
+    import numpy as np
+    import pandas as pd
+
+    from src.analytics.financial_analytics import FinancialAnalytics
+
+    rng = np.random.default_rng(0)
+    returns = pd.DataFrame(
+        rng.normal(0, 0.01, (252, 3)), columns=['AAA', 'BBB', 'CCC'],
+        index=pd.bdate_range('2024-01-01', periods=252),
+    )
+    calls = []
+
+    def fetch(tickers, days=252, **kwargs):
+        calls.append('returns')
+        return returns.copy()
+
+    def regression(*args, **kwargs):
+        calls.append('regression')
+        return {'AAA': {}}
+
+    fa = FinancialAnalytics()
+    monkeypatch.setattr(fa, 'get_historical_returns', fetch)
+    monkeypatch.setattr(fa, 'linear_regression_analysis', regression)
+    result = fa.comprehensive_analysis(['AAA', 'BBB', 'CCC'], simulations=500)
+
+    # One download, and the regression download is ordered after it
+    assert calls == ['returns', 'regression']
+    for key in ('2. Correlation Analysis', '3. PCA Analysis', '4. Monte Carlo VaR & ES'):
+        assert 'error' not in result[key], result[key]
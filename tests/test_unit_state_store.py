@@ -0,0 +1,45 @@
+"""
+Unit tests for src/utils/state_store.py
+
+Covers: JSON and array round trips, cache-miss behaviour, key sanitizing and
+the ANALYTICS_STATE_DIR override. Everything is written under tmp_path.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from src.utils import state_store
+
+
+@pytest.mark.unit
+def test_json_round_trip(state_dir):
+    assert state_store.save_json('garch', 'params', {'AAPL': {'alpha': 0.1}})
+    assert state_store.load_json('garch', 'params') == {'AAPL': {'alpha': 0.1}}
+    assert os.path.exists(state_dir / 'garch' / 'params.json')
+
+
+@pytest.mark.unit
+def test_arrays_round_trip():
+    cov = np.eye(3) * 0.5
+    assert state_store.save_arrays('ewma', 'cov', cov=cov, tickers=np.array(['A', 'B', 'C']))
+    loaded = state_store.load_arrays('ewma', 'cov')
+    np.testing.assert_array_equal(loaded['cov'], cov)
+    assert list(loaded['tickers']) == ['A', 'B', 'C']
+
+
+@pytest.mark.unit
+def test_missing_or_corrupt_state_is_a_miss(state_dir):
+    assert state_store.load_json('garch', 'nothing') is None
+    path = state_store.state_path('garch', 'broken', '.json')
+    os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as fh:
+        fh.write('{not json')
+    assert state_store.load_json('garch', 'broken') is None
+
+
+@pytest.mark.unit
+def test_keys_are_sanitized(state_dir):
+    path = state_store.state_path('models', '../BRK/B:rf', '.joblib')
+    assert os.path.dirname(path) == str(state_dir / 'models')
+    assert os.path.basename(path) == '.._BRK_B_rf.joblib'
@@ -546,10 +546,14 @@ def scrape_data():
 
         # Compute analytics for the portfolio
         analytics_data = {}
-        # Skip heavy analytics for very large portfolios (>50 tickers) unless explicitly requested
-        skip_analytics = len(analytics_tickers) > 50
+        analytics_timings = {}
+        # Index-sized portfolios (>50 tickers) run in large-universe mode: top-k
+        # randomized PCA and no pairwise correlation matrix
+        from src.analytics.factor_pca import LARGE_UNIVERSE_THRESHOLD
 
-        if len(analytics_tickers) >= 1 and not skip_analytics:
+        large_universe = len(analytics_tickers) > LARGE_UNIVERSE_THRESHOLD
+
+        if len(analytics_tickers) >= 1:
             try:
                 logger.info("Computing advanced financial analytics...")
 
@@ -567,127 +571,164 @@ def scrape_data():
                 analytics = get_financial_analytics(config=analytics_config)
                 tickers_list = analytics_tickers  # Use all input tickers for analytics (yfinance fetches data independently)  # noqa: E501
 
+                # Independent analyses run concurrently on the shared returns
+                # matrix once it is loaded; each stage has its own time budget
+                from src.analytics.stage_graph import STAGE_BUDGETS, StageGraph
+
+                def run_fundamentals():
+                    results = {}
+                    for ticker in tickers_list:
+                        if ticker in all_data and all_data[ticker]:
+                            try:
+                                results[ticker] = analytics.fundamental_analysis(
+                                    all_data[ticker], ticker
+                                )
+                            except Exception as e:
+                                logger.warning(
+                                    f"Fundamental analysis failed for {ticker}: {str(e)}"
+                                )
+                    return results
+
+                graph = StageGraph(max_workers=4)
+                graph.add(
+                    "returns",
+                    lambda: analytics.get_historical_returns(tickers_list, days=252),
+                    budget=STAGE_BUDGETS["returns"],
+                )
+                graph.add(
+                    "fundamental", run_fundamentals, budget=STAGE_BUDGETS["fundamental"]
+                )
+                # Regressions for every ticker, one benchmark download per exchange;
+                # after the returns download so the run's yf.download calls never overlap
+                graph.add(
+                    "regression",
+                    lambda returns: analytics.linear_regression_batch(tickers_list, days=252),
+                    depends_on=("returns",),
+                    budget=STAGE_BUDGETS["regression"],
+                )
+                # Single-name Monte Carlo for every ticker in one vectorized pass
+                graph.add(
+                    "monte_carlo",
+                    lambda returns: analytics.monte_carlo_var_es_batch(
+                        tickers_list, days=252, simulations=5000, returns=returns
+                    ),
+                    depends_on=("returns",),
+                    budget=STAGE_BUDGETS["monte_carlo"],
+                )
                 # Correlation Analysis (requires 2+ tickers)
+                if len(tickers_list) >= 2 and not large_universe:
+                    graph.add(
+                        "correlation",
+                        lambda returns: analytics.correlation_analysis(
+                            tickers_list, days=252, returns=returns
+                        ),
+                        depends_on=("returns",),
+                        budget=STAGE_BUDGETS["correlation"],
+                    )
+                # Portfolio-level Monte Carlo with Stress Test (if 2+ tickers)
                 if len(tickers_list) >= 2:
-                    try:
-                        logger.info(
-                            f"Computing correlation analysis for {len(tickers_list)} tickers..."
-                        )
-                        correlation_result = analytics.correlation_analysis(
-                            tickers_list, days=252
+                    graph.add(
+                        "portfolio_monte_carlo",
+                        lambda returns: analytics.monte_carlo_var_es(
+                            tickers_list, days=252, simulations=5000, returns=returns
+                        ),
+                        depends_on=("returns",),
+                        budget=STAGE_BUDGETS["portfolio_monte_carlo"],
+                    )
+                # PCA Analysis (if 3+ tickers)
+                if len(tickers_list) >= 3:
+                    graph.add(
+                        "pca",
+                        lambda returns: analytics.pca_analysis(
+                            tickers_list,
+                            days=252,
+                            n_components=min(3, len(tickers_list)),
+                            returns=returns,
+                        ),
+                        depends_on=("returns",),
+                        budget=STAGE_BUDGETS["pca"],
+                    )
+
+                logger.info(f"Running {len(graph.stages)} analytics stages concurrently...")
+                stage_results, analytics_timings = graph.run()
+                for stage, timing in analytics_timings.items():
+                    if timing["status"] != "ok":
+                        logger.warning(
+                            f"Analytics stage '{stage}' {timing['status']}: {timing.get('error', '')}"
                         )
-                        if correlation_result and "error" not in correlation_result:
-                            analytics_data["correlation"] = correlation_result
-                            logger.info(
-                                f"✓ Correlation analysis completed successfully"  # noqa: F541
-                            )
-                        else:
-                            logger.warning(
-                                f"Correlation analysis returned error: {correlation_result.get('error', 'Unknown error')}"  # noqa: E501
-                            )
-                    except Exception as e:
-                        logger.warning(f"Correlation analysis failed: {str(e)}")
+
+                correlation_result = stage_results.get("correlation")
+                if correlation_result and "error" not in correlation_result:
+                    analytics_data["correlation"] = correlation_result
+                    logger.info(f"✓ Correlation analysis completed successfully")  # noqa: F541
+                elif correlation_result:
+                    logger.warning(
+                        f"Correlation analysis returned error: {correlation_result.get('error', 'Unknown error')}"  # noqa: E501
+                    )
+
+                fundamentals = stage_results.get("fundamental", {})
+                regression_batch = stage_results.get("regression", {})
+                mc_batch = stage_results.get("monte_carlo", {})
 
                 # Individual ticker analytics
                 for ticker in tickers_list:
                     ticker_analytics = {}
 
                     # Fundamental Analysis - add to stock data for Stock Details tab
-                    try:
-                        if ticker in all_data and all_data[ticker]:
-                            logger.info(
-                                f"Computing fundamental analysis for {ticker}..."
-                            )
-                            fundamental_result = analytics.fundamental_analysis(
-                                all_data[ticker], ticker
-                            )
-                            if fundamental_result and "error" not in fundamental_result:
-                                # Add to all_data for Stock Details tab display
-                                all_data[ticker][
-                                    "_fundamental_analysis"
-                                ] = fundamental_result
-                                logger.info(
-                                    f"✓ Fundamental analysis completed for {ticker}"
-                                )
-                    except Exception as e:
-                        logger.warning(
-                            f"Fundamental analysis failed for {ticker}: {str(e)}"
-                        )
-
-                    try:
-                        _exch = get_exchange_info(ticker)
-                        regression_result = analytics.linear_regression_analysis(
-                            [ticker], benchmark=_exch["benchmark"], days=252
-                        )
-                        if regression_result and "error" not in regression_result:
-                            ticker_analytics["regression"] = regression_result
-                    except Exception as e:
+                    fundamental_result = fundamentals.get(ticker)
+                    if fundamental_result and "error" not in fundamental_result:
+                        all_data[ticker]["_fundamental_analysis"] = fundamental_result
+                        logger.info(f"✓ Fundamental analysis completed for {ticker}")
+
+                    regression_result = regression_batch.get(ticker)
+                    if regression_result and "error" not in regression_result:
+                        ticker_analytics["regression"] = regression_result
+                    elif regression_result:
                         logger.warning(
-                            f"Regression analysis failed for {ticker}: {str(e)}"
+                            f"Regression analysis failed for {ticker}: {regression_result['error']}"
                         )
 
-                    try:
-                        mc_result = analytics.monte_carlo_var_es(
-                            [ticker], days=252, simulations=5000
-                        )
-                        if mc_result and "error" not in mc_result:
-                            ticker_analytics["monte_carlo"] = mc_result
-                    except Exception as e:
+                    mc_result = mc_batch.get(ticker)
+                    if mc_result and "error" not in mc_result:
+                        ticker_analytics["monte_carlo"] = mc_result
+                    elif mc_result:
                         logger.warning(
-                            f"Monte Carlo analysis failed for {ticker}: {str(e)}"
+                            f"Monte Carlo analysis failed for {ticker}: {mc_result['error']}"
                         )
 
                     if ticker_analytics:
                         analytics_data[ticker] = ticker_analytics
 
-                # Portfolio-level Monte Carlo with Stress Test (if 2+ tickers)
-                if len(tickers_list) >= 2:
-                    try:
-                        logger.info(
-                            f"Running portfolio-level Monte Carlo for {len(tickers_list)} tickers..."
-                        )
-                        portfolio_mc_result = analytics.monte_carlo_var_es(
-                            tickers_list, days=252, simulations=5000
-                        )
-                        if portfolio_mc_result and "error" not in portfolio_mc_result:
-                            analytics_data["portfolio_monte_carlo"] = (
-                                portfolio_mc_result
-                            )
-                            logger.info(
-                                f"✓ Portfolio Monte Carlo completed (includes stress test)"  # noqa: F541
-                            )
-                        else:
-                            logger.warning(
-                                f"Portfolio Monte Carlo returned error: {portfolio_mc_result.get('error', 'Unknown')}"
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            f"Portfolio Monte Carlo analysis failed: {str(e)}"
-                        )
+                portfolio_mc_result = stage_results.get("portfolio_monte_carlo")
+                if portfolio_mc_result and "error" not in portfolio_mc_result:
+                    analytics_data["portfolio_monte_carlo"] = portfolio_mc_result
+                    logger.info(
+                        f"✓ Portfolio Monte Carlo completed (includes stress test)"  # noqa: F541
+                    )
+                elif portfolio_mc_result:
+                    logger.warning(
+                        f"Portfolio Monte Carlo returned error: {portfolio_mc_result.get('error', 'Unknown')}"
+                    )
 
-                # PCA Analysis (if 3+ tickers)
-                if len(tickers_list) >= 3:
-                    try:
-                        pca_result = analytics.pca_analysis(
-                            tickers_list,
-                            days=252,
-                            n_components=min(3, len(tickers_list)),
-                        )
-                        if pca_result and "error" not in pca_result:
-                            analytics_data["pca"] = pca_result
-                    except Exception as e:
-                        logger.warning(f"PCA analysis failed: {str(e)}")
+                pca_result = stage_results.get("pca")
+                if pca_result and "error" not in pca_result:
+                    analytics_data["pca"] = pca_result
+
+                if large_universe:
+                    logger.info(
+                        f"Large-universe analytics for {len(analytics_tickers)} tickers: "
+                        f"correlation matrix skipped"
+                    )
+                    analytics_data["info"] = {
+                        "message": f"Large-universe mode for {len(analytics_tickers)} tickers: "
+                        f"regressions, Monte Carlo and top-{min(3, len(tickers_list))} randomized PCA "
+                        f"computed; correlation matrix skipped",
+                        "recommendation": f"For the full correlation matrix, analyze portfolios with "
+                        f"{LARGE_UNIVERSE_THRESHOLD} or fewer tickers",
+                    }
 
             except Exception as e:
                 logger.error(f"Analytics computation error: {str(e)}")
-        elif len(analytics_tickers) >= 1 and skip_analytics:
-            logger.info(
-                f"Skipping advanced analytics for large portfolio ({len(analytics_tickers)} tickers). Enable for smaller portfolios (≤50 tickers)."  # noqa: E501
-            )
-            analytics_data["info"] = {
-                "message": f"Advanced analytics skipped for large portfolio ({len(analytics_tickers)} tickers)",
-                "recommendation": "For detailed analytics, analyze portfolios with 50 or fewer tickers",
-            }
 
         # Log what analytics were computed
         logger.info(f"Analytics computed: {list(analytics_data.keys())}")
@@ -705,6 +746,7 @@ def scrape_data():
                 "data": all_data,
                 "cnn_data": cnn_data,
                 "analytics_data": analytics_data,
+                "analytics_timings": analytics_timings,
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             }
         )
@@ -1461,6 +1503,8 @@ def regime_detection_endpoint():
        {"ticker": "SPY", "start_date": "2020-01-01", "end_date": "2021-12-31"}
     2. Legacy (tickers list + days):
        {"tickers": ["SPY", "AAPL"], "days": 1260}
+    Optional "method": "mle" (default, L-BFGS-B) or "em" (Baum-Welch with
+    restarts in worker processes).
 
     Always returns top-level fields:
       filtered_probs  — list of P(stressed) per trading day
@@ -1472,9 +1516,15 @@ def regime_detection_endpoint():
     """
     try:
         import yfinance as yf
-        from src.analytics.regime_detection import RegimeDetector
+        from src.analytics.regime_online import OnlineRegimeModel
 
         data = request.json or {}
+        fit_method = str(data.get("method", "mle")).lower()
+        if fit_method not in ("mle", "em"):
+            return (
+                jsonify({"success": False, "error": "method must be 'mle' or 'em'"}),
+                400,
+            )
 
         # --- Regime cache lookup ---
         import pandas as pd
@@ -1485,8 +1535,9 @@ def regime_detection_endpoint():
             ticker = str(data.get("ticker", "SPY")).upper()
             start_date = data.get("start_date", "2019-01-01")
             end_date = data.get("end_date", datetime.now().strftime("%Y-%m-%d"))
+            window = start_date
 
-            _cache_key = (ticker, start_date, end_date)
+            _cache_key = (ticker, start_date, end_date, fit_method)
             if _cache_key in _regime_cache:
                 return jsonify(_regime_cache[_cache_key])
 
@@ -1522,6 +1573,7 @@ def regime_detection_endpoint():
             tickers = data.get("tickers", ["SPY"])
             ticker = tickers[0] if tickers else "SPY"
             days = int(data.get("days", 1260))
+            window = f"{days}d"
 
             from datetime import timedelta
 
@@ -1532,6 +1584,7 @@ def regime_detection_endpoint():
                 ticker,
                 start_dt.strftime("%Y-%m-%d"),
                 end_dt.strftime("%Y-%m-%d"),
+                fit_method,
             )
 
             # Use Ticker.history() (instance-isolated) to avoid shared-session contamination
@@ -1560,9 +1613,13 @@ def regime_detection_endpoint():
             ret_dates = price_dates[1:]
             ret_prices = price_values[1:]
 
-        # --- Fit HMM ---
-        detector = RegimeDetector()
-        result = detector.fit(log_ret, n_restarts=3)
+        # --- Fit HMM (persisted per ticker/window; new days are filtered incrementally) ---
+        online_model = OnlineRegimeModel(
+            ticker,
+            window=f"{window}_{fit_method}",
+            method=fit_method,
+        )
+        result = online_model.analyze(ret_dates[: len(log_ret)], log_ret)
         result["ticker_used"] = ticker
 
         # --- Determine stressed state index ---
@@ -1611,8 +1668,10 @@ def regime_detection_endpoint():
             "transition_matrix": result.get("transition_matrix", {}),
             "parameters": result.get("parameters", {}),
             "log_likelihood": result.get("log_likelihood", None),
+            "fit_method": result.get("fit_method", None),
             "n_observations": result.get("n_observations", None),
             "label_confidence": result.get("label_confidence", None),
+            "model_update": result.get("model_update", {}),
             # Legacy nested field for backward compatibility
             "regime": convert_numpy_types(result),
         }
@@ -2178,6 +2237,33 @@ def portfolio_sharpe():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/rolling_analytics", methods=["POST"])
+def rolling_analytics():
+    """
+    Rolling beta, correlation, volatility, Sharpe, Sortino and historical VaR.
+    Body: { "tickers": [...], "window": 63, "days": 2520, "confidence_level": 0.95,
+            "risk_free_rate": 0.0 }
+    Returns: { "Series": { ticker: { "Dates": [...], "Beta": [...], ... } }, "Latest": {...}, ... }
+    """
+    data = request.json or {}
+    tickers = [t.strip().upper() for t in data.get("tickers", []) if t.strip()]
+    if not tickers:
+        return jsonify({"error": "tickers required"}), 400
+
+    try:
+        result = get_financial_analytics().rolling_analysis(
+            tickers,
+            window=int(data.get("window", 63)),
+            days=min(int(data.get("days", 2520)), 2520),
+            confidence_level=float(data.get("confidence_level", 0.95)),
+            risk_free_rate=float(data.get("risk_free_rate", 0.0)),
+        )
+        return jsonify(convert_numpy_types(result))
+    except Exception as e:
+        logger.error(f"Error in rolling_analytics: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 SYSTEM_PROMPTS = {
     "quant": (
         "You are an expert MFE (Master of Financial Engineering) quantitative assistant "
@@ -2552,7 +2638,8 @@ def get_trading_indicators():
         return jsonify({"error": "ticker parameter required"})
     try:
         from src.analytics.trading_indicators import (
-            fetch_ohlcv,
+            get_ohlcv,
+            get_volume_profile_index,
             compute_volume_profile,
             compute_anchored_vwap,
             compute_order_flow,
@@ -2560,12 +2647,13 @@ def get_trading_indicators():
             compute_composite_bias,
         )
 
-        df = fetch_ohlcv(ticker, lookback)
-        df = df.dropna(subset=["Open", "High", "Low", "Close"])
-        df_365 = fetch_ohlcv(ticker, 365)
-        df_365 = df_365.dropna(subset=["Open", "High", "Low", "Close"])
+        # Cached per ticker: switching lookback slices the cache and the
+        # volume profile is a difference of two prefix rows
+        df = get_ohlcv(ticker, lookback)
+        df_365 = get_ohlcv(ticker, 365)
+        vp_profile = get_volume_profile_index(ticker).profile(df)
         results = {
-            "volume_profile": compute_volume_profile(df, ticker, lookback),
+            "volume_profile": compute_volume_profile(df, ticker, lookback, profile=vp_profile),
             "anchored_vwap": compute_anchored_vwap(df_365, ticker, lookback),
             "order_flow": compute_order_flow(df, ticker, lookback),
             "liquidity_sweep": compute_liquidity_sweep(df, lookback),
@@ -2632,17 +2720,89 @@ def get_ml_signals():
         return jsonify({"error": str(e)}), 500
 
 
+ML_BATCH_MAX_TICKERS = 200
+
+
+@app.route("/api/ml_signals/batch", methods=["POST"])
+@limiter.limit("5 per minute")
+def get_ml_signals_batch():
+    """
+    SSE stream of ML signals for a watchlist.
+
+    Expected JSON payload:
+        {"tickers": ["AAPL", "MSFT", ...], "features": ["direction", "regime"],
+         "timeout": 180}
+    Emits: data: {"ticker": T, "signals": {feature: result}, "elapsed": s}\\n\\n
+           (or {"ticker": T, "error": msg}) per ticker as it finishes,
+           data: {"done": true, "count": N}\\n\\n as terminal event.
+    """
+    from flask import Response, stream_with_context
+
+    from src.analytics.ml_signals import (
+        BATCH_FEATURES,
+        BATCH_TASK_TIMEOUT,
+        iter_ml_signals_batch,
+    )
+
+    data = request.get_json(silent=True) or {}
+    tickers = data.get("tickers") or []
+    features = data.get("features") or ["direction", "regime"]
+    if not isinstance(tickers, list) or not tickers or not all(isinstance(t, str) for t in tickers):
+        return jsonify({"error": "tickers list required"}), 400
+    if not isinstance(features, list):
+        return jsonify({"error": "features must be a list"}), 400
+    if len(tickers) > ML_BATCH_MAX_TICKERS:
+        return jsonify({"error": f"At most {ML_BATCH_MAX_TICKERS} tickers per batch"}), 400
+    unknown = [f for f in features if f not in BATCH_FEATURES]
+    if unknown:
+        return jsonify({"error": f"Unknown features {unknown}. Valid: {', '.join(BATCH_FEATURES)}"}), 400
+    try:
+        timeout = float(data.get("timeout", BATCH_TASK_TIMEOUT))
+    except (TypeError, ValueError):
+        return jsonify({"error": "timeout must be a number"}), 400
+
+    # Same gating as the single-ticker route: no LSTM training on cloud hosts
+    skip_lstm = "lstm" in features and is_cloud_environment()
+    if skip_lstm:
+        features = [f for f in features if f != "lstm"]
+
+    def generate():
+        count = 0
+        try:
+            # Nothing left to train (LSTM-only on cloud): no need for a process pool
+            max_workers = None if features else 1
+            for item in iter_ml_signals_batch(tickers, features, max_workers=max_workers, timeout=timeout):
+                if skip_lstm and "signals" in item:
+                    item["signals"]["lstm"] = {"lstm_available": False}
+                count += 1
+                yield f"data: {json.dumps(convert_numpy_types(item))}\n\n"
+            yield f"data: {json.dumps({'done': True, 'count': count})}\n\n"
+        except Exception as e:
+            logger.error(f"Error in get_ml_signals_batch: {e}")
+            yield f"data: {json.dumps({'error': str(e), 'done': True})}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Longest footprint window served from the local intraday archive
+FOOTPRINT_MAX_DAYS = 365
+
+
 @app.route("/api/footprint", methods=["GET"])
 def get_footprint():
     ticker = request.args.get("ticker", "").strip().upper()
-    days = min(int(request.args.get("days", 60)), 60)
+    days = max(1, min(int(request.args.get("days", 60)), FOOTPRINT_MAX_DAYS))
     if not ticker:
         return jsonify({"error": "ticker parameter required"})
     try:
-        from src.analytics.trading_indicators import fetch_intraday, compute_footprint
+        from src.analytics.trading_indicators import get_intraday, compute_footprint
 
-        df_15m = fetch_intraday(ticker, days)
-        result = compute_footprint(df_15m, ticker)
+        df_15m, cells = get_intraday(ticker, days)
+        result = compute_footprint(df_15m, ticker, cells=cells)
         return jsonify({"ticker": ticker, "days": days, **result})
     except Exception as e:
         logger.error(f"Error in get_footprint for {ticker}: {e}")